@@ -0,0 +1,4 @@
+# BharatVaani/benchmarks
+#
+# Offline benchmark scripts. Run them from the project root, e.g.:
+#     python -m benchmarks.bench_fetch
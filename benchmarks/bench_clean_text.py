@@ -0,0 +1,100 @@
+# BharatVaani/benchmarks/bench_clean_text.py
+#
+# Throughput of the batch text normalizer (clean_texts) vs. the previous per-call clean_text,
+# on the title/summary/content fields of the feed fixtures, plus an Indic-script preservation check.
+#
+#     python -m benchmarks.bench_clean_text --repeat 5
+
+import argparse
+import re
+import time
+from urllib.parse import urlparse
+
+from core.feed_parser import parse_feed, UnsupportedFeedError
+from core.utils import clean_text, clean_texts
+from benchmarks.feed_fixtures import load_fixtures
+
+# Mixed-script samples that must come out with every letter, vowel sign and joiner intact
+INDIC_SAMPLES = {
+    "Devanagari": "प्रधानमंत्री ने आज नई दिल्ली में कहा कि क्षेत्र का विकास होगा।",
+    "Devanagari Extended": "ꣲ ꣳ ꣴ ॐ नमः",
+    "Tamil": "தமிழ்நாடு முதலமைச்சர் புதிய திட்டத்தை அறிவித்தார்",
+    "Bengali": "পশ্চিমবঙ্গে ভারী বৃষ্টির সতর্কতা জারি করা হয়েছে",
+    "Malayalam (ZWJ chillu)": "കേരളത്തിൽ മഴ ശക്തം; ന്‍ ല്‍",
+    "Hindi (ZWNJ)": "क्‌ष",
+    "Urdu (presentation forms)": "ﷲ پاکستان اور ہندوستان ﻻ",
+}
+
+
+def legacy_clean_text(text: str) -> str:
+    """The implementation clean_text replaced: recompiles the emoji pattern on every call."""
+    if not isinstance(text, str):
+        return ""
+    text = re.sub(r'<.*?>', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    emoji_pattern = re.compile(
+        "["
+        "\U0001F600-\U0001F64F"
+        "\U0001F300-\U0001F5FF"
+        "\U0001F680-\U0001F6FF"
+        "\U0001F1E0-\U0001F1FF"
+        "\U00002702-\U000027B0"
+        "\U000024C2-\U0001F251"
+        "]+", flags=re.UNICODE
+    )
+    return emoji_pattern.sub(r'', text)
+
+
+def _fixture_texts() -> list:
+    texts = []
+    for feeds in load_fixtures().values():
+        for url, body in feeds:
+            try:
+                records = parse_feed(body, f"{urlparse(url).scheme}://{urlparse(url).netloc}")
+            except UnsupportedFeedError:
+                continue
+            for record in records:
+                texts.extend((record['title'], record['summary'], record['content']))
+    return texts
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch vs per-call text normalization benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=150, help="Texts per clean_texts call (3 per article)")
+    args = parser.parse_args()
+
+    texts = _fixture_texts() + [f"🔥 Breaking: {s} 🇮🇳👍🏽" for s in INDIC_SAMPLES.values()] * 20
+    total_chars = sum(len(t) for t in texts)
+    batches = [texts[i:i + args.batch_size] for i in range(0, len(texts), args.batch_size)]
+
+    legacy = _time(lambda: [legacy_clean_text(t) for t in texts], args.repeat)
+    per_call = _time(lambda: [clean_text(t) for t in texts], args.repeat)
+    batched = _time(lambda: [clean_texts(b) for b in batches], args.repeat)
+
+    print(f"texts={len(texts)} chars={total_chars} batch_size={args.batch_size}")
+    for name, seconds in (("legacy clean_text", legacy), ("clean_text (per call)", per_call),
+                          (f"clean_texts (batched)", batched)):
+        print(f"{name:<24}: {seconds * 1000:8.1f} ms  {len(texts) / seconds:>10.0f} texts/s  "
+              f"{total_chars / seconds / 1e6:6.1f} Mchars/s  ({legacy / seconds:.1f}x)")
+
+    assert [clean_text(t) for t in texts] == [out for b in batches for out in clean_texts(b)], \
+        "Batched and per-call results differ"
+
+    print("\nIndic preservation (legacy / new):")
+    for script, sample in INDIC_SAMPLES.items():
+        print(f"  {script:<26} {'ok' if legacy_clean_text(sample) == sample else 'DAMAGED':<8} "
+              f"{'ok' if clean_text(sample) == sample else 'DAMAGED'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# BharatVaani/benchmarks/bench_dedup.py
+#
+# Tuning data for near-duplicate suppression: SimHash distances of labelled (title, summary) pairs, and for
+# each threshold how many duplicates are caught and how many different stories would be merged, when
+# fingerprinting the summary (what the fetcher does) vs. title + summary. Also reports the closest pairs of
+# articles in the feed fixtures: the recorded set holds one wire duplicate (the Japan visit in both India
+# feeds), and the next pairs are different stories that any threshold must stay below.
+#
+#     python -m benchmarks.bench_dedup
+
+import argparse
+import itertools
+
+from config.settings import DEDUP_MAX_HAMMING
+from core.dedup import hamming_distance, simhash
+from core.feed_parser import parse_feed, UnsupportedFeedError
+from core.utils import clean_text
+from benchmarks.feed_fixtures import load_fixtures
+
+# Wire stories as two outlets publish them (rewritten headline, dateline, extra or truncated sentence)
+DUPLICATES = [
+ (("PTI: Modi to visit Japan next week for annual summit",
+   "Prime Minister Narendra Modi will travel to Tokyo next week for the annual India-Japan summit, where the two sides are expected to sign agreements on semiconductors and high-speed rail."),
+  ("Modi to visit Japan next week for annual summit, says MEA",
+   "Prime Minister Narendra Modi will travel to Tokyo next week for the annual India-Japan summit, where the two sides are expected to sign agreements on semiconductors and high-speed rail, the External Affairs Ministry said.")),
+ (("Monsoon reaches Kerala three days ahead of schedule, IMD says",
+   "The southwest monsoon set in over Kerala on Monday, three days before its normal onset date of June 4, the India Meteorological Department said. Heavy rain is likely over coastal Karnataka and Goa through the week."),
+  ("Monsoon arrives in Kerala 3 days early: IMD",
+   "THIRUVANANTHAPURAM: The southwest monsoon set in over Kerala on Monday, three days before its normal onset date of June 4, the India Meteorological Department said.")),
+ (("Sensex tanks 700 points as foreign investors pull out funds",
+   "The BSE Sensex fell 712 points to close at 81,176 on Tuesday as foreign portfolio investors sold shares worth Rs 3,200 crore, while the Nifty slipped 0.9% to 24,680."),
+  ("Sensex tanks over 700 pts on FPI selling; Nifty ends at 24,680",
+   "MUMBAI: The BSE Sensex fell 712 points to close at 81,176 on Tuesday as foreign portfolio investors sold shares worth Rs 3,200 crore, while the Nifty slipped 0.9 per cent to 24,680.")),
+ (("ISRO successfully launches EOS-09 earth observation satellite",
+   "The Indian Space Research Organisation launched the EOS-09 radar imaging satellite aboard the PSLV-C61 rocket from Sriharikota on Sunday morning, placing it in a sun-synchronous polar orbit."),
+  ("ISRO launches EOS-09 satellite aboard PSLV-C61 | LIVE updates",
+   "The Indian Space Research Organisation launched the EOS-09 radar imaging satellite aboard the PSLV-C61 rocket from Sriharikota on Sunday morning, placing it in a sun-synchronous polar orbit. Follow live updates.")),
+ (("Supreme Court seeks Centre's reply on plea over NEET-PG exam date",
+   "A vacation bench of the Supreme Court issued notice on a petition by candidates who said holding the NEET-PG exam in two shifts would be unfair, and listed the matter for hearing on Friday."),
+  ("NEET-PG 2025: SC issues notice to Centre, NBEMS on plea against two-shift exam",
+   "A vacation bench of the Supreme Court issued notice on a petition by candidates who said holding the NEET-PG exam in two shifts would be unfair...")),
+ (("Heatwave grips north India; Delhi records 45.2 degrees Celsius",
+   "Delhi sweltered at 45.2 degrees Celsius on Wednesday, the highest this season, as the IMD issued a red alert for Delhi, Haryana, Punjab and west Uttar Pradesh for the next three days."),
+  ("Delhi sizzles at 45.2°C, IMD issues red alert for north India",
+   "NEW DELHI: Delhi sweltered at 45.2 degrees Celsius on Wednesday, the highest this season, as the IMD issued a red alert for Delhi, Haryana, Punjab and west Uttar Pradesh for the next three days, officials said.")),
+ (("RBI keeps repo rate unchanged at 6.5%, maintains neutral stance",
+   "The Reserve Bank of India's monetary policy committee voted 5-1 to keep the repo rate unchanged at 6.5 per cent and retained its neutral stance, Governor Sanjay Malhotra said on Friday."),
+  ("RBI policy: Repo rate unchanged at 6.5%; MPC retains neutral stance",
+   "The Reserve Bank of India's monetary policy committee voted 5-1 to keep the repo rate unchanged at 6.5 per cent and retained its neutral stance, Governor Sanjay Malhotra announced on Friday.")),
+ (("South Korea votes in snap presidential election",
+   "Polls opened at 06:00 local time on Tuesday, with turnout expected to be high after months of political turmoil that followed the impeachment of the former president."),
+  ("South Korea holds snap presidential election after months of turmoil",
+   "SEOUL (Reuters) - Polls opened at 06:00 local time on Tuesday, with turnout expected to be high after months of political turmoil that followed the impeachment of the former president.")),
+ (("Apple unveils redesigned iOS 26 at WWDC keynote",
+   "Apple on Monday introduced iOS 26 with a translucent Liquid Glass design across its operating systems, along with new Apple Intelligence features for developers."),
+  ("WWDC 2025: Apple unveils iOS 26 with Liquid Glass redesign",
+   "Apple on Monday introduced iOS 26 with a translucent Liquid Glass design across its operating systems, along with new Apple Intelligence features for developers. Here is everything announced.")),
+ (("Gold prices climb to two-week high on trade uncertainty",
+   "Spot gold rose as much as 1.8 per cent to $3,381 an ounce on Monday as investors sought safe havens amid renewed trade tensions between the United States and China."),
+  ("Gold hits two-week high as trade tensions flare",
+   "Spot gold rose as much as 1.8% to $3,381 an ounce on Monday as investors sought safe havens amid renewed trade tensions between the United States and China.")),
+ (("Air India flight to London returns to Delhi after technical snag",
+   "An Air India Boeing 787 flight bound for London returned to Delhi airport about two hours after take-off on Thursday due to a technical issue, the airline said, adding that all passengers were safe."),
+  ("Technical snag forces London-bound Air India flight to return to Delhi",
+   "An Air India Boeing 787 flight bound for London returned to Delhi airport about two hours after take-off on Thursday due to a technical issue. All passengers are safe, an airline spokesperson said.")),
+ (("India beat Australia by 6 wickets to reach Champions Trophy final",
+   "Virat Kohli scored 84 as India chased down 265 with 11 balls to spare in Dubai on Tuesday to set up a final against either New Zealand or South Africa."),
+  ("Champions Trophy semi-final: Kohli's 84 takes India past Australia into final",
+   "Virat Kohli scored 84 as India chased down 265 with 11 balls to spare in Dubai on Tuesday to set up a final against either New Zealand or South Africa. Scorecard and highlights.")),
+]
+# Different stories that share a topic, a headline template or most of their wording: must not be merged
+UNRELATED = [
+ (("Sensex tanks 700 points as foreign investors pull out funds",
+   "The BSE Sensex fell 712 points to close at 81,176 on Tuesday as foreign portfolio investors sold shares worth Rs 3,200 crore, while the Nifty slipped 0.9% to 24,680."),
+  ("Sensex jumps 500 points as foreign investors return",
+   "The BSE Sensex rose 512 points to close at 82,390 on Wednesday as foreign portfolio investors bought shares worth Rs 1,800 crore, while the Nifty gained 0.7% to 25,060.")),
+ (("RBI keeps repo rate unchanged at 6.5%, maintains neutral stance",
+   "The Reserve Bank of India's monetary policy committee voted 5-1 to keep the repo rate unchanged at 6.5 per cent and retained its neutral stance, Governor Sanjay Malhotra said on Friday."),
+  ("RBI cuts repo rate by 25 basis points to 6.25%, first cut in five years",
+   "The Reserve Bank of India's monetary policy committee voted unanimously to cut the repo rate by 25 basis points to 6.25 per cent, Governor Sanjay Malhotra said on Friday.")),
+ (("Heatwave grips north India; Delhi records 45.2 degrees Celsius",
+   "Delhi sweltered at 45.2 degrees Celsius on Wednesday, the highest this season, as the IMD issued a red alert for Delhi, Haryana, Punjab and west Uttar Pradesh for the next three days."),
+  ("Heatwave grips Rajasthan; Sri Ganganagar records 48.1 degrees Celsius",
+   "Sri Ganganagar sweltered at 48.1 degrees Celsius on Thursday, the highest in the country, as the IMD issued an orange alert for Rajasthan and Gujarat for the next two days.")),
+ (("Monsoon reaches Kerala three days ahead of schedule, IMD says",
+   "The southwest monsoon set in over Kerala on Monday, three days before its normal onset date of June 4, the India Meteorological Department said. Heavy rain is likely over coastal Karnataka and Goa through the week."),
+  ("Monsoon reaches Mumbai two weeks ahead of schedule, IMD says",
+   "The southwest monsoon arrived in Mumbai on Monday, sixteen days before its normal date of June 11, the India Meteorological Department said. Heavy rain is likely over Konkan and Goa through the week.")),
+ (("Modi to visit Japan next week for annual summit",
+   "Prime Minister Narendra Modi will travel to Tokyo next week for the annual India-Japan summit, where the two sides are expected to sign agreements on semiconductors and high-speed rail."),
+  ("Modi to visit France next month for AI summit",
+   "Prime Minister Narendra Modi will travel to Paris next month for the AI Action Summit, where the two sides are expected to sign agreements on civil nuclear energy and defence.")),
+ (("India beat Australia by 6 wickets to reach Champions Trophy final",
+   "Virat Kohli scored 84 as India chased down 265 with 11 balls to spare in Dubai on Tuesday to set up a final against either New Zealand or South Africa."),
+  ("New Zealand beat South Africa by 50 runs to reach Champions Trophy final",
+   "Rachin Ravindra scored 108 as New Zealand posted 362 in Lahore on Wednesday and set up a final against India in Dubai on Sunday.")),
+ (("Gold prices climb to two-week high on trade uncertainty",
+   "Spot gold rose as much as 1.8 per cent to $3,381 an ounce on Monday as investors sought safe havens amid renewed trade tensions between the United States and China."),
+  ("Gold prices slip from record high as dollar firms",
+   "Spot gold fell 0.9 per cent to $3,310 an ounce on Thursday as the dollar strengthened after the United States and China agreed to pause tariffs for 90 days.")),
+ (("Air India flight to London returns to Delhi after technical snag",
+   "An Air India Boeing 787 flight bound for London returned to Delhi airport about two hours after take-off on Thursday due to a technical issue, the airline said, adding that all passengers were safe."),
+  ("IndiGo flight to Srinagar makes emergency landing after hailstorm",
+   "An IndiGo Airbus A321 flight bound for Srinagar made an emergency landing after its nose cone was damaged in a hailstorm on Wednesday, the airline said, adding that all passengers were safe.")),
+ (("Supreme Court seeks Centre's reply on plea over NEET-PG exam date",
+   "A vacation bench of the Supreme Court issued notice on a petition by candidates who said holding the NEET-PG exam in two shifts would be unfair, and listed the matter for hearing on Friday."),
+  ("Supreme Court seeks Centre's reply on plea over Waqf Act",
+   "A bench of the Supreme Court issued notice on a batch of petitions challenging the amended Waqf Act, and listed the matter for hearing after the summer vacation.")),
+ (("ISRO successfully launches EOS-09 earth observation satellite",
+   "The Indian Space Research Organisation launched the EOS-09 radar imaging satellite aboard the PSLV-C61 rocket from Sriharikota on Sunday morning, placing it in a sun-synchronous polar orbit."),
+  ("ISRO's PSLV-C61 mission fails to place EOS-09 satellite in orbit",
+   "The Indian Space Research Organisation's PSLV-C61 mission carrying the EOS-09 satellite failed on Sunday after a problem in the rocket's third stage, ISRO chairman V Narayanan said.")),
+]
+
+
+FINGERPRINTS = {
+    "summary": lambda title, summary: simhash(summary),
+    "title + summary": lambda title, summary: simhash(f"{title} {summary}"),
+}
+
+
+def _distance(fingerprint, a: tuple, b: tuple):
+    fa, fb = fingerprint(*a), fingerprint(*b)
+    return None if fa is None or fb is None else hamming_distance(fa, fb)
+
+
+def _closest_fixture_pairs(fingerprint, synthetic: bool, count: int = 3) -> list:
+    """The smallest distances between articles (distinct links) in the feed fixtures."""
+    stories = {}
+    for feeds in load_fixtures(synthetic=synthetic).values():
+        for _, body in feeds:
+            try:
+                entries = parse_feed(body)
+            except UnsupportedFeedError:
+                continue
+            for entry in entries:
+                stories.setdefault(entry['link'], (clean_text(entry['title']),
+                                                   clean_text(entry['summary'] or entry['content'])))
+    prints = [p for p in (fingerprint(*story) for story in stories.values()) if p is not None]
+    return sorted(hamming_distance(a, b) for a, b in itertools.combinations(prints, 2))[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SimHash distances of labelled near-duplicate pairs")
+    parser.add_argument("--synthetic", action="store_true", help="Use synthetic feeds instead of the recorded fixtures")
+    args = parser.parse_args()
+
+    for name, fingerprint in FINGERPRINTS.items():
+        duplicates = [_distance(fingerprint, a, b) for a, b in DUPLICATES]
+        unrelated = [_distance(fingerprint, a, b) for a, b in UNRELATED]
+        print(f"{name}: duplicates {sorted(duplicates)}, different stories {sorted(unrelated)}, "
+              f"closest fixture pairs {_closest_fixture_pairs(fingerprint, args.synthetic)}")
+        for threshold in range(2, 21, 2):
+            caught = sum(d is not None and d <= threshold for d in duplicates)
+            merged = sum(d is not None and d <= threshold for d in unrelated)
+            marker = "  <- DEDUP_MAX_HAMMING" if threshold == DEDUP_MAX_HAMMING else ""
+            print(f"  <= {threshold:2d} bits: {caught:2d}/{len(duplicates)} duplicates caught, "
+                  f"{merged}/{len(unrelated)} different stories merged{marker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# BharatVaani/benchmarks/bench_fetch.py
+#
+# Wall-clock comparison of sequential vs concurrent fetch_top_headlines against local stub feeds.
+#
+#     python -m benchmarks.bench_fetch --delays 200,400,800,150,3000 --deadline 2
+
+import argparse
+import time
+
+from core import fetcher
+from benchmarks.stub_feeds import StubFeedServer
+
+BENCH_SCOPE = "Benchmark (stub feeds)"
+
+
+def run_once(concurrent: bool, page_size: int) -> tuple:
+    start = time.perf_counter()
+    articles = fetcher.fetch_top_headlines(page_size=page_size, selected_scope=BENCH_SCOPE, concurrent=concurrent)
+    return time.perf_counter() - start, len(articles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent feed fetching benchmark")
+    parser.add_argument("--delays", default="200,400,800,150,600,300,250,900,3000",
+                        help="Comma separated per-feed response delays in milliseconds")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--deadline", type=float, default=None, help="Override FEED_FETCH_DEADLINE (seconds)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    delays = [int(d) for d in args.delays.split(",") if d.strip()]
+    if args.deadline is not None:
+        fetcher.FEED_FETCH_DEADLINE = args.deadline
+
+    with StubFeedServer() as server:
+        fetcher.RSS_FEEDS[BENCH_SCOPE] = server.feed_urls(delays)
+        try:
+            for mode, concurrent in (("sequential", False), ("concurrent", True)):
+                timings = []
+                for _ in range(args.repeat):
+                    elapsed, count = run_once(concurrent, args.page_size)
+                    timings.append(elapsed)
+                print(f"{mode:<11} feeds={len(delays)} best={min(timings):.3f}s "
+                      f"mean={sum(timings) / len(timings):.3f}s articles={count}")
+        finally:
+            fetcher.RSS_FEEDS.pop(BENCH_SCOPE, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# BharatVaani/benchmarks/bench_ingest.py
+#
+# End-to-end ingest benchmark on recorded feed fixtures, fully offline.
+# Every scope in RSS_FEEDS is fetched through a replaying session adapter and enriched the way the
+# ingestion service does it; time is broken down per stage and written to benchmarks/results/ as JSON.
+#
+#     python -m benchmarks.bench_ingest --repeat 3 --latency-ms 0
+#     python -m benchmarks.bench_ingest --compare benchmarks/results/<earlier run>.json
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import requests
+from requests.adapters import BaseAdapter
+
+from config.settings import CATEGORY_KEYWORDS, INGEST_PAGE_SIZE, RSS_FEEDS
+from core import feed_parser, fetcher, utils
+from core.utils import analyze_sentiment_batch
+from benchmarks.feed_fixtures import load_fixtures, pin_clock_to_recording
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+STAGES = ("network", "parse", "clean", "dedupe", "sentiment", "categorize")
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers every request from recorded payloads (404 for unknown URLs), optionally after a fixed delay."""
+
+    def __init__(self, payloads: dict, latency: float = 0.0):
+        super().__init__()
+        self.payloads = payloads
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        response = requests.Response()
+        body = self.payloads.get(request.url)
+        response.status_code = 200 if body is not None else 404
+        response._content = body if body is not None else b""
+        response.headers["Content-Type"] = "application/rss+xml; charset=utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "OK" if body is not None else "Not Found"
+        return response
+
+    def close(self):
+        pass
+
+
+class StageTimer:
+    """Accumulates time spent in wrapped callables per stage (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = defaultdict(float)
+
+    def wrap(self, stage: str, fn):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.seconds[stage] += elapsed
+        return timed
+
+    def reset(self):
+        with self._lock:
+            self.seconds.clear()
+
+
+def _instrument(timer: StageTimer, session: requests.Session):
+    """Routes the fetcher through the replay session and wraps each pipeline stage with the timer."""
+    session.get = timer.wrap("network", session.get)
+    fetcher.create_session = lambda: session
+    fetcher._parse_feed_entries = timer.wrap("parse", fetcher._parse_feed_entries)
+    fetcher.clean_texts = timer.wrap("clean", fetcher.clean_texts)
+    fetcher.get_hash_key = timer.wrap("dedupe", fetcher.get_hash_key)
+    fetcher.simhash = timer.wrap("dedupe", fetcher.simhash)
+
+    class TimedNearDuplicateIndex(fetcher.NearDuplicateIndex):
+        find = timer.wrap("dedupe", fetcher.NearDuplicateIndex.find)
+        add = timer.wrap("dedupe", fetcher.NearDuplicateIndex.add)
+    fetcher.NearDuplicateIndex = TimedNearDuplicateIndex
+
+    # Measure the pipeline itself: no revalidation cache, no circuit-breaker state carried between runs
+    fetcher.FEED_CACHE_ENABLED = False
+    fetcher.FEED_CIRCUIT_BREAKER_ENABLED = False
+
+
+def run_scope(scope: str, timer: StageTimer, page_size: int, concurrent: bool) -> dict:
+    timer.reset()
+    start = time.perf_counter()
+    articles = fetcher.fetch_top_headlines(page_size=page_size, selected_scope=scope, concurrent=concurrent,
+                                           analyze=False)
+    # Enrichment as done by the ingestion service
+    sentiments = timer.wrap("sentiment", analyze_sentiment_batch)([a.get('full_text_for_ai', '') for a in articles])
+    for article, sentiment in zip(articles, sentiments):
+        article['sentiment_data'] = sentiment
+    timer.wrap("categorize", fetcher.assign_categories_to_articles)(articles, CATEGORY_KEYWORDS)
+    wall = time.perf_counter() - start
+
+    stages = {stage: timer.seconds.get(stage, 0.0) for stage in STAGES}
+    return {
+        'articles': len(articles),
+        'wall_seconds': wall,
+        'stages': stages,
+        'other_seconds': max(0.0, wall - sum(stages.values())) if not concurrent else None,
+        'articles_per_second': len(articles) / wall if wall else 0.0,
+    }
+
+
+def _average(runs: list) -> dict:
+    n = len(runs)
+    return {
+        'articles': runs[-1]['articles'],
+        'wall_seconds': sum(r['wall_seconds'] for r in runs) / n,
+        'stages': {stage: sum(r['stages'][stage] for r in runs) / n for stage in STAGES},
+        'other_seconds': None if runs[0]['other_seconds'] is None else sum(r['other_seconds'] for r in runs) / n,
+        'articles_per_second': sum(r['articles_per_second'] for r in runs) / n,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _print_report(result: dict, baseline: dict = None):
+    header = f"{'scope':<14}{'articles':>9}{'wall ms':>10}" + "".join(f"{s:>12}" for s in STAGES) + f"{'art/s':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result['scopes'].items()) + [("TOTAL", result['total'])]
+    for scope, row in rows:
+        line = (f"{scope[:13]:<14}{row['articles']:>9}{row['wall_seconds'] * 1000:>10.1f}"
+                + "".join(f"{row['stages'][s] * 1000:>12.1f}" for s in STAGES)
+                + f"{row['articles_per_second']:>9.0f}")
+        print(line)
+    if baseline:
+        old, new = baseline['total'], result['total']
+        print(f"\nvs {baseline.get('git_revision', '?')} ({baseline.get('timestamp', '?')}):")
+        for stage in STAGES + ("wall",):
+            before = old['wall_seconds'] if stage == "wall" else old['stages'][stage]
+            after = new['wall_seconds'] if stage == "wall" else new['stages'][stage]
+            change = f"{(after - before) / before:+.1%}" if before else "n/a"
+            print(f"  {stage:<11}{before * 1000:>10.1f} ms -> {after * 1000:>10.1f} ms  ({change})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline ingest pipeline benchmark on recorded feed fixtures")
+    parser.add_argument("--page-size", type=int, default=INGEST_PAGE_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated per-request network latency")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="Fetch feeds concurrently (stage times then overlap and no longer add up to wall time)")
+    parser.add_argument("--use-caches", action="store_true",
+                        help="Keep the memoization caches (sentiment, ...) on; by default every stage is computed")
+    parser.add_argument("--output", default=None, help="Result JSON path (default: benchmarks/results/ingest-<ts>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier result JSON to compare against")
+    parser.add_argument("--synthetic", action="store_true", help="Use synthetic feeds instead of the recorded fixtures")
+    args = parser.parse_args()
+
+    if not args.use_caches:
+        utils.sentiment_cache = None
+
+    fixtures = load_fixtures(synthetic=args.synthetic)
+    recorded_at = None if args.synthetic else pin_clock_to_recording(fetcher, feed_parser)
+
+    session = requests.Session()
+    session.mount("http://", ReplayAdapter({url: body for feeds in fixtures.values() for url, body in feeds},
+                                           latency=args.latency_ms / 1000))
+    session.mount("https://", session.get_adapter("http://"))
+    timer = StageTimer()
+    _instrument(timer, session)
+
+    scopes = {}
+    for scope in RSS_FEEDS:
+        run_scope(scope, timer, args.page_size, args.concurrent)  # Warm-up: imports, lazy models, regex caches
+        scopes[scope] = _average([run_scope(scope, timer, args.page_size, args.concurrent)
+                                  for _ in range(args.repeat)])
+
+    total_wall = sum(s['wall_seconds'] for s in scopes.values())
+    total_articles = sum(s['articles'] for s in scopes.values())
+    result = {
+        'benchmark': 'ingest',
+        'timestamp': datetime.now().isoformat(timespec="seconds"),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'fixtures': f"recorded {recorded_at.isoformat(timespec='seconds')}" if recorded_at else "synthetic",
+        'params': {'page_size': args.page_size, 'repeat': args.repeat, 'latency_ms': args.latency_ms,
+                   'concurrent': args.concurrent, 'use_caches': args.use_caches},
+        'scopes': scopes,
+        'total': {
+            'articles': total_articles,
+            'wall_seconds': total_wall,
+            'stages': {stage: sum(s['stages'][stage] for s in scopes.values()) for stage in STAGES},
+            'articles_per_second': total_articles / total_wall if total_wall else 0.0,
+        },
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_report(result, baseline)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"ingest-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# BharatVaani/benchmarks/bench_parse.py
+#
+# feedparser vs. the streaming feed parser on recorded feed fixtures. Every entry must come out identical
+# (fails with the first differing field otherwise). --synthetic runs on the larger synthetic feed set, which
+# also covers RSS 1.0 and a malformed feed.
+#
+#     python -m benchmarks.bench_parse --limit 20 --repeat 5
+
+import argparse
+import time
+from urllib.parse import urlparse
+
+import feedparser
+
+from core import feed_parser, fetcher
+from core.feed_parser import parse_feed, UnsupportedFeedError
+from core.utils import clean_text
+from benchmarks.feed_fixtures import load_fixtures, pin_clock_to_recording
+
+# Fields that end up in the article dicts built by fetcher._collect_articles
+COMPARED_FIELDS = ("id", "title", "summary", "content", "link", "published_parsed", "source_title", "image_url")
+
+
+def _comparable(record: dict) -> tuple:
+    return tuple(clean_text(v) if isinstance(v, str) else v for v in (record.get(f) for f in COMPARED_FIELDS))
+
+
+def parse_with_feedparser(body: bytes, base_url: str) -> list:
+    return [fetcher._normalize_entry(entry, base_url) for entry in feedparser.parse(body).entries]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="feedparser vs streaming parser benchmark")
+    parser.add_argument("--limit", type=int, default=20, help="Usable entries needed per feed (page_size)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--synthetic", action="store_true", help="Use synthetic feeds instead of the recorded fixtures")
+    args = parser.parse_args()
+
+    if not args.synthetic:
+        pin_clock_to_recording(feed_parser)  # Early termination counts fresh entries relative to the recording
+    payloads = [(url, body) for feeds in load_fixtures(synthetic=args.synthetic).values() for url, body in feeds]
+    total_bytes = sum(len(body) for _, body in payloads)
+
+    slow_time = fast_time = fast_full_time = 0.0
+    compared = matched = fallbacks = 0
+    for url, body in payloads:
+        base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            reference = parse_with_feedparser(body, base_url)
+        feed_slow_time = (time.perf_counter() - start) / args.repeat
+        slow_time += feed_slow_time
+
+        try:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                limited = parse_feed(body, base_url, limit=args.limit)
+            fast_time += (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                full = parse_feed(body, base_url)
+            fast_full_time += (time.perf_counter() - start) / args.repeat
+        except UnsupportedFeedError:
+            fallbacks += 1  # Production falls back to feedparser here, so charge its cost
+            fast_time += feed_slow_time
+            fast_full_time += feed_slow_time
+            continue
+
+        for ours, theirs in zip(full, reference):
+            compared += 1
+            matched += _comparable(ours) == _comparable(theirs)
+            mismatched = [field for field, a, b in zip(COMPARED_FIELDS, _comparable(ours), _comparable(theirs))
+                          if a != b]
+            assert not mismatched, f"Streaming parser disagrees with feedparser on {mismatched} for {url}"
+        assert limited == full[:len(limited)], f"Early-terminated parse diverged from full parse for {url}"
+
+    print(f"feeds={len(payloads)} bytes={total_bytes} limit={args.limit} fallbacks={fallbacks}")
+    print(f"feedparser (full)        : {slow_time * 1000:8.1f} ms")
+    print(f"streaming parser (full)  : {fast_full_time * 1000:8.1f} ms  ({slow_time / max(fast_full_time, 1e-9):.1f}x)")
+    print(f"streaming parser (limit) : {fast_time * 1000:8.1f} ms  ({slow_time / max(fast_time, 1e-9):.1f}x)")
+    if compared:
+        print(f"entry agreement with feedparser: {matched}/{compared} ({matched / compared:.1%})")
+
+
+if __name__ == "__main__":
+    main()
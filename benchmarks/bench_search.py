@@ -0,0 +1,60 @@
+# BharatVaani/benchmarks/bench_search.py
+#
+# Query latency of the BM25 search index vs. the old linear substring scan over title/summary,
+# on an archive of synthetic articles built from the feed fixtures (distinct ids, same texts repeated).
+#
+#     python -m benchmarks.bench_search --articles 30000
+
+import argparse
+import statistics
+import time
+
+from core.search import SearchIndex
+from benchmarks.bench_sentiment import _corpus
+
+QUERIES = ["government", "rain flood", "markets rally", "court", "gov", "elect", "investors cheer strong",
+           "monsoon forecast", "vaccine", "नई दिल्ली"]
+
+
+def linear_search(articles: list, query: str) -> list:
+    """The dashboard filter the index replaced."""
+    query = query.lower()
+    return [article for article in articles
+            if query in article['title'].lower() or query in article['summary'].lower()]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inverted-index search vs linear scan benchmark")
+    parser.add_argument("--articles", type=int, default=30000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    articles = [{'id': str(i), 'title': text.split(". ", 1)[0], 'summary': text, 'category': 'General'}
+                for i, text in enumerate(_corpus(args.articles))]
+    index = SearchIndex(max_docs=len(articles))
+    start = time.perf_counter()
+    for i in range(0, len(articles), 50):  # Same batch size as an ingestion refresh
+        index.add_many(articles[i:i + 50])
+    build_seconds = time.perf_counter() - start
+
+    print(f"articles={len(articles)} index build {build_seconds:.2f}s  {index.stats()}")
+    print(f"{'query':<26}{'linear ms':>10}{'index ms':>10}{'hits':>8}")
+    for query in QUERIES:
+        linear_ms = _median_ms(lambda: linear_search(articles, query), args.repeat)
+        index_ms = _median_ms(lambda: index.search(query, limit=args.limit), args.repeat)
+        hits = len(index.search(query, limit=len(articles)))
+        print(f"{query:<26}{linear_ms:>10.2f}{index_ms:>10.2f}{hits:>8}")
+
+
+if __name__ == "__main__":
+    main()
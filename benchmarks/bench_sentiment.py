@@ -0,0 +1,90 @@
+# BharatVaani/benchmarks/bench_sentiment.py
+#
+# TextBlob (one object per text) vs. the batched NumPy lexicon scorer, on article texts built from the
+# feed fixtures plus a set of headlines exercising intensifiers, negation and exclamation marks.
+#
+#     python -m benchmarks.bench_sentiment --articles 5000 --batch-size 500
+
+import argparse
+import itertools
+import time
+from urllib.parse import urlparse
+
+from textblob import TextBlob
+
+from core.feed_parser import parse_feed, UnsupportedFeedError
+from core.sentiment import get_lexicon_scorer
+from core.utils import clean_texts
+from benchmarks.feed_fixtures import load_fixtures
+
+HEADLINES = [
+    "Markets rally as investors cheer strong quarterly earnings and a very good monsoon forecast",
+    "Government is not happy with the slow pace of reform, says minister",
+    "Three killed, dozens injured in a tragic bus accident on the highway",
+    "Team India's stunning victory leaves fans absolutely thrilled!",
+    "Experts warn the outlook is really not good for exporters this year",
+    "Court calls the decision arbitrary and deeply unfair to farmers",
+    "Startup raises funding, but analysts are never certain about profitability",
+    "Flood situation remains critical; rescue teams face terrible conditions",
+    "New metro line is a well-known success with commuters",
+    "Inflation eases slightly, bringing modest relief to households",
+    "Scientists make a remarkable breakthrough in affordable vaccine research",
+    "Opposition slams the budget as a huge disappointment!!",
+]
+
+
+def _corpus(articles: int) -> list:
+    texts = []
+    for feeds in load_fixtures().values():
+        for url, body in feeds:
+            try:
+                records = parse_feed(body, f"{urlparse(url).scheme}://{urlparse(url).netloc}")
+            except UnsupportedFeedError:
+                continue
+            for title, summary in zip(clean_texts([r['title'] for r in records]),
+                                      clean_texts([r['summary'] for r in records])):
+                texts.append(f"{title}. {summary}")  # Same shape as full_text_for_ai
+    pool = texts + HEADLINES * max(1, len(texts) // (4 * len(HEADLINES)))
+    return list(itertools.islice(itertools.cycle(pool), articles))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TextBlob vs batched lexicon sentiment benchmark")
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--textblob-sample", type=int, default=1000,
+                        help="Texts timed with TextBlob (it is slow); its rate is extrapolated")
+    args = parser.parse_args()
+
+    texts = _corpus(args.articles)
+    scorer = get_lexicon_scorer()  # Lexicon load is a one-time cost, not part of the throughput
+
+    sample = texts[:args.textblob_sample]
+    start = time.perf_counter()
+    reference = [TextBlob(t).sentiment.polarity for t in sample]
+    textblob_rate = len(sample) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    ours = []
+    for i in range(0, len(texts), args.batch_size):
+        ours.extend(scorer.polarities(texts[i:i + args.batch_size]).tolist())
+    lexicon_rate = len(texts) / (time.perf_counter() - start)
+
+    def label(p):
+        return "Positive" if p > 0.1 else "Negative" if p < -0.1 else "Neutral"
+
+    label_agreement = sum(label(a) == label(b) for a, b in zip(reference, ours)) / len(sample)
+    max_diff = max(abs(a - b) for a, b in zip(reference, ours))
+    headline_diffs = [(h, r, o) for h, r, o in zip(HEADLINES, [TextBlob(h).sentiment.polarity for h in HEADLINES],
+                                                   scorer.polarities(HEADLINES).tolist()) if abs(r - o) > 1e-9]
+
+    print(f"articles={len(texts)} batch_size={args.batch_size}")
+    print(f"TextBlob         : {textblob_rate:>10.0f} articles/s")
+    print(f"lexicon (NumPy)  : {lexicon_rate:>10.0f} articles/s  ({lexicon_rate / textblob_rate:.1f}x)")
+    print(f"label agreement  : {label_agreement:.2%}  max |polarity diff| = {max_diff:.4f}")
+    for headline, theirs, mine in headline_diffs:
+        print(f"  differs: {theirs:+.3f} vs {mine:+.3f}  {headline}")
+
+
+if __name__ == "__main__":
+    main()
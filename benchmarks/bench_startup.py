@@ -0,0 +1,50 @@
+# BharatVaani/benchmarks/bench_startup.py
+#
+# Process startup cost with lazy models: time to import the core modules (what every worker and test pays)
+# vs. time until every model is warmed up (what a preloading worker pays before /readyz turns 200).
+# Each run is a fresh interpreter so import caches don't carry over.
+#
+#     python -m benchmarks.bench_startup --runs 3
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = r"""
+import json, time
+start = time.perf_counter()
+import core.utils, core.summarizer, core.translator
+imported = time.perf_counter() - start
+statuses = {}
+if PRELOAD:
+    from core.lazy_models import warm_up
+    statuses = warm_up()
+print(json.dumps({'import_seconds': imported, 'total_seconds': time.perf_counter() - start, 'models': statuses}))
+"""
+
+
+def _run(preload: bool) -> dict:
+    code = _PROBE.replace("PRELOAD", str(preload))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time with lazy vs preloaded models")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    for preload in (False, True):
+        runs = [_run(preload) for _ in range(args.runs)]
+        label = "preload (warm_up)" if preload else "lazy (import only)"
+        print(f"{label:<20}: import {statistics.median(r['import_seconds'] for r in runs):6.2f}s  "
+              f"ready {statistics.median(r['total_seconds'] for r in runs):6.2f}s  (median of {args.runs})")
+        for name, status in runs[-1]['models'].items():
+            outcome = f"{status['load_seconds']}s" if status['loaded'] else f"FAILED ({status['error']})"
+            print(f"    {name:<18} {outcome}")
+
+
+if __name__ == "__main__":
+    main()
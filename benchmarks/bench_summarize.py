@@ -0,0 +1,39 @@
+# BharatVaani/benchmarks/bench_summarize.py
+#
+# Summarization throughput of summarize_texts as the batch size grows (1 = the old one-call-per-article path),
+# on article texts built from the feed fixtures. Needs the summarizer model (downloaded on first run).
+#
+#     python -m benchmarks.bench_summarize --articles 32 --batch-sizes 1,4,8,16
+
+import argparse
+import time
+
+from core.summarizer import load_summarizer_pipeline, summarize_texts
+from benchmarks.bench_sentiment import _corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched summarization throughput benchmark")
+    parser.add_argument("--articles", type=int, default=32)
+    parser.add_argument("--batch-sizes", default="1,4,8,16")
+    args = parser.parse_args()
+
+    # Repeat texts so every one is long enough to summarize (the fixtures' summaries are short)
+    texts = [" ".join([text] * 4) for text in _corpus(args.articles)]
+    start = time.perf_counter()
+    if load_summarizer_pipeline() is None:
+        raise SystemExit("Summarizer model could not be loaded; see the log above.")
+    print(f"articles={len(texts)} model load {time.perf_counter() - start:.1f}s")
+    summarize_texts(texts[:2], batch_size=2)  # Warm-up: first forward pass allocates buffers
+
+    baseline = None
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        start = time.perf_counter()
+        summarize_texts(texts, batch_size=batch_size)
+        rate = len(texts) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"batch_size={batch_size:<4}: {rate:6.2f} articles/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
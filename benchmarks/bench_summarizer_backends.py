@@ -0,0 +1,90 @@
+# BharatVaani/benchmarks/bench_summarizer_backends.py
+#
+# Summarizer backends (fp32 PyTorch, dynamic int8, ONNX Runtime) compared on load time, per-article latency,
+# peak RSS and agreement of their summaries with the fp32 baseline. Each backend runs in its own process so
+# peak RSS is not shared; a backend that falls back to fp32 is reported as such.
+#
+#     python -m benchmarks.bench_summarizer_backends --articles 16 --backends pytorch,int8,onnx
+
+import argparse
+import json
+import subprocess
+import sys
+
+_PROBE = r"""
+import json, resource, sys, time
+import core.summarizer as summarizer
+summarizer.summary_cache = None  # Measure the model, not the cache
+from benchmarks.bench_sentiment import _corpus
+
+backend, articles, batch_size = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+texts = [" ".join([text] * 4) for text in _corpus(articles)]
+start = time.perf_counter()
+summarizer.summarizer_model._loader = lambda: summarizer._build_summarizer_pipeline(backend)
+if summarizer.load_summarizer_pipeline() is None:
+    raise SystemExit(f"{backend}: {summarizer.summarizer_model.error}")
+load_seconds = time.perf_counter() - start
+summarizer.summarize_texts(texts[:2], batch_size=2)  # Warm-up
+start = time.perf_counter()
+summaries = summarizer.summarize_texts(texts, batch_size=batch_size)
+seconds = time.perf_counter() - start
+print(json.dumps({
+    'backend': summarizer.active_backend,
+    'load_seconds': load_seconds,
+    'ms_per_article': seconds / len(texts) * 1000,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # KiB on Linux
+    'summaries': summaries,
+}))
+"""
+
+
+def _unigram_f1(a: str, b: str) -> float:
+    """ROUGE-1-style overlap of two summaries (1.0 = same words)."""
+    words_a, words_b = a.lower().split(), b.lower().split()
+    if not words_a or not words_b:
+        return float(words_a == words_b)
+    remaining = list(words_b)
+    overlap = 0
+    for word in words_a:
+        if word in remaining:
+            remaining.remove(word)
+            overlap += 1
+    precision, recall = overlap / len(words_a), overlap / len(words_b)
+    return 2 * precision * recall / (precision + recall) if overlap else 0.0
+
+
+def _run(backend: str, articles: int, batch_size: int) -> dict:
+    result = subprocess.run([sys.executable, "-c", _PROBE, backend, str(articles), str(batch_size)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'backend': backend, 'error': (result.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarizer backend latency / memory / agreement benchmark")
+    parser.add_argument("--articles", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--backends", default="pytorch,int8,onnx")
+    args = parser.parse_args()
+
+    results = {backend: _run(backend, args.articles, args.batch_size) for backend in args.backends.split(",")}
+    baseline = results.get("pytorch")
+    print(f"articles={args.articles} batch_size={args.batch_size}")
+    print(f"{'backend':<10}{'active':<10}{'load s':>8}{'ms/article':>12}{'peak RSS MB':>13}"
+          f"{'exact':>8}{'word F1':>9}")
+    for requested, result in results.items():
+        if 'error' in result:
+            print(f"{requested:<10}FAILED: {result['error']}")
+            continue
+        exact = f1 = float('nan')
+        if baseline and 'summaries' in baseline:
+            pairs = list(zip(baseline['summaries'], result['summaries']))
+            exact = sum(a == b for a, b in pairs) / len(pairs)
+            f1 = sum(_unigram_f1(a, b) for a, b in pairs) / len(pairs)
+        print(f"{requested:<10}{result['backend']:<10}{result['load_seconds']:>8.1f}{result['ms_per_article']:>12.0f}"
+              f"{result['peak_rss_mb']:>13.0f}{exact:>8.0%}{f1:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# BharatVaani/benchmarks/bench_translate.py
+#
+# Sentence-split document translation: splitter throughput, then translation throughput (sentences/s) of
+# translate_texts as the batch size grows, on article texts built from the feed fixtures. batch_size=1 is
+# one generate call per sentence. Needs the IndicTrans2 model (downloaded on first run).
+#
+#     python -m benchmarks.bench_translate --articles 16 --lang hi --batch-sizes 1,4,8,16,32
+
+import argparse
+import time
+
+from core.translator import init_translator, translate_texts
+from core.utils import split_sentences
+from benchmarks.bench_sentiment import _corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched sentence translation throughput benchmark")
+    parser.add_argument("--articles", type=int, default=16)
+    parser.add_argument("--lang", default="hi")
+    parser.add_argument("--batch-sizes", default="1,4,8,16,32")
+    args = parser.parse_args()
+
+    # Distinct suffixes keep the repeated fixture sentences from being deduplicated away
+    texts = [" ".join(f"{sentence} ({i}.{j})" for j, sentence in enumerate(split_sentences(text) * 3))
+             for i, text in enumerate(_corpus(args.articles))]
+    start = time.perf_counter()
+    sentences = sum(len(split_sentences(text)) for text in texts)
+    split_seconds = time.perf_counter() - start
+    print(f"articles={len(texts)} sentences={sentences} split {sentences / split_seconds:,.0f} sentences/s")
+
+    start = time.perf_counter()
+    if init_translator()[0] is None:
+        raise SystemExit("Translator model could not be loaded; see the log above.")
+    print(f"model load {time.perf_counter() - start:.1f}s")
+    translate_texts(texts[:1], args.lang, batch_size=4)  # Warm-up: first forward pass allocates buffers
+
+    baseline = None
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        start = time.perf_counter()
+        translate_texts(texts, args.lang, batch_size=batch_size)
+        rate = sentences / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"batch_size={batch_size:<4}: {rate:6.2f} sentences/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
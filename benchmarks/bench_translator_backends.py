@@ -0,0 +1,86 @@
+# BharatVaani/benchmarks/bench_translator_backends.py
+#
+# IndicTrans2 runtimes compared on load time, per-sentence latency, peak RSS and agreement of their output with
+# the previous path ('baseline': fp32, slow tokenizer, torch's default threading). The other runs use the
+# configured tokenizer path and the thread counts given here. Each run is its own process, so peak RSS and
+# thread settings are not shared; a backend that falls back to fp32 is reported as such.
+#
+#     python -m benchmarks.bench_translator_backends --sentences 64 --lang hi --backends pytorch,int8 --threads 4,1
+
+import argparse
+import json
+import subprocess
+import sys
+
+from benchmarks.bench_summarizer_backends import _unigram_f1
+
+_PROBE = r"""
+import json, resource, sys, time
+import core.translator as translator
+from core.utils import split_sentences
+from benchmarks.bench_sentiment import _corpus
+
+backend, sentences, lang, batch_size, fast, intra, inter = sys.argv[1:8]
+translator.TRANSLATOR_USE_FAST_TOKENIZER = fast == "1"
+translator.TRANSLATOR_INTRA_OP_THREADS, translator.TRANSLATOR_INTER_OP_THREADS = int(intra), int(inter)
+texts = [s for text in _corpus(int(sentences)) for s in split_sentences(text)][:int(sentences)]
+start = time.perf_counter()
+translator.translator_model._loader = lambda: translator._build_translator(backend)
+if translator.init_translator()[0] is None:
+    raise SystemExit(f"{backend}: {translator.translator_model.error}")
+load_seconds = time.perf_counter() - start
+translator.translate_texts(texts[:2], lang, batch_size=2)  # Warm-up
+start = time.perf_counter()
+translations = translator.translate_texts(texts, lang, batch_size=int(batch_size))
+seconds = time.perf_counter() - start
+print(json.dumps({
+    'backend': translator.active_backend,
+    'load_seconds': load_seconds,
+    'ms_per_sentence': seconds / len(texts) * 1000,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # KiB on Linux
+    'translations': translations,
+}, ensure_ascii=False))
+"""
+
+
+def _run(backend: str, args, fast: bool, intra: int, inter: int) -> dict:
+    result = subprocess.run([sys.executable, "-c", _PROBE, backend, str(args.sentences), args.lang,
+                             str(args.batch_size), "1" if fast else "0", str(intra), str(inter)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'backend': backend, 'error': (result.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translator runtime latency / memory / agreement benchmark")
+    parser.add_argument("--sentences", type=int, default=64)
+    parser.add_argument("--lang", default="hi")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--backends", default="pytorch,int8")
+    parser.add_argument("--threads", default="0,0", help="intra-op,inter-op torch threads (0 = torch default)")
+    parser.add_argument("--slow-tokenizer", action="store_true", help="also use the slow tokenizer outside the baseline")
+    args = parser.parse_args()
+    intra, inter = (int(n) for n in args.threads.split(","))
+
+    results = {'baseline': _run('pytorch', args, fast=False, intra=0, inter=0)}
+    for backend in args.backends.split(","):
+        results[backend] = _run(backend, args, fast=not args.slow_tokenizer, intra=intra, inter=inter)
+    baseline = results['baseline']
+    print(f"sentences={args.sentences} lang={args.lang} batch_size={args.batch_size} threads={intra},{inter}")
+    print(f"{'run':<10}{'active':<10}{'load s':>8}{'ms/sentence':>13}{'peak RSS MB':>13}{'exact':>8}{'word F1':>9}")
+    for run, result in results.items():
+        if 'error' in result:
+            print(f"{run:<10}FAILED: {result['error']}")
+            continue
+        exact = f1 = float('nan')
+        if 'translations' in baseline:
+            pairs = list(zip(baseline['translations'], result['translations']))
+            exact = sum(a == b for a, b in pairs) / len(pairs)
+            f1 = sum(_unigram_f1(a, b) for a, b in pairs) / len(pairs)
+        print(f"{run:<10}{result['backend']:<10}{result['load_seconds']:>8.1f}{result['ms_per_sentence']:>13.0f}"
+              f"{result['peak_rss_mb']:>13.0f}{exact:>8.0%}{f1:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# BharatVaani/benchmarks/feed_fixtures.py
+#
+# Recorded RSS payloads for offline benchmarks.
+#
+#     python -m benchmarks.feed_fixtures record   # download every feed in RSS_FEEDS into benchmarks/fixtures/
+#
+# The committed set covers two feeds per scope, a few items each, in the publishers' own formats with fixed
+# dates (recorded_at in the manifest); benchmarks pin "now" to that time with pin_clock_to_recording() so the
+# fetcher's 7-day cut-off keeps the same articles on every run. `record` replaces it with live payloads.
+# load_fixtures(synthetic=True) gives deterministic synthetic feeds instead (RSS 2.0, RSS 1.0 and Atom, plus
+# one malformed feed, for every feed URL); they are also used, with a warning, if the recordings are missing.
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import RSS_FEEDS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+MANIFEST_FILE = os.path.join(FIXTURES_DIR, "manifest.json")
+
+# Reference time for synthetic pubDates, truncated to the hour so payloads are stable within a run
+_SYNTHETIC_NOW = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+_WORDS = ("government economy market cricket election minister court technology startup monsoon "
+          "budget health vaccine research space isro rupee inflation policy parliament stadium "
+          "film music company shares investors growth climate flood rescue police city state").split()
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+# Made-up words widen the vocabulary so unrelated synthetic stories don't look like near-duplicates
+_SYLLABLES = "ka ra mo ti sha van pur lin dor esh ali nag bha tel gor min sut ved".split()
+_VOCABULARY = _WORDS + [a + b for a in _SYLLABLES for b in _SYLLABLES if a != b]
+
+
+def _sentence(seed: int, length: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(length)).capitalize()
+
+
+def _synthetic_items(feed_no: int, count: int):
+    # Summary and content seeds are unique per (feed, item), so no two synthetic stories share their text
+    for i in range(count):
+        age = timedelta(hours=3 * i) if i < count - 5 else timedelta(days=10 + i)  # Last few are stale
+        yield {
+            "title": f"{_sentence(feed_no * 31 + i, 8)} ({feed_no}-{i})",
+            "link": f"https://news.example/{feed_no}/{i}",
+            "guid": f"urn:bharatvaani:{feed_no}:{i}",
+            "published": _SYNTHETIC_NOW - age,
+            "summary_text": _sentence(10_000 + feed_no * 1000 + i, 40),
+            "summary": f"&lt;p&gt;{_sentence(10_000 + feed_no * 1000 + i, 40)}.&lt;/p&gt;"
+                       f"&lt;img src=\"/images/{feed_no}-{i}.jpg\"&gt;",
+            "content": f"&lt;p&gt;{_sentence(100_000 + feed_no * 1000 + i, 160)}.&lt;/p&gt;",
+        }
+
+
+def _rss2_link_and_guid(n: int, it: Dict) -> str:
+    # Mix the shapes feeds use: <link> plus a non-URL guid, a guid marked as no permalink, or only a permalink guid
+    if n % 4 == 3:
+        return f"<guid>{it['link']}</guid>"
+    if n % 4 == 1:
+        return f"<link>{it['link']}</link><guid isPermaLink=\"false\">{it['guid']}</guid>"
+    return f"<link>{it['link']}</link><guid>{it['guid']}</guid>"
+
+
+def synthetic_rss2(feed_no: int, count: int = 50) -> bytes:
+    items = "".join(
+        f"<item><title>{it['title']}</title>{_rss2_link_and_guid(n, it)}"
+        f"<pubDate>{format_datetime(it['published'])}</pubDate><description>{it['summary']}</description>"
+        f"<content:encoded>{it['content']}</content:encoded>"
+        f"<media:content url=\"https://img.example/{feed_no}/{n}.jpg\" medium=\"image\"/></item>"
+        for n, it in enumerate(_synthetic_items(feed_no, count))
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" '
+            'xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:media="http://search.yahoo.com/mrss/">'
+            f'<channel><title>Synthetic {feed_no}</title>{items}</channel></rss>').encode("utf-8")
+
+
+def _atom_summary(n: int, it: Dict) -> str:
+    if n % 3 == 2:  # Inline XHTML rather than escaped HTML
+        return (f"<summary type=\"xhtml\"><div xmlns=\"http://www.w3.org/1999/xhtml\"><p>{it['summary_text']}.</p>"
+                f"<img src=\"/images/{n}.jpg\"/></div></summary>")
+    return f"<summary type=\"html\">{it['summary']}</summary>"
+
+
+def synthetic_atom(feed_no: int, count: int = 50) -> bytes:
+    entries = "".join(
+        f"<entry><id>{it['guid']}</id><title>{it['title']}</title><link rel=\"alternate\" href=\"{it['link']}\"/>"
+        f"<published>{it['published'].isoformat()}</published>{_atom_summary(n, it)}"
+        f"<content type=\"html\">{it['content']}</content></entry>"
+        for n, it in enumerate(_synthetic_items(feed_no, count))
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>Synthetic {feed_no}</title>{entries}</feed>').encode("utf-8")
+
+
+def synthetic_rdf(feed_no: int, count: int = 50) -> bytes:
+    items = "".join(
+        f"<item rdf:about=\"{it['link']}\"><title>{it['title']}</title><link>{it['link']}</link>"
+        f"<description>{it['summary']}</description></item>"
+        for it in _synthetic_items(feed_no, count)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+            f'xmlns="http://purl.org/rss/1.0/"><channel rdf:about="https://news.example/"/>{items}</rdf:RDF>').encode("utf-8")
+
+
+def synthetic_malformed(feed_no: int, count: int = 50) -> bytes:
+    # HTML entities aren't defined in XML; strict parsers reject this and must fall back to feedparser
+    return synthetic_rss2(feed_no, count).replace(b"<channel><title>", b"<channel><title>&nbsp;", 1)
+
+
+_SYNTHETIC_BUILDERS = (synthetic_rss2, synthetic_rss2, synthetic_atom, synthetic_rdf, synthetic_malformed)
+
+
+def load_fixtures(synthetic: bool = False) -> Dict[str, List[Tuple[str, bytes]]]:
+    """Returns {scope: [(feed_url, payload), ...]} from the recorded fixtures, or synthetic feeds if asked to."""
+    if not synthetic:
+        if os.path.exists(MANIFEST_FILE):
+            with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            fixtures = {}
+            for url, meta in manifest.items():
+                with open(os.path.join(FIXTURES_DIR, meta["file"]), "rb") as f:
+                    fixtures.setdefault(meta["scope"], []).append((url, f.read()))
+            return fixtures
+        print(f"WARNING: no recorded fixtures in {FIXTURES_DIR}; falling back to synthetic feeds (record real ones "
+              f"with `python -m benchmarks.feed_fixtures record`).", file=sys.stderr)
+
+    fixtures, feed_no = {}, 0
+    for scope, urls in RSS_FEEDS.items():
+        for url in urls:
+            builder = _SYNTHETIC_BUILDERS[feed_no % len(_SYNTHETIC_BUILDERS)]
+            fixtures.setdefault(scope, []).append((url, builder(feed_no)))
+            feed_no += 1
+    return fixtures
+
+
+def fixtures_recorded_at() -> Optional[datetime]:
+    """When the recorded fixtures were captured (the latest recording), or None for synthetic feeds."""
+    if not os.path.exists(MANIFEST_FILE):
+        return None
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    stamps = [datetime.fromisoformat(meta["recorded_at"]) for meta in manifest.values() if meta.get("recorded_at")]
+    return max(stamps) if stamps else None
+
+
+def _frozen_datetime(frozen: datetime):
+    """datetime subclass whose now() is pinned to `frozen` (naive UTC)."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen if tz is None else frozen.replace(tzinfo=timezone.utc).astimezone(tz)
+    return FrozenDatetime
+
+
+def pin_clock_to_recording(*modules) -> Optional[datetime]:
+    """
+    Makes datetime.now() in the given modules (e.g. core.fetcher, core.feed_parser) return the recording time,
+    so recorded fixtures don't age past the 7-day article cut-off. Returns that time (None: nothing recorded).
+    """
+    recorded_at = fixtures_recorded_at()
+    if recorded_at is not None:
+        frozen = _frozen_datetime(recorded_at)
+        for module in modules:
+            module.datetime = frozen
+    return recorded_at
+
+
+def record_fixtures():
+    """Downloads every feed in RSS_FEEDS into FIXTURES_DIR and writes the manifest."""
+    from core.http_client import get_http_session  # Only needed when recording
+
+    session = get_http_session()
+    manifest = {}
+    for scope, urls in RSS_FEEDS.items():
+        os.makedirs(os.path.join(FIXTURES_DIR, _slug(scope)), exist_ok=True)
+        for n, url in enumerate(urls):
+            try:
+                response = session.get(url, timeout=20)
+                response.raise_for_status()
+            except Exception as e:
+                print(f"[x] {url}: {e}")
+                continue
+            rel_path = os.path.join(_slug(scope), f"{n:02d}.xml")
+            with open(os.path.join(FIXTURES_DIR, rel_path), "wb") as f:
+                f.write(response.content)
+            manifest[url] = {"scope": scope, "file": rel_path,
+                             "recorded_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat()}
+            print(f"[✓] {url} -> {rel_path} ({len(response.content)} bytes)")
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage recorded RSS fixtures")
+    parser.add_argument("command", choices=["record"])
+    parser.parse_args()
+    record_fixtures()
@@ -0,0 +1,89 @@
+# BharatVaani/benchmarks/stub_feeds.py
+
+import threading
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+import time
+
+
+def build_stub_feed(feed_no: int, item_count: int = 20) -> bytes:
+    """Builds a small, always-fresh RSS 2.0 document for feed number `feed_no`."""
+    now = datetime.now().astimezone()
+    items = []
+    for i in range(item_count):
+        pub_date = format_datetime(now - timedelta(minutes=15 * i))
+        items.append(
+            f"<item>"
+            f"<title>Stub feed {feed_no} headline number {i}</title>"
+            f"<link>http://stub.local/{feed_no}/{i}</link>"
+            f"<guid>stub-{feed_no}-{i}</guid>"
+            f"<pubDate>{pub_date}</pubDate>"
+            f"<description>&lt;p&gt;Summary for story {i} of stub feed {feed_no}, "
+            f"long enough to be kept by the fetcher.&lt;/p&gt;</description>"
+            f"</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0"><channel><title>Stub {feed_no}</title>'
+        f'<link>http://stub.local/{feed_no}</link><description>Stub feed</description>'
+        + "".join(items) +
+        '</channel></rss>'
+    ).encode("utf-8")
+
+
+class _StubFeedHandler(BaseHTTPRequestHandler):
+    """Serves /feed/<n>/<delay_ms> with an artificial delay before responding."""
+
+    def do_GET(self):
+        try:
+            _, _, feed_no, delay_ms = self.path.split("/")[:4]
+            feed_no, delay_ms = int(feed_no), int(delay_ms)
+        except ValueError:
+            self.send_error(404)
+            return
+        time.sleep(delay_ms / 1000.0)
+        body = build_stub_feed(feed_no)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client gave up (e.g. deadline hit)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+
+class StubFeedServer:
+    """
+    Local HTTP server serving stub RSS feeds, used as a context manager:
+
+        with StubFeedServer() as server:
+            urls = server.feed_urls([50, 100, 2000])
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _StubFeedHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_urls(self, delays_ms: List[int]) -> List[str]:
+        """Returns one feed URL per entry in `delays_ms`, each answering after that many milliseconds."""
+        return [f"{self.base_url}/feed/{n}/{delay}" for n, delay in enumerate(delays_ms)]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
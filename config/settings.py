@@ -99,6 +99,83 @@ RSS_FEEDS = {
                 ]
 }
 
+# --- Feed Fetching ---
+FEED_FETCH_CONCURRENT = True # Download all feeds of a scope in parallel
+FEED_FETCH_MAX_WORKERS = 8 # Upper bound on parallel feed downloads per call
+FEED_FETCH_TIMEOUT = 15 # Per-feed request timeout (seconds)
+FEED_FETCH_DEADLINE = 20 # Global budget for one fetch_top_headlines call (seconds)
+FEED_FAST_PARSER = True # Streaming RSS/Atom parser with early termination (falls back to feedparser)
+
+# Near-duplicate suppression (the same wire story published by several feeds)
+DEDUP_ENABLED = True
+DEDUP_MAX_HAMMING = 10 # Max differing bits between 64-bit SimHash fingerprints of the summary (tuned with bench_dedup)
+DEDUP_MIN_TOKENS = 5 # Shorter texts are only de-duplicated exactly
+
+# Per-feed health: circuit breaker and adaptive timeouts
+FEED_CIRCUIT_BREAKER_ENABLED = True
+FEED_CIRCUIT_FAILURE_THRESHOLD = 3 # Consecutive failures before a feed is skipped
+FEED_CIRCUIT_COOLDOWN_SECONDS = 600 # First skip period; doubles each time the feed fails its probe
+FEED_CIRCUIT_MAX_COOLDOWN_SECONDS = 6 * 3600
+FEED_HEALTH_WINDOW = 50 # Latency samples kept per feed
+FEED_HEALTH_MIN_SAMPLES = 5 # Samples needed before the timeout adapts
+FEED_TIMEOUT_P95_MULTIPLIER = 2.0 # Timeout = p95 latency x multiplier ...
+FEED_TIMEOUT_MIN = 3 # ... but never below this nor above FEED_FETCH_TIMEOUT (seconds)
+
+# --- Shared HTTP Client ---
+HTTP_POOL_CONNECTIONS = 32 # Number of per-host connection pools kept open
+HTTP_POOL_MAXSIZE = 4 # Max keep-alive connections per host
+HTTP_POOL_BLOCK = True # Wait for a free connection rather than exceed HTTP_POOL_MAXSIZE
+# Retries per request (was 3 with backoff 1 before the feed circuit breaker): persistently failing feeds are
+# skipped by the breaker, so retries only need to cover one-off connection errors
+HTTP_RETRY_TOTAL = 1
+HTTP_RETRY_BACKOFF = 0.5 # Seconds, doubled per retry
+HTTP_USER_AGENT = f"{APP_NAME}/{APP_VERSION}"
+
+# --- Background Feed Ingestion ---
+INGEST_ENABLED = True
+INGEST_INTERVAL_SECONDS = 300 # How often every scope is refreshed
+INGEST_PAGE_SIZE = 50 # Articles kept in each scope snapshot
+INGEST_FIRST_LOAD_WAIT = 20 # Max seconds a page waits for the very first snapshot of a scope
+
+# --- Local Data Storage ---
+DATA_DIR = os.getenv('BHARATVAANI_DATA_DIR', 'data')
+
+# Conditional-GET cache (ETag / Last-Modified + last parsed entries per feed)
+FEED_CACHE_ENABLED = True
+FEED_CACHE_FILE = os.path.join(DATA_DIR, "feed_cache.json")
+
+# Sentiment analysis
+SENTIMENT_BACKEND = os.getenv('SENTIMENT_BACKEND', 'lexicon') # 'lexicon' (batched NumPy scorer over TextBlob's lexicon) or 'textblob'
+
+# Memoization caches (in-memory LRU, optionally backed by a SQLite file that survives restarts)
+CACHE_DB_FILE = os.path.join(DATA_DIR, "cache.sqlite3")
+SENTIMENT_CACHE_ENABLED = True
+SENTIMENT_CACHE_SIZE = 20000 # Results kept in memory
+SENTIMENT_CACHE_PERSIST = True
+SENTIMENT_CACHE_DISK_SIZE = 200000 # Rows kept on disk
+SUMMARY_CACHE_ENABLED = True
+SUMMARY_CACHE_SIZE = 2000 # Summaries kept in memory
+SUMMARY_CACHE_PERSIST = True
+SUMMARY_CACHE_DISK_SIZE = 50000 # Rows kept on disk
+
+# Article search (in-memory BM25 index over everything ingestion has seen)
+SEARCH_INDEX_MAX_DOCS = 50000 # Oldest articles are dropped from the index beyond this
+SEARCH_TITLE_WEIGHT = 2 # A title occurrence counts as this many summary occurrences
+SEARCH_MAX_PREFIX_EXPANSIONS = 50 # Indexed terms a query word can expand to ("elect" -> "election", "electoral", ...)
+
+# Thumbnail proxy (resized copies of publisher images, served from /thumb/<key>)
+THUMB_ENABLED = True
+THUMB_DIR = os.path.join(DATA_DIR, "thumbs")
+THUMB_SIZE = (480, 320) # Max width/height; cards are 160px tall, this leaves room for 2x screens
+THUMB_QUALITY = 70
+THUMB_WORKERS = 2 # Background resize threads
+THUMB_MAX_SOURCE_BYTES = 10 * 1024 * 1024 # Larger source images are not downloaded
+THUMB_FETCH_TIMEOUT = 10
+THUMB_CACHE_MAX_AGE = 365 * 24 * 3600 # Keys change with the source URL and the resize settings, so clients may cache long
+THUMB_MAX_REGISTERED = 50000 # Image URLs remembered (key -> URL and failed keys); least recently used dropped beyond this
+THUMB_FAILURE_RETRY_SECONDS = 3600 # A failed image is served as the original, then retried after this long
+THUMB_DISK_MAX_BYTES = 500 * 1024 * 1024 # Oldest thumbnails are deleted once THUMB_DIR grows past this
+
 # Keywords for categorizing articles
 CATEGORY_KEYWORDS = {
     "General": ["news", "current events", "headlines", "breaking"],
@@ -215,6 +292,60 @@ CATEGORY_KEYWORDS = {
 
 # --- Summarizer Model ---
 SUMMARIZER_MODEL_NAME = "sshleifer/distilbart-cnn-12-6" # Added this line
+# Inference backend: 'pytorch' (fp32), 'int8' (dynamically quantized Linear layers) or 'onnx' (ONNX Runtime,
+# needs optimum[onnxruntime]). Anything that fails to load falls back to 'pytorch'.
+SUMMARIZER_BACKEND = os.getenv('SUMMARIZER_BACKEND', 'pytorch')
+SUMMARIZER_ONNX_DIR = os.path.join(DATA_DIR, "onnx", SUMMARIZER_MODEL_NAME.replace("/", "--")) # Exported graph, reused
+SUMMARY_MAX_LENGTH = 100 # Generation bounds, in tokens
+SUMMARY_MIN_LENGTH = 30
+SUMMARIZER_BATCH_SIZE = 8 # Texts per padded forward pass in summarize_texts
+SUMMARIZER_MAX_INPUT_TOKENS = 1024 # Token budget of one forward pass (capped by the model's own limit)
+SUMMARIZER_MAP_REDUCE = True # Longer texts: summarize chunks, then the chunk summaries; otherwise cut to the budget
+SUMMARIZER_MAX_CHUNKS = 4 # Bounds worst-case work per text: at most this many chunk passes plus one reduce pass
+SUMMARY_CHUNK_MAX_LENGTH = 60 # Generation bound for chunk summaries, in tokens
+SUMMARIZE_BATCH_MAX_TEXTS = 32 # Max texts accepted by /api/summarize_batch
+
+# Background pre-summarization of newly ingested articles (fills the summary cache while the server is idle)
+PRESUMMARIZE_ENABLED = os.getenv('BHARATVAANI_PRESUMMARIZE', 'false').lower() in ('1', 'true', 'yes')
+PRESUMMARIZE_TOP_N = 10 # Most recent new articles per scope refresh that get summarized
+PRESUMMARIZE_CPU_BUDGET = 0.25 # Max share of wall time the worker spends on CPU
+PRESUMMARIZE_IDLE_SECONDS = 5 # Quiet time after the last request before the worker resumes
+PRESUMMARIZE_MAX_LOAD = 0.75 # Pause while the 1-minute load average per CPU is above this
+PRESUMMARIZE_QUEUE_SIZE = 500 # Oldest queued articles are dropped beyond this
+
+# --- Translation (IndicTrans2) ---
+TRANSLATOR_MODEL_NAME = "ai4bharat/indictrans2-en-indic-1B"
+# Inference backend: 'int8' (Linear layers dynamically quantized to int8) or 'pytorch' (fp32). Falls back to 'pytorch'.
+TRANSLATOR_BACKEND = os.getenv('TRANSLATOR_BACKEND', 'int8')
+TRANSLATOR_USE_FAST_TOKENIZER = True # Falls back to the slow (sentencepiece) tokenizer if the model has no fast one
+TRANSLATOR_INTRA_OP_THREADS = int(os.getenv('TRANSLATOR_INTRA_OP_THREADS', '0')) # torch threads per op; 0 = torch default (all cores)
+TRANSLATOR_INTER_OP_THREADS = int(os.getenv('TRANSLATOR_INTER_OP_THREADS', '0')) # Parallel independent ops; 0 = torch default
+TRANSLATION_BATCH_SIZE = 16 # Sentences per generate call
+TRANSLATION_MAX_BATCH_TOKENS = 4096 # Padded tokens per batch (sentences x longest sentence)
+TRANSLATION_MAX_SENTENCE_TOKENS = 256 # Per-sentence input/output bound; documents are split, not truncated
+# Translation store: finished translations keyed by (article_id, language, model), used by /api/translate and /api/audio
+TRANSLATION_STORE_ENABLED = True
+TRANSLATION_STORE_FILE = os.path.join(DATA_DIR, "translations.sqlite3")
+TRANSLATION_STORE_MAX_ENTRIES = 100000 # Least recently used rows are evicted beyond this
+TRANSLATION_STORE_MAX_AGE_DAYS = 30 # Older translations are dropped
+
+# Background pre-translation of new articles' summaries (what the translate button sends) into the most demanded languages
+PRETRANSLATE_ENABLED = os.getenv('BHARATVAANI_PRETRANSLATE', 'false').lower() in ('1', 'true', 'yes')
+PRETRANSLATE_TOP_N = 10 # Most recent new articles per scope refresh that get translated
+PRETRANSLATE_TOP_LANGUAGES = 2 # Target languages: the top ones by demand (translate requests + saved preference)
+PRETRANSLATE_DEMAND_HALF_LIFE = 24 * 3600 # Seconds after which a request's contribution to demand has halved
+PRETRANSLATE_PREFERENCE_WEIGHT = 5 # Demand a saved selected_language adds, in translate requests
+PRETRANSLATE_BATCH_ARTICLES = 8 # Articles whose summaries are translated per worker batch
+PRETRANSLATE_CPU_BUDGET = 0.25 # Max share of wall time the worker spends on CPU
+PRETRANSLATE_IDLE_SECONDS = 5 # Quiet time after the last request before the worker resumes
+PRETRANSLATE_MAX_LOAD = 0.75 # Pause while the 1-minute load average per CPU is above this
+PRETRANSLATE_QUEUE_SIZE = 500 # Oldest queued articles are dropped beyond this
+
+# --- Model Loading ---
+# Models load lazily on first use; with preloading they are warmed on a background thread when the app starts serving.
+# Listing models in READINESS_REQUIRED_MODELS also warms those models (only) in the background, even without preloading.
+MODEL_PRELOAD = os.getenv('BHARATVAANI_PRELOAD_MODELS', 'false').lower() in ('1', 'true', 'yes')
+READINESS_REQUIRED_MODELS = () # /readyz answers 503 until all of these are loaded, e.g. ("summarizer", "translator"); () = always ready
 
 # --- What If Scenario Models (OpenRouter.ai) ---
 WHAT_IF_MODELS = [
@@ -0,0 +1,122 @@
+# BharatVaani/core/analytics.py
+
+import heapq
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .utils import analyze_sentiment
+
+# Capitalized words and runs of them ("Narendra Modi", "New Delhi")
+ENTITY_PATTERN = re.compile(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)*\b')
+
+SENTIMENT_LABELS = ('Positive', 'Neutral', 'Negative', 'Unknown', 'Error')
+
+
+def extract_entities(text: str) -> List[str]:
+    """Named-entity candidates of a text, as counted by every analytics view."""
+    return ENTITY_PATTERN.findall(text or '')
+
+
+class _Contribution(NamedTuple):
+    category: str
+    label: str
+    entities: Counter
+
+
+class AnalyticsAggregator:
+    """
+    Category, sentiment and entity counts over a set of articles, kept up to date as articles
+    are added and removed instead of being recounted on every page render.
+    Each article's contribution is remembered by id, so removing it never re-reads its text.
+    """
+
+    def __init__(self):
+        self._contributions: Dict[str, _Contribution] = {}
+        self._categories: Counter = Counter()
+        self._sentiments: Counter = Counter()
+        self._entities: Counter = Counter()
+        self._top_entities: Optional[List[Tuple[str, int]]] = None  # Ranked lazily after a change
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _contribution(article: Dict) -> _Contribution:
+        sentiment = article.get('sentiment_data') or analyze_sentiment(article.get('summary', ''))
+        return _Contribution(
+            category=article.get('category', 'Uncategorized'),
+            label=sentiment.get('label', 'Unknown'),
+            entities=Counter(extract_entities(article.get('summary', ''))),
+        )
+
+    def _add_locked(self, article_id: str, contribution: _Contribution):
+        self._contributions[article_id] = contribution
+        self._categories[contribution.category] += 1
+        self._sentiments[contribution.label] += 1
+        self._entities.update(contribution.entities)
+
+    def _remove_locked(self, article_id: str):
+        contribution = self._contributions.pop(article_id)
+        for counter, key in ((self._categories, contribution.category), (self._sentiments, contribution.label)):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+        self._entities.subtract(contribution.entities)
+        for entity in contribution.entities:
+            if self._entities[entity] <= 0:
+                del self._entities[entity]
+
+    def add(self, article: Dict):
+        """Counts an article; re-adding a known id replaces its previous contribution."""
+        contribution = self._contribution(article)
+        with self._lock:
+            if article['id'] in self._contributions:
+                self._remove_locked(article['id'])
+            self._add_locked(article['id'], contribution)
+            self._top_entities = None
+
+    def remove(self, article_id: str):
+        with self._lock:
+            if article_id in self._contributions:
+                self._remove_locked(article_id)
+                self._top_entities = None
+
+    def sync(self, articles: Iterable[Dict]):
+        """Makes the counted set equal to `articles`: only ids that appeared or disappeared are processed."""
+        current = {article['id']: article for article in articles}
+        with self._lock:
+            added = [article for article_id, article in current.items() if article_id not in self._contributions]
+            removed = [article_id for article_id in self._contributions if article_id not in current]
+        contributions = [(article['id'], self._contribution(article)) for article in added]
+        with self._lock:
+            for article_id in removed:
+                if article_id in self._contributions:
+                    self._remove_locked(article_id)
+            for article_id, contribution in contributions:
+                if article_id in self._contributions:
+                    self._remove_locked(article_id)
+                self._add_locked(article_id, contribution)
+            if added or removed:
+                self._top_entities = None
+
+    def top_entities(self, k: int = 10) -> List[Tuple[str, int]]:
+        with self._lock:
+            if self._top_entities is None or len(self._top_entities) < k <= len(self._entities):
+                self._top_entities = heapq.nlargest(max(k, 10), self._entities.items(), key=lambda item: item[1])
+            return self._top_entities[:k]
+
+    def summary(self, top_k: int = 10) -> Dict:
+        """Counts in the shape the templates expect (every sentiment label present, even at zero)."""
+        top_entities = self.top_entities(top_k)
+        with self._lock:
+            sentiments = dict.fromkeys(SENTIMENT_LABELS, 0)
+            sentiments.update(self._sentiments)
+            return {
+                'total_articles': len(self._contributions),
+                'categories_count': dict(self._categories),
+                'sentiments_count': sentiments,
+                'top_entities': top_entities,
+            }
+
+    def __len__(self) -> int:
+        return len(self._contributions)
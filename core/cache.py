@@ -0,0 +1,162 @@
+# BharatVaani/core/cache.py
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Every TieredCache registers itself here so their counters can be reported together
+_registry: List["TieredCache"] = []
+
+
+class LRUCache:
+    """Thread-safe, bounded least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteKVStore:
+    """
+    Small persistent key/value table (JSON values) in a shared SQLite file.
+    Bounded: once it holds more than `max_entries` rows, the oldest writes are pruned.
+    """
+
+    _PRUNE_EVERY = 500  # Writes between two prune checks
+
+    def __init__(self, path: str, table: str, max_entries: int):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Any):
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            # REPLACE gives the row a new rowid, so rowid order is write order for pruning
+            self._conn.execute(f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", (key, payload))
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE rowid <= "
+                    f"(SELECT MAX(rowid) FROM {self.table}) - ?", (self.max_entries,))
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class TieredCache:
+    """
+    In-memory LRU in front of an optional SQLite layer that survives restarts.
+    Disk hits are promoted into memory. Values must be JSON-serializable when persisted.
+    """
+
+    def __init__(self, name: str, max_entries: int, db_path: Optional[str] = None, max_disk_entries: int = 100_000):
+        self.name = name
+        self.memory = LRUCache(max_entries)
+        self.disk = None
+        if db_path:
+            try:
+                self.disk = SQLiteKVStore(db_path, f"cache_{name}", max_disk_entries)
+            except sqlite3.Error as e:
+                logging.error(f"Could not open on-disk cache '{name}' at {db_path}: {e}. Using memory only.")
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0  # Compute time that hits avoided, as reported by the caller via credit()
+        _registry.append(self)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        if self.disk is not None:
+            try:
+                value = self.disk.get(key)
+            except sqlite3.Error as e:
+                logging.warning(f"On-disk cache '{self.name}' read failed: {e}")
+                value = None
+            if value is not None:
+                self.disk_hits += 1
+                self.memory.put(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Any):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.put(key, value)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logging.warning(f"On-disk cache '{self.name}' write failed: {e}")
+
+    def credit(self, seconds: float):
+        """Records that a hit saved `seconds` of work (the recorded cost of computing the value)."""
+        self.saved_seconds += seconds
+
+    def stats(self) -> Dict:
+        lookups = self.memory.hits + self.disk_hits + self.misses
+        return {
+            'memory_entries': len(self.memory),
+            'memory_max_entries': self.memory.max_entries,
+            'memory_hits': self.memory.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.memory.evictions,
+            'hit_ratio': round((self.memory.hits + self.disk_hits) / lookups, 4) if lookups else None,
+            'persistent': self.disk is not None,
+            'saved_seconds': round(self.saved_seconds, 2),
+        }
+
+
+def cache_stats() -> Dict[str, Dict]:
+    """Counters of every tiered cache in the process, keyed by cache name."""
+    return {cache.name: cache.stats() for cache in _registry}
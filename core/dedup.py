@@ -0,0 +1,85 @@
+# BharatVaani/core/dedup.py
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import DEDUP_MAX_HAMMING, DEDUP_MIN_TOKENS
+
+FINGERPRINT_BITS = 64
+
+# Word characters plus Indic and Arabic-script blocks, whose vowel signs \w alone would split words on
+_TOKEN_PATTERN = re.compile(r"[\w\u0600-\u06ff\u0900-\u0dff]+")
+_STOPWORDS = frozenset(
+    "a an the and or of to in on at for from by with as is are was were be been has have had it its this that "
+    "after over into says said will would not but".split()
+)
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of a text over word unigrams and bigrams.
+    Near-identical texts get fingerprints that differ in only a few bits.
+    Returns None when the text is too short to fingerprint reliably.
+    """
+    tokens = _tokens(text)
+    if len(tokens) < DEDUP_MIN_TOKENS:
+        return None
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    # A bit is set when most feature hashes have it set. Counting over the columns of the hashes'
+    # binary strings keeps the per-bit work in C instead of a 64-step Python loop per feature.
+    rows = [format(_hash64(feature), "064b") for feature in features]
+    majority = len(rows) / 2
+    return int("".join("1" if column.count("1") > majority else "0" for column in zip(*rows)), 2)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicateIndex:
+    """
+    Finds stored fingerprints within `max_distance` bits of a query without comparing against all of them.
+    Fingerprints are split into max_distance + 1 bands: by the pigeonhole principle, two fingerprints that
+    differ in at most max_distance bits agree exactly on at least one band, so only entries that share a
+    band with the query are compared.
+    """
+
+    def __init__(self, max_distance: int = DEDUP_MAX_HAMMING):
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        widths = [FINGERPRINT_BITS // band_count + (1 if i < FINGERPRINT_BITS % band_count else 0)
+                  for i in range(band_count)]
+        self._bands: List[Tuple[int, int]] = []  # (shift, mask)
+        shift = 0
+        for width in widths:
+            self._bands.append((shift, (1 << width) - 1))
+            shift += width
+        self._tables: List[Dict[int, List[Tuple[int, Any]]]] = [{} for _ in self._bands]
+
+    def _band_values(self, fingerprint: int):
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            yield table, (fingerprint >> shift) & mask
+
+    def find(self, fingerprint: int) -> Optional[Any]:
+        """Returns the payload of the closest stored fingerprint within max_distance, if any."""
+        best, best_distance = None, self.max_distance + 1
+        for table, value in self._band_values(fingerprint):
+            for candidate, payload in table.get(value, ()):
+                distance = hamming_distance(fingerprint, candidate)
+                if distance < best_distance:
+                    best, best_distance = payload, distance
+        return best
+
+    def add(self, fingerprint: int, payload: Any):
+        for table, value in self._band_values(fingerprint):
+            table.setdefault(value, []).append((fingerprint, payload))
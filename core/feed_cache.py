@@ -0,0 +1,95 @@
+# BharatVaani/core/feed_cache.py
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.settings import FEED_CACHE_FILE
+
+
+class FeedCache:
+    """
+    Persistent per-feed HTTP validator cache.
+    Stores the ETag / Last-Modified headers of each feed together with the entries parsed from
+    the last full response, so a 304 Not Modified can be answered without re-parsing anything.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._feeds = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.error(f"Error loading feed cache from {self.path}: {e}. Starting with an empty cache.")
+            return {}
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Returns the cached record ({etag, last_modified, entries, ...}) for a feed, if any."""
+        with self._lock:
+            return self._feeds.get(url)
+
+    def conditional_headers(self, url: str, limit: Optional[int] = None) -> Dict[str, str]:
+        """
+        Builds If-None-Match / If-Modified-Since headers for a feed we have already seen.
+        No headers are sent if the cached parse stopped early with fewer entries than `limit` needs,
+        since a 304 would leave us without enough entries to reuse.
+        """
+        cached = self.get(url)
+        headers = {}
+        parse_limit = cached.get("parse_limit") if cached else None
+        if parse_limit is not None and (limit is None or limit > parse_limit):
+            return headers
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], entries: List[Dict],
+              parse_limit: Optional[int] = None):
+        """
+        Remembers the validators and parsed entries of a full (200) response.
+        `parse_limit` is set when the parser stopped early after that many usable entries.
+        """
+        if not etag and not last_modified:
+            return  # Publisher doesn't support conditional requests, nothing to revalidate with
+        with self._lock:
+            self._feeds[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "entries": entries,
+                "parse_limit": parse_limit,
+                "stored_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._dirty = True
+
+    def save(self):
+        """Writes the cache to disk if it changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.dumps(self._feeds, ensure_ascii=False)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.path)  # Atomic swap so readers never see a half-written file
+        except Exception as e:
+            logging.error(f"Error saving feed cache to {self.path}: {e}")
+
+
+# Process-wide feed cache instance
+feed_cache = FeedCache(FEED_CACHE_FILE)
@@ -0,0 +1,137 @@
+# BharatVaani/core/feed_health.py
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional
+
+from config.settings import (
+    FEED_FETCH_TIMEOUT, FEED_HEALTH_WINDOW, FEED_HEALTH_MIN_SAMPLES, FEED_TIMEOUT_MIN, FEED_TIMEOUT_P95_MULTIPLIER,
+    FEED_CIRCUIT_FAILURE_THRESHOLD, FEED_CIRCUIT_COOLDOWN_SECONDS, FEED_CIRCUIT_MAX_COOLDOWN_SECONDS
+)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+def _percentile(sorted_values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class _FeedState:
+    def __init__(self):
+        self.latencies = deque(maxlen=FEED_HEALTH_WINDOW)  # Seconds, successful requests only
+        self.state = CLOSED
+        self.failure_streak = 0
+        self.times_opened = 0  # Consecutive openings, drives the exponential cool-down
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self.successes = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_error = None
+        self.last_success_at = None
+        self.last_failure_at = None
+
+
+class FeedHealthTracker:
+    """
+    Tracks latency and failures per feed URL.
+    A feed that fails FEED_CIRCUIT_FAILURE_THRESHOLD times in a row is skipped ("circuit open")
+    for a cool-down that doubles on every re-opening; afterwards a single probe request decides
+    whether it is closed again. Request timeouts are derived from each feed's own p95 latency.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, _FeedState] = {}
+
+    def _get(self, url: str) -> _FeedState:
+        state = self._feeds.get(url)
+        if state is None:
+            state = self._feeds[url] = _FeedState()
+        return state
+
+    def allow_request(self, url: str) -> bool:
+        """Returns False while a feed's circuit is open; lets one probe through once the cool-down ends."""
+        with self._lock:
+            feed = self._get(url)
+            if feed.state == CLOSED:
+                return True
+            if feed.state == OPEN and time.monotonic() >= feed.open_until:
+                feed.state = HALF_OPEN
+            if feed.state == HALF_OPEN and not feed.probe_in_flight:
+                feed.probe_in_flight = True
+                return True
+            feed.skipped += 1
+            return False
+
+    def timeout_for(self, url: str) -> float:
+        """Per-feed timeout: p95 latency x FEED_TIMEOUT_P95_MULTIPLIER, within [FEED_TIMEOUT_MIN, FEED_FETCH_TIMEOUT]."""
+        with self._lock:
+            feed = self._feeds.get(url)
+            if feed is None or len(feed.latencies) < FEED_HEALTH_MIN_SAMPLES:
+                return FEED_FETCH_TIMEOUT
+            p95 = _percentile(sorted(feed.latencies), 95)
+        return max(FEED_TIMEOUT_MIN, min(FEED_FETCH_TIMEOUT, p95 * FEED_TIMEOUT_P95_MULTIPLIER))
+
+    def record_success(self, url: str, latency: float):
+        with self._lock:
+            feed = self._get(url)
+            feed.latencies.append(latency)
+            feed.successes += 1
+            feed.failure_streak = 0
+            feed.times_opened = 0
+            feed.state = CLOSED
+            feed.probe_in_flight = False
+            feed.last_success_at = datetime.now()
+
+    def record_failure(self, url: str, error: str = ""):
+        with self._lock:
+            feed = self._get(url)
+            feed.failures += 1
+            feed.failure_streak += 1
+            feed.last_error = error[:300]
+            feed.last_failure_at = datetime.now()
+            probe_failed = feed.state == HALF_OPEN
+            feed.probe_in_flight = False
+            if probe_failed or feed.failure_streak >= FEED_CIRCUIT_FAILURE_THRESHOLD:
+                feed.times_opened += 1
+                cooldown = min(FEED_CIRCUIT_MAX_COOLDOWN_SECONDS,
+                               FEED_CIRCUIT_COOLDOWN_SECONDS * 2 ** (feed.times_opened - 1))
+                feed.state = OPEN
+                feed.open_until = time.monotonic() + cooldown
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """JSON-friendly health report for every feed seen so far."""
+        now = time.monotonic()
+        report = {}
+        with self._lock:
+            for url, feed in self._feeds.items():
+                latencies = sorted(feed.latencies)
+                report[url] = {
+                    'state': feed.state,
+                    'failure_streak': feed.failure_streak,
+                    'successes': feed.successes,
+                    'failures': feed.failures,
+                    'skipped': feed.skipped,
+                    'reopen_in_seconds': round(max(0.0, feed.open_until - now), 1) if feed.state == OPEN else 0,
+                    'latency_p50': _percentile(latencies, 50),
+                    'latency_p95': _percentile(latencies, 95),
+                    'latency_p99': _percentile(latencies, 99),
+                    'samples': len(latencies),
+                    'last_error': feed.last_error,
+                    'last_success_at': feed.last_success_at.isoformat(timespec="seconds") if feed.last_success_at else None,
+                    'last_failure_at': feed.last_failure_at.isoformat(timespec="seconds") if feed.last_failure_at else None,
+                }
+        for url in report:
+            report[url]['timeout'] = self.timeout_for(url)
+        return report
+
+
+# Process-wide feed health tracker
+feed_health = FeedHealthTracker()
@@ -0,0 +1,241 @@
+# BharatVaani/core/feed_parser.py
+
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from html import escape
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+# XML namespaces used by the feeds we ingest
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+MEDIA_NAMESPACES = ("{http://search.yahoo.com/mrss/}", "{http://search.yahoo.com/mrss}")
+
+CHUNK_SIZE = 16 * 1024  # Bytes fed to the pull parser at a time
+
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)')
+
+
+class UnsupportedFeedError(Exception):
+    """Raised when a body isn't well-formed RSS 2.0 / RSS 1.0 / Atom; callers fall back to feedparser."""
+
+
+XHTML_NS = "{http://www.w3.org/1999/xhtml}"
+
+
+def _text(elem) -> str:
+    return (elem.text or "") if elem is not None else ""
+
+
+def _local_name(name: str) -> str:
+    return name.rsplit("}", 1)[-1]
+
+
+def _serialize_children(elem) -> str:
+    """Markup inside `elem` (its text and child elements), with namespace prefixes dropped."""
+    parts = [escape(elem.text or "", quote=False)]
+    for child in elem:
+        tag = _local_name(child.tag)
+        attrs = "".join(f' {_local_name(k)}="{escape(v)}"' for k, v in child.attrib.items())
+        inner = _serialize_children(child)
+        parts.append(f"<{tag}{attrs}>{inner}</{tag}>" if inner or len(child) else f"<{tag}{attrs} />")
+        parts.append(escape(child.tail or "", quote=False))
+    return "".join(parts)
+
+
+def _atom_text(elem) -> str:
+    """Text of an Atom text construct; type="xhtml" markup is serialized as feedparser does (without the wrapper <div>)."""
+    if elem is None or elem.get("type") != "xhtml":
+        return _text(elem)
+    children = list(elem)
+    if len(children) == 1 and children[0].tag == f"{XHTML_NS}div" and not (elem.text or "").strip():
+        elem = children[0]
+    return _serialize_children(elem)
+
+
+def _parse_date(value: str) -> Optional[List[int]]:
+    """Parses RFC 822 (RSS) or ISO 8601 (Atom) dates into a UTC [Y, M, D, h, m, s] list, like feedparser."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return [dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second]
+
+
+def _iter_media(item, name: str) -> List:
+    return [elem for ns in MEDIA_NAMESPACES for elem in item.iter(f"{ns}{name}")]
+
+
+def _extract_image(item, content: str, summary: str, has_links: bool, base_url: str) -> Optional[str]:
+    """
+    Mirrors fetcher.extract_image_from_rss branch for branch: thumbnails, media content, enclosures, then inline
+    <img>. feedparser gives an entry `enclosures` whenever it has any link (a <link> or an enclosure), and then
+    the enclosure branch is taken even when it finds no image, so the inline <img> fallback is only reached
+    for entries without links.
+    """
+    thumbnails = _iter_media(item, "thumbnail")
+    media = _iter_media(item, "content")
+
+    image_url = None
+    if thumbnails:
+        image_url = thumbnails[0].get("url")
+    elif media:
+        for m in media:
+            if m.get("medium") == "image":
+                image_url = m.get("url")
+                break
+    elif has_links:
+        enclosures = [(e.get("url"), e.get("type")) for e in item.iter("enclosure")]
+        enclosures += [(l.get("href"), l.get("type")) for l in item.iter(f"{ATOM_NS}link")
+                       if l.get("rel") == "enclosure"]
+        for href, mime in enclosures:
+            if mime and "image" in mime:
+                image_url = href
+                break
+    elif content or summary:
+        match = _IMG_SRC_RE.search(content or summary)
+        if match:
+            image_url = match.group(1)
+
+    if image_url and not image_url.startswith("http") and base_url:
+        image_url = urljoin(base_url, image_url)
+    return image_url
+
+
+def _has_links(item, ns: str) -> bool:
+    """Whether feedparser would give this RSS item any links: a <link> element or an enclosure."""
+    return (item.find(f"{ns}link") is not None or item.find("enclosure") is not None
+            or item.find(f"{ATOM_NS}link") is not None)
+
+
+def _rss_link(item, ns: str) -> str:
+    """The item's <link>, else its <guid> when that is a permalink (isPermaLink absent or "true"), as in feedparser."""
+    link = item.find(f"{ns}link")
+    if link is not None:
+        return _text(link).strip()
+    guid = item.find("guid")
+    if guid is not None and guid.get("isPermaLink", "true") == "true":
+        return _text(guid).strip()
+    return ""
+
+
+def _rss_entry(item, ns: str, base_url: str) -> Dict:
+    """Builds a normalized entry record from an RSS 2.0 (ns="") or RSS 1.0 item."""
+    summary = _text(item.find(f"{ns}description"))
+    content = _text(item.find(f"{CONTENT_NS}encoded"))
+    published = _text(item.find("pubDate"))
+    source = item.find("source")
+    return {
+        'id': _text(item.find("guid")) or item.get(f"{RDF_NS}about") or None,
+        'title': _text(item.find(f"{ns}title")),
+        'summary': summary or content,
+        'content': content,
+        'link': _rss_link(item, ns),
+        'published': published,
+        'published_parsed': _parse_date(published),
+        'source_title': (_text(source) or None) if source is not None else None,
+        'image_url': _extract_image(item, content, summary, _has_links(item, ns), base_url),
+    }
+
+
+def _atom_entry(entry, base_url: str) -> Dict:
+    """Builds a normalized entry record from an Atom <entry>."""
+    link = ""
+    for l in entry.findall(f"{ATOM_NS}link"):
+        if l.get("rel", "alternate") == "alternate":
+            link = l.get("href", "")
+            break
+    summary = _atom_text(entry.find(f"{ATOM_NS}summary"))
+    content = _atom_text(entry.find(f"{ATOM_NS}content"))
+    published_elem = entry.find(f"{ATOM_NS}published")
+    if published_elem is None:
+        published_elem = entry.find(f"{ATOM_NS}issued")
+    published = _text(published_elem)
+    source = entry.find(f"{ATOM_NS}source")
+    return {
+        'id': _text(entry.find(f"{ATOM_NS}id")) or None,
+        'title': _atom_text(entry.find(f"{ATOM_NS}title")),
+        'summary': summary or content,
+        'content': content,
+        'link': link.strip(),
+        'published': published,
+        'published_parsed': _parse_date(published),
+        'source_title': (_text(source.find(f"{ATOM_NS}title")) or None) if source is not None else None,
+        'image_url': _extract_image(entry, content, summary, entry.find(f"{ATOM_NS}link") is not None, base_url),
+    }
+
+
+def _is_usable(record: Dict, cutoff: datetime) -> bool:
+    """Cheap pre-check of what fetcher._collect_articles will keep, used for early termination."""
+    if not record['link'] or len(record['title'].strip()) < 10:
+        return False
+    if not record['summary'].strip() and not record['content'].strip():
+        return False
+    if record['published_parsed'] and datetime(*record['published_parsed']) < cutoff:
+        return False
+    return True
+
+
+def iter_feed_entries(body: bytes, base_url: str = "") -> Iterator[Dict]:
+    """
+    Incrementally parses an RSS 2.0, RSS 1.0 (RDF) or Atom document, yielding one normalized
+    entry record per item as soon as its closing tag has been read.
+    Raises UnsupportedFeedError for anything else, or for XML the strict parser rejects.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    item_tag = None
+    depth = 0
+    try:
+        for offset in range(0, len(body), CHUNK_SIZE):
+            parser.feed(body[offset:offset + CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if depth == 0:
+                        if elem.tag == "rss":
+                            item_tag, build = "item", lambda e: _rss_entry(e, "", base_url)
+                        elif elem.tag == f"{RDF_NS}RDF":
+                            item_tag, build = f"{RSS1_NS}item", lambda e: _rss_entry(e, RSS1_NS, base_url)
+                        elif elem.tag == f"{ATOM_NS}feed":
+                            item_tag, build = f"{ATOM_NS}entry", lambda e: _atom_entry(e, base_url)
+                        else:
+                            raise UnsupportedFeedError(f"Unsupported feed root element: {elem.tag}")
+                    depth += 1
+                else:
+                    depth -= 1
+                    if elem.tag == item_tag:
+                        yield build(elem)
+                        elem.clear()  # Keep memory flat for large feeds
+        parser.close()
+    except ParseError as e:
+        raise UnsupportedFeedError(f"Feed is not well-formed XML: {e}") from e
+    if item_tag is None:
+        raise UnsupportedFeedError("Empty feed body")
+
+
+def parse_feed(body: bytes, base_url: str = "", limit: Optional[int] = None,
+               max_age: timedelta = timedelta(days=7)) -> List[Dict]:
+    """
+    Parses a feed and stops reading as soon as `limit` usable entries (fresh, titled, with text)
+    have been seen. Older/unusable entries are still returned so results match a full parse.
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - max_age
+    entries, usable = [], 0
+    for record in iter_feed_entries(body, base_url):
+        entries.append(record)
+        if limit is not None and _is_usable(record, cutoff):
+            usable += 1
+            if usable >= limit:
+                break
+    return entries
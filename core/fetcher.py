@@ -3,20 +3,30 @@
 import requests
 from datetime import datetime, timedelta
 import feedparser  # New import for RSS parsing
-from requests.adapters import HTTPAdapter  # For retries
-from urllib3.util.retry import Retry  # For retries
 import re
+import time
 import io  # For image thumbnail processing
 from PIL import Image  # For image thumbnail processing
 import base64  # For image thumbnail encoding
 from urllib.parse import urljoin, urlparse  # For URL handling
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, wait  # For concurrent feed downloads
+from typing import List, Dict, Optional
 import logging
 
 # Import from your config and utils
 from config.settings import CATEGORY_KEYWORDS, RSS_FEEDS  # Now importing RSS_FEEDS
-from .utils import clean_text, get_hash_key, analyze_sentiment  # Ensure these are correctly imported
+from config.settings import (
+    FEED_FETCH_CONCURRENT, FEED_FETCH_MAX_WORKERS, FEED_FETCH_TIMEOUT, FEED_FETCH_DEADLINE, FEED_CACHE_ENABLED,
+    FEED_FAST_PARSER, FEED_CIRCUIT_BREAKER_ENABLED, DEDUP_ENABLED
+)
+from .utils import clean_texts, get_hash_key, analyze_sentiment, analyze_sentiment_batch  # Ensure these are correctly imported
+from .dedup import NearDuplicateIndex, simhash
+from .feed_cache import feed_cache
+from .feed_health import feed_health
+from .feed_parser import parse_feed, UnsupportedFeedError
+from .keyword_matcher import get_keyword_matcher
+from .http_client import get_http_session
 
 # Configure logging for this module
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -25,13 +35,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # --- Helper Functions for RSS Fetching ---
 
 def create_session():
-    """Creates a requests session with retry strategy."""
-    session = requests.Session()
-    retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+    """Returns the shared, pooled requests session (with retry strategy) used for all feed traffic."""
+    return get_http_session()
 
 
 def extract_image_from_rss(entry, base_url=""):
@@ -80,7 +85,7 @@ def get_image_thumbnail(image_url, size=(150, 100)):
     try:
         if not image_url:
             return None
-        response = requests.get(image_url, timeout=10, stream=True)
+        response = get_http_session().get(image_url, timeout=10)
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
 
         img = Image.open(io.BytesIO(response.content))
@@ -99,88 +104,242 @@ def get_image_thumbnail(image_url, size=(150, 100)):
 
 # --- Main News Fetching Function (now using RSS) ---
 
-def fetch_top_headlines(category: str = "general", country: str = "in", page_size: int = 20,
-                        selected_scope: str = "India News") -> List[Dict]:
+def _normalize_entry(entry, base_url: str) -> Dict:
     """
-    Fetches news from RSS feeds based on selected scope. Ensures articles have valid summary/content.
+    Flattens a feedparser entry into a plain, JSON-serializable record holding the raw fields
+    the fetcher needs. Records are what gets stored in the conditional-GET feed cache.
     """
-    news = []
-    seen_ids = set()
-    session = create_session()
-    feeds_to_fetch = RSS_FEEDS.get(selected_scope, RSS_FEEDS["India News"])  # fallback to default if missing
+    content = ''
+    if hasattr(entry, 'content') and entry.content and isinstance(entry.content, list):
+        content = entry.content[0].get('value', '')
+    published_parsed = getattr(entry, 'published_parsed', None)
+    return {
+        'id': getattr(entry, 'id', getattr(entry, 'guid', None)),
+        'title': getattr(entry, 'title', ''),
+        'summary': getattr(entry, 'summary', ''),
+        'content': content,
+        'link': getattr(entry, 'link', ''),
+        'published': getattr(entry, 'published', ''),
+        'published_parsed': list(published_parsed[:6]) if published_parsed else None,
+        'source_title': getattr(entry, 'source', {}).get('title'),
+        'image_url': extract_image_from_rss(entry, base_url),
+    }
+
+
+def _parse_feed_entries(body: bytes, url: str, limit: Optional[int] = None) -> List[Dict]:
+    """
+    Parses a feed body into normalized entry records. Uses the streaming parser (which stops after
+    `limit` usable entries) and falls back to feedparser for feeds it can't handle.
+    """
+    base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+    if FEED_FAST_PARSER:
+        try:
+            return parse_feed(body, base_url, limit=limit)
+        except UnsupportedFeedError as e:
+            logging.debug(f"Fast parser can't handle {url} ({e}); falling back to feedparser.")
+    parsed = feedparser.parse(body)
+    return [_normalize_entry(entry, base_url) for entry in parsed.entries]
 
-    logging.info(f"Attempting to fetch news from RSS feeds for scope: {selected_scope}")
 
-    for url in feeds_to_fetch:
-        try:
-            logging.info(f"Fetching from RSS feed: {url}")
-            response = session.get(url, timeout=15)
-            response.raise_for_status()
-            parsed = feedparser.parse(response.content)
+def _fetch_feed_entries(session, url: str, timeout: float, limit: Optional[int] = None) -> List[Dict]:
+    """
+    Downloads and parses a single RSS feed. Sends If-None-Match / If-Modified-Since when the
+    feed is in the cache, and reuses the cached entries on a 304 without parsing anything.
+    Feeds whose circuit is open are skipped; the others get a timeout adapted to their own p95 latency.
+    """
+    if FEED_CIRCUIT_BREAKER_ENABLED:
+        if not feed_health.allow_request(url):
+            logging.info(f"Skipping RSS feed {url}: circuit open after repeated failures.")
+            return []
+        timeout = min(timeout, feed_health.timeout_for(url))
+
+    headers = feed_cache.conditional_headers(url, limit) if FEED_CACHE_ENABLED else {}
+    logging.info(f"Fetching from RSS feed: {url} (timeout {timeout:.1f}s)")
+    start = time.perf_counter()
+    try:
+        response = session.get(url, timeout=timeout, headers=headers)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        if FEED_CIRCUIT_BREAKER_ENABLED:
+            feed_health.record_failure(url, str(e))
+        raise
+    if FEED_CIRCUIT_BREAKER_ENABLED:
+        feed_health.record_success(url, time.perf_counter() - start)
+
+    if response.status_code == 304 and headers:
+        cached = feed_cache.get(url)
+        if cached is not None:
+            logging.info(f"RSS feed not modified, reusing cached entries: {url}")
+            return cached['entries']
+
+    entries = _parse_feed_entries(response.content, url, limit)
+    if FEED_CACHE_ENABLED:
+        feed_cache.store(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), entries,
+                         parse_limit=limit)
+    return entries
+
+
+def _fetch_feeds_concurrently(session, urls: List[str], timeout: float, deadline: float,
+                              limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+    """
+    Fetches feeds on a bounded worker pool and returns {url: entries} for every feed
+    that finished before the deadline. Slow feeds are abandoned, not waited for.
+    """
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(FEED_FETCH_MAX_WORKERS, len(urls))))
+    futures = {executor.submit(_fetch_feed_entries, session, url, timeout, limit): url for url in urls}
+    try:
+        done, not_done = wait(futures, timeout=deadline)
+        for future in done:
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Network error fetching from RSS feed {url}: {e}")
+            except Exception as e:
+                logging.error(f"Unexpected error during fetch from {url}: {e}", exc_info=True)
+        for future in not_done:
+            logging.warning(f"Deadline of {deadline}s exceeded, skipping RSS feed {futures[future]}")
+    finally:
+        # Don't block on feeds that are still downloading
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _cleaned_entries(entries: List[Dict], slots_left):
+    """
+    Yields (entry, (title, summary, content)) with the text fields cleaned in batches.
+    Each batch is sized to the page slots still open (`slots_left()`), so entries the caller
+    never gets to are never cleaned.
+    """
+    position = 0
+    while position < len(entries):
+        batch = entries[position:position + max(1, slots_left())]
+        position += len(batch)
+        cleaned = clean_texts([entry[field] for entry in batch for field in ('title', 'summary', 'content')])
+        for i, entry in enumerate(batch):
+            yield entry, cleaned[3 * i:3 * i + 3]
 
-            base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
 
-            for entry in parsed.entries:
-                if len(news) >= page_size:
-                    break
+def _collect_articles(entries: List[Dict], url: str, news: List[Dict], seen_ids: set, page_size: int,
+                      near_duplicates: Optional[NearDuplicateIndex] = None):
+    """
+    Turns normalized feed entries into articles, appending new, valid ones to `news` (up to page_size).
+    With a `near_duplicates` index, copies of a story already collected from another feed are not added;
+    they are recorded in the kept article's 'alternate_sources' instead.
+    """
+    for entry, (title, summary, content) in _cleaned_entries(entries, lambda: page_size - len(news)):
+        if len(news) >= page_size:
+            break
 
-                title = clean_text(getattr(entry, 'title', '')).strip()
-                summary = clean_text(getattr(entry, 'summary', '')).strip()
-                content = ''
-                if hasattr(entry, 'content') and entry.content and isinstance(entry.content, list):
-                    content = clean_text(entry.content[0].get('value', '')).strip()
+        link = (entry['link'] or '').strip()
 
-                link = getattr(entry, 'link', '').strip()
+        if not title or not link or len(title) < 10:
+            continue
 
-                if not title or not link or len(title) < 10:
-                    continue
+        # Skip articles missing both content and summary
+        if not summary and not content:
+            logging.debug(f"Skipping article with title '{title}' due to missing content and summary.")
+            continue
 
-                # Skip articles missing both content and summary
-                if not summary and not content:
-                    logging.debug(f"Skipping article with title '{title}' due to missing content and summary.")
-                    continue
+        # Use summary or content (whichever is available)
+        main_text = summary if summary else content
 
-                # Use summary or content (whichever is available)
-                main_text = summary if summary else content
+        dedup_id = entry['id'] or link or (title + entry['published'])
+        dedup_id = get_hash_key(dedup_id)
 
-                dedup_id = getattr(entry, 'id', getattr(entry, 'guid', None)) or link or (title + getattr(entry, 'published', ''))
-                dedup_id = get_hash_key(dedup_id)
+        if dedup_id in seen_ids:
+            continue
+        seen_ids.add(dedup_id)
 
-                if dedup_id in seen_ids:
+        published_date = "Unknown"
+        try:
+            if entry['published_parsed']:
+                pub_dt = datetime(*entry['published_parsed'][:6])
+                if datetime.now() - pub_dt > timedelta(days=7):
                     continue
-                seen_ids.add(dedup_id)
-
-                published_date = "Unknown"
-                try:
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_dt = datetime(*entry.published_parsed[:6])
-                        if datetime.now() - pub_dt > timedelta(days=7):
-                            continue
-                        published_date = pub_dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    pass
-
-                full_text_for_ai = f"{title}. {main_text}"
-
-                article_data = {
-                    'id': dedup_id,
-                    'title': title,
-                    'summary': summary,
-                    'content': content,
-                    'url': link,
-                    'published': published_date,
-                    'source': getattr(entry, 'source', {}).get('title', urlparse(url).netloc.replace('www.', '')),
-                    'image_url': extract_image_from_rss(entry, base_url),
-                    'sentiment_data': analyze_sentiment(full_text_for_ai),
-                    'full_text_for_ai': full_text_for_ai
-                }
-
-                news.append(article_data)
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Network error fetching from RSS feed {url}: {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error during fetch from {url}: {e}", exc_info=True)
+                published_date = pub_dt.strftime("%Y-%m-%d %H:%M")
+        except Exception:
+            pass
+
+        source = entry['source_title'] or urlparse(url).netloc.replace('www.', '')
+
+        # The summary alone: outlets rewrite wire headlines ("PTI: ...", "..., says MEA") far more than the text
+        fingerprint = simhash(main_text) if near_duplicates is not None else None
+        if fingerprint is not None:
+            original = near_duplicates.find(fingerprint)
+            if original is not None:
+                original['alternate_sources'].append({'source': source, 'url': link, 'title': title})
+                logging.debug(f"Near-duplicate of '{original['title']}' dropped: '{title}' ({source})")
+                continue
+
+        full_text_for_ai = f"{title}. {main_text}"
+
+        article_data = {
+            'id': dedup_id,
+            'title': title,
+            'summary': summary,
+            'content': content,
+            'url': link,
+            'published': published_date,
+            'source': source,
+            'image_url': entry['image_url'],
+            'full_text_for_ai': full_text_for_ai,
+            'alternate_sources': []
+        }
+
+        news.append(article_data)
+        if fingerprint is not None:
+            near_duplicates.add(fingerprint, article_data)
+
+
+def fetch_top_headlines(category: str = "general", country: str = "in", page_size: int = 20,
+                        selected_scope: str = "India News", concurrent: Optional[bool] = None,
+                        analyze: bool = True) -> List[Dict]:
+    """
+    Fetches news from RSS feeds based on selected scope. Ensures articles have valid summary/content.
+    In concurrent mode (the default, see FEED_FETCH_CONCURRENT) all feeds are downloaded in parallel
+    under a global FEED_FETCH_DEADLINE; results are still merged in RSS_FEEDS order.
+    """
+    if concurrent is None:
+        concurrent = FEED_FETCH_CONCURRENT
+
+    news = []
+    seen_ids = set()
+    near_duplicates = NearDuplicateIndex() if DEDUP_ENABLED else None
+    session = create_session()
+    feeds_to_fetch = RSS_FEEDS.get(selected_scope, RSS_FEEDS["India News"])  # fallback to default if missing
+
+    logging.info(f"Attempting to fetch news from RSS feeds for scope: {selected_scope} "
+                 f"({'concurrent' if concurrent else 'sequential'})")
+
+    if concurrent:
+        feed_entries = _fetch_feeds_concurrently(session, feeds_to_fetch, FEED_FETCH_TIMEOUT, FEED_FETCH_DEADLINE,
+                                                 limit=page_size)
+        for url in feeds_to_fetch:  # Deterministic merge order, regardless of completion order
+            if url not in feed_entries:
+                continue
+            try:
+                _collect_articles(feed_entries[url], url, news, seen_ids, page_size, near_duplicates)
+            except Exception as e:
+                logging.error(f"Unexpected error while processing RSS feed {url}: {e}", exc_info=True)
+    else:
+        for url in feeds_to_fetch:
+            try:
+                entries = _fetch_feed_entries(session, url, FEED_FETCH_TIMEOUT, limit=page_size)
+                _collect_articles(entries, url, news, seen_ids, page_size, near_duplicates)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Network error fetching from RSS feed {url}: {e}")
+            except Exception as e:
+                logging.error(f"Unexpected error during fetch from {url}: {e}", exc_info=True)
+
+    # Sentiment for the whole page in one batch; the ingestion service passes analyze=False and enriches itself
+    if analyze:
+        for article, sentiment in zip(news, analyze_sentiment_batch([a['full_text_for_ai'] for a in news])):
+            article['sentiment_data'] = sentiment
+
+    if FEED_CACHE_ENABLED:
+        feed_cache.save()
 
     logging.info(f"Finished fetching RSS news. Total articles collected: {len(news)}")
     return news
@@ -189,17 +348,13 @@ def fetch_top_headlines(category: str = "general", country: str = "in", page_siz
 def assign_categories_to_articles(articles: List[Dict], category_keywords: Dict[str, List[str]]) -> List[Dict]:
     """
     Assigns categories and sentiment to articles based on provided keywords.
-    Modified to accept category_keywords as an argument.
+    The first category (in category_keywords order) with a keyword in the title or summary wins.
     """
+    matcher = get_keyword_matcher(category_keywords)
     for article in articles:
         # Category assignment
-        article['category'] = "Uncategorized"
         text_content = (article.get('title', '') + " " + article.get('summary', '')).lower()
-
-        for category, keywords in category_keywords.items(): # Use passed category_keywords
-            if any(keyword.lower() in text_content for keyword in keywords):
-                article['category'] = category
-                break
+        article['category'] = matcher.first_category(text_content) or "Uncategorized"
 
         # Sentiment analysis (already done in fetch_top_headlines, but keep for robustness)
         if 'sentiment_data' not in article:  # Ensure sentiment_data key is present
@@ -221,11 +376,11 @@ def categorize_news(news: List[Dict], category: str, category_keywords: Dict[str
         logging.warning(f"Category '{category}' not found in CATEGORY_KEYWORDS. Returning all news.")
         return news
 
-    keywords = category_keywords[category] # Use passed category_keywords
+    matcher = get_keyword_matcher(category_keywords)
     categorized = []
     for article in news:
         text_content = (article.get('title', '') + " " + article.get('summary', '')).lower()
-        if any(keyword.lower() in text_content for keyword in keywords):
+        if matcher.matches_category(text_content, category):
             categorized.append(article)
     return categorized
 
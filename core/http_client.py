@@ -0,0 +1,118 @@
+# BharatVaani/core/http_client.py
+
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK,
+    HTTP_RETRY_TOTAL, HTTP_RETRY_BACKOFF, HTTP_USER_AGENT
+)
+
+
+class _PoolStats:
+    """Thread-safe counters of connection checkouts vs. newly opened connections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.new_connections = 0
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+
+    def record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            checkouts, misses = self.checkouts, self.new_connections
+        hits = max(0, checkouts - misses)
+        return {
+            'requests': checkouts,
+            'hits': hits,  # Served on an already-open keep-alive connection
+            'misses': misses,  # Needed a new TCP (+TLS) handshake
+            'hit_ratio': round(hits / checkouts, 4) if checkouts else 0.0,
+        }
+
+
+_pool_stats = _PoolStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _get_conn(self, timeout=None):
+        _pool_stats.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        _pool_stats.record_new_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _get_conn(self, timeout=None):
+        _pool_stats.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        _pool_stats.record_new_connection()
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose per-host connection pools report reuse to the shared pool stats."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session. Connections are kept alive and pooled per host
+    (at most HTTP_POOL_MAXSIZE each), so repeated requests to the same publishers skip the
+    TCP/TLS handshake. The session never stores cookies, which keeps it safe to share between threads.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry_strategy = Retry(total=HTTP_RETRY_TOTAL, backoff_factor=HTTP_RETRY_BACKOFF,
+                                       status_forcelist=[429, 500, 502, 503, 504])
+                adapter = PooledHTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                                            pool_block=HTTP_POOL_BLOCK, max_retries=retry_strategy)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                session.headers.update({'User-Agent': HTTP_USER_AGENT, 'Connection': 'keep-alive'})
+                _session = session
+                logging.info(f"Shared HTTP session created (pool_connections={HTTP_POOL_CONNECTIONS}, "
+                             f"pool_maxsize={HTTP_POOL_MAXSIZE}, pool_block={HTTP_POOL_BLOCK}).")
+    return _session
+
+
+def get_pool_stats() -> Dict:
+    """Returns connection pool hit/miss counters for the shared session."""
+    stats = _pool_stats.snapshot()
+    stats.update({
+        'pool_connections': HTTP_POOL_CONNECTIONS,
+        'pool_maxsize': HTTP_POOL_MAXSIZE,
+        'pool_block': HTTP_POOL_BLOCK,
+    })
+    return stats
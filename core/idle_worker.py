@@ -0,0 +1,191 @@
+# BharatVaani/core/idle_worker.py
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+_TRACKED_KEYS = 20000  # Pre-computed results remembered for the hit-ratio stats
+
+
+def published_timestamp(article: Mapping) -> float:
+    """Sort key for recency: ingested articles carry 'published' as "%Y-%m-%d %H:%M" (or "Unknown", sorted last)."""
+    published = article.get('published')
+    if isinstance(published, datetime):
+        return published.timestamp()
+    try:
+        return datetime.strptime(published, "%Y-%m-%d %H:%M").timestamp()
+    except (TypeError, ValueError):
+        return float('-inf')
+
+
+class IdleWorker:
+    """
+    Base for background jobs that pre-compute results while the web app is idle (pre-summarizer,
+    pre-translator). Subclasses queue work with _push() and implement _process(batch).
+
+    - Pause-on-load: no work while requests are in flight, for `idle_seconds` after the last one, or while
+      the 1-minute load average per CPU is above `max_load`.
+    - CPU budget: after each batch the worker sleeps long enough that the CPU time the batch used stays under
+      `cpu_budget` of wall time. Measured for the whole process, since the models run on their own thread
+      pools (and the worker only runs when no requests are being served anyway).
+    - Hit ratio: subclasses mark what they pre-computed (_mark_precomputed) and report on-demand requests
+      (_record_request); stats() gives the share of requests that found their result pre-computed.
+    """
+
+    def __init__(self, name: str, cpu_budget: float, idle_seconds: float, max_load: float, batch_size: int,
+                 queue_size: int):
+        self.name = name
+        self.cpu_budget = min(max(cpu_budget, 0.01), 1.0)
+        self.idle_seconds = idle_seconds
+        self.max_load = max_load
+        self.batch_size = batch_size
+        self._queue: deque = deque(maxlen=queue_size)  # (key, item); oldest entries fall off when full
+        self._queued_keys = set()
+        self._precomputed: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._in_flight = 0
+        self._last_request = 0.0
+        self.stats_counters: Dict[str, Any] = {'queued': 0, 'batches': 0, 'pauses': 0, 'requests': 0,
+                                               'precomputed_hits': 0, 'busy_seconds': 0.0}
+
+    # --- Lifecycle ---
+
+    def start(self) -> bool:
+        """Starts the background worker. Safe to call repeatedly; True if this call started it."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    # --- Feeding (subclasses) ---
+
+    def _push(self, key: Hashable, item: Any) -> bool:
+        """Queues an item unless its key is already queued or pre-computed. Call with the lock held."""
+        if key in self._queued_keys or key in self._precomputed:
+            return False
+        if len(self._queue) == self._queue.maxlen:
+            self._queued_keys.discard(self._queue[0][0])
+        self._queue.append((key, item))
+        self._queued_keys.add(key)
+        self.stats_counters['queued'] += 1
+        return True
+
+    def _wake(self):
+        self._wake_event.set()
+
+    def _count(self, counter: str, amount: float = 1):
+        with self._lock:
+            self.stats_counters[counter] += amount
+
+    def _mark_precomputed(self, key: Hashable):
+        """Call with the lock held."""
+        self._precomputed[key] = None
+        while len(self._precomputed) > _TRACKED_KEYS:
+            self._precomputed.popitem(last=False)
+
+    def _record_request(self, key: Optional[Hashable]):
+        """Counts an on-demand request and whether its result had been pre-computed."""
+        with self._lock:
+            self.stats_counters['requests'] += 1
+            if key is not None and key in self._precomputed:
+                self.stats_counters['precomputed_hits'] += 1
+
+    # --- Load tracking (called by the web app around every request) ---
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+            self._last_request = time.monotonic()
+
+    def request_finished(self):
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._last_request = time.monotonic()
+
+    def _busy(self) -> bool:
+        with self._lock:
+            if self._in_flight > 0 or time.monotonic() - self._last_request < self.idle_seconds:
+                return True
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1) > self.max_load
+        except (AttributeError, OSError):  # No load average on this platform
+            return False
+
+    # --- Worker ---
+
+    def _can_run(self) -> bool:
+        """Whether queued work should be processed now (besides load); subclasses may hold the queue back."""
+        return True
+
+    def _process(self, batch: List[Tuple[Hashable, Any]]):
+        raise NotImplementedError
+
+    def _next_batch(self) -> List[Tuple[Hashable, Any]]:
+        with self._lock:
+            batch = []
+            while self._queue and len(batch) < self.batch_size:
+                key, item = self._queue.popleft()
+                self._queued_keys.discard(key)
+                batch.append((key, item))
+            return batch
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self._queue:
+                self._wake_event.wait(timeout=60)
+                self._wake_event.clear()
+                continue
+            if not self._can_run():
+                self._stop_event.wait(60)
+                continue
+            if self._busy():
+                self._count('pauses')
+                self._stop_event.wait(max(self.idle_seconds, 1.0))
+                continue
+
+            batch = self._next_batch()
+            if not batch:
+                continue
+            cpu_start = time.process_time()
+            try:
+                self._process(batch)
+            except Exception as e:
+                logging.error(f"{self.name} batch failed: {e}", exc_info=True)
+            cpu_used = time.process_time() - cpu_start
+            with self._lock:
+                self.stats_counters['batches'] += 1
+                self.stats_counters['busy_seconds'] += cpu_used
+            # Stay within the CPU budget: cpu_used / (cpu_used + sleep) <= budget
+            self._stop_event.wait(cpu_used * (1.0 / self.cpu_budget - 1.0))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self.stats_counters)
+            queue_length = len(self._queue)
+            in_flight = self._in_flight
+        requests = counters['requests']
+        counters['busy_seconds'] = round(counters['busy_seconds'], 2)
+        return {
+            **counters,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'queue_length': queue_length,
+            'in_flight_requests': in_flight,
+            'precomputed_hit_ratio': round(counters['precomputed_hits'] / requests, 4) if requests else None,
+        }
@@ -0,0 +1,197 @@
+# BharatVaani/core/ingest.py
+
+import logging
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from config.settings import (
+    RSS_FEEDS, CATEGORY_KEYWORDS, INGEST_ENABLED, INGEST_INTERVAL_SECONDS, INGEST_PAGE_SIZE, THUMB_ENABLED,
+    PRESUMMARIZE_ENABLED, PRETRANSLATE_ENABLED
+)
+from .analytics import AnalyticsAggregator
+from .fetcher import fetch_top_headlines, assign_categories_to_articles
+from .presummarizer import pre_summarizer
+from .pretranslator import pre_translator
+from .search import search_index
+from .thumbnails import thumbnail_service
+from .utils import analyze_sentiment_batch, generate_unique_id, save_cached_articles
+
+
+class ScopeSnapshot(NamedTuple):
+    """Immutable view of the enriched articles of one scope, as published by the ingestion service."""
+    scope: str
+    articles: Tuple[MappingProxyType, ...]
+    refreshed_at: datetime
+
+
+class IngestionService:
+    """
+    Refreshes every scope in RSS_FEEDS on a background thread and publishes one immutable
+    snapshot per scope. Page requests only ever read snapshots, so their latency no longer
+    depends on third-party feeds.
+    """
+
+    def __init__(self, scopes: Optional[List[str]] = None, interval: float = INGEST_INTERVAL_SECONDS,
+                 page_size: int = INGEST_PAGE_SIZE, fetch_fn: Callable[..., List[Dict]] = fetch_top_headlines):
+        self.scopes = list(scopes) if scopes is not None else list(RSS_FEEDS.keys())
+        self.interval = interval
+        self.page_size = page_size
+        self._fetch_fn = fetch_fn
+        self._snapshots: Dict[str, ScopeSnapshot] = {}
+        self._analytics: Dict[str, AnalyticsAggregator] = {scope: AnalyticsAggregator() for scope in self.scopes}
+        self._published = threading.Condition()
+        self._refresh_lock = threading.Lock()  # One refresh at a time, background or manual
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread = None
+
+    # --- Lifecycle ---
+
+    def start(self):
+        """Starts the background refresh loop. Safe to call repeatedly."""
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="feed-ingestion", daemon=True)
+            self._thread.start()
+            logging.info(f"Feed ingestion started for scopes {self.scopes} (every {self.interval}s).")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stops the background loop; an in-flight refresh is allowed to finish."""
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        self._stop_event.set()
+        self._wake_event.set()
+        if thread is not None:
+            thread.join(timeout)
+            logging.info("Feed ingestion stopped.")
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.refresh_now()
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+    # --- Refreshing ---
+
+    def trigger_refresh(self):
+        """Asks the background loop to refresh all scopes now instead of at the next interval."""
+        self._wake_event.set()
+
+    def refresh_now(self, scope: Optional[str] = None):
+        """Synchronously refreshes one scope (or all of them) in the calling thread."""
+        scopes = [scope] if scope else self.scopes
+        with self._refresh_lock:
+            for current in scopes:
+                try:
+                    self._refresh_scope(current)
+                except Exception as e:
+                    logging.error(f"Feed ingestion failed for scope '{current}': {e}", exc_info=True)
+            save_cached_articles(self.all_articles())
+
+    def _refresh_scope(self, scope: str):
+        articles = self._fetch_fn(page_size=self.page_size, selected_scope=scope, analyze=False)
+        previous = self._snapshots.get(scope)
+        known = {article['id']: article for article in previous.articles} if previous else {}
+
+        enriched, fresh = [], []
+        for article in articles:
+            if not article.get('id'):
+                article['id'] = generate_unique_id(article)
+            if article['id'] in known:
+                previous_article = known[article['id']]  # Already enriched in an earlier refresh
+                if previous_article.get('alternate_sources') != article.get('alternate_sources'):
+                    previous_article = dict(previous_article, alternate_sources=article.get('alternate_sources', []))
+                enriched.append(previous_article)
+            else:
+                fresh.append(article)
+                enriched.append(article)
+
+        # Enrichment runs once per article, never on the page request path
+        sentiments = analyze_sentiment_batch([article.get('full_text_for_ai', '') for article in fresh])
+        for article, sentiment in zip(fresh, sentiments):
+            article['sentiment_data'] = sentiment
+        assign_categories_to_articles(fresh, CATEGORY_KEYWORDS)
+        if THUMB_ENABLED:
+            for article in fresh:
+                if article.get('image_url'):
+                    thumbnail_service.prefetch(article['image_url'])  # Ready before anyone renders the card
+        if PRESUMMARIZE_ENABLED and fresh:
+            pre_summarizer.enqueue(fresh)  # Summarized in idle time, so "summarize" is a cache hit
+        if PRETRANSLATE_ENABLED and fresh:
+            pre_translator.enqueue(fresh)  # Translated in idle time into the languages users pick
+
+        snapshot = ScopeSnapshot(
+            scope=scope,
+            articles=tuple(a if isinstance(a, MappingProxyType) else MappingProxyType(a) for a in enriched),
+            refreshed_at=datetime.now(),
+        )
+        # Only articles that entered or left the scope touch the counts
+        self._analytics.setdefault(scope, AnalyticsAggregator()).sync(snapshot.articles)
+        # New articles and re-published ones (e.g. with new alternate sources) go into the search archive
+        search_index.add_many(a for a in snapshot.articles if search_index.get(a['id']) is not a)
+        with self._published:
+            self._snapshots[scope] = snapshot
+            self._published.notify_all()
+        logging.info(f"Published snapshot for '{scope}': {len(enriched)} articles ({len(fresh)} new).")
+
+    # --- Reading ---
+
+    def get_snapshot(self, scope: str) -> Optional[ScopeSnapshot]:
+        return self._snapshots.get(scope)
+
+    def wait_for_snapshot(self, scope: str, timeout: float) -> Optional[ScopeSnapshot]:
+        """Returns the snapshot of a scope, waiting up to `timeout` seconds for the first one."""
+        with self._published:
+            self._published.wait_for(lambda: scope in self._snapshots, timeout=timeout)
+            return self._snapshots.get(scope)
+
+    def get_articles(self, scope: str, limit: Optional[int] = None) -> List[Dict]:
+        """Returns mutable copies of a scope's articles, safe for per-request processing."""
+        snapshot = self._snapshots.get(scope)
+        if snapshot is None:
+            return []
+        articles = snapshot.articles if limit is None else snapshot.articles[:limit]
+        return [dict(article) for article in articles]
+
+    def get_analytics(self, scope: str, top_k: int = 10) -> Dict:
+        """Precomputed category/sentiment/entity counts over a scope's current snapshot."""
+        aggregator = self._analytics.get(scope)
+        return aggregator.summary(top_k) if aggregator is not None else AnalyticsAggregator().summary(top_k)
+
+    def all_articles(self) -> List[Dict]:
+        """Returns copies of the articles of every scope, de-duplicated by id."""
+        seen, merged = set(), []
+        for snapshot in list(self._snapshots.values()):
+            for article in snapshot.articles:
+                if article['id'] not in seen:
+                    seen.add(article['id'])
+                    merged.append(dict(article))
+        return merged
+
+    def status(self) -> Dict:
+        scopes = {}
+        for scope in self.scopes:
+            snapshot = self._snapshots.get(scope)
+            scopes[scope] = None if snapshot is None else {
+                'articles': len(snapshot.articles),
+                'refreshed_at': snapshot.refreshed_at.isoformat(timespec="seconds"),
+            }
+        return {
+            'running': self.is_running(),
+            'enabled': INGEST_ENABLED,
+            'interval_seconds': self.interval,
+            'scopes': scopes,
+        }
+
+
+# Process-wide ingestion service; started lazily by the web app
+ingestion_service = IngestionService()
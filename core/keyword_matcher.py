@@ -0,0 +1,100 @@
+# BharatVaani/core/keyword_matcher.py
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the (lowercased) keywords of every category.
+    One pass over a text yields a bitmask of all categories with at least one keyword in it,
+    with the same substring semantics as `keyword.lower() in text.lower()`.
+    Bit i stands for the i-th category in the config's order, so the lowest set bit is the
+    category the old first-match-wins loop would have picked.
+    """
+
+    def __init__(self, category_keywords: Dict[str, List[str]]):
+        self.categories: List[str] = list(category_keywords)
+        goto: List[Dict[str, int]] = [{}]
+        output: List[int] = [0]
+        for bit, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                state = 0
+                for ch in keyword:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        output.append(0)
+                    state = nxt
+                output[state] |= 1 << bit
+
+        # Breadth-first: fail links, inherited outputs, and a full transition table (a DFA), so matching
+        # never walks fail links. Transitions back to the root are left out; a missing key means state 0.
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            output[state] |= output[fail[state]]
+            transitions = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                transitions[ch] = nxt
+                queue.append(nxt)
+            delta[state] = transitions
+        self._delta = delta
+        self._output = output
+
+    def match(self, text: str, stop_mask: int = 0) -> int:
+        """
+        Bitmask of the categories whose keywords occur in `text` (already lowercased).
+        Stops early once any bit of `stop_mask` is set.
+        """
+        delta, output = self._delta, self._output
+        state, found = 0, 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                found |= output[state]
+                if found & stop_mask:
+                    break
+        return found
+
+    def first_category(self, text: str) -> Optional[str]:
+        """The first category (in config order) with a keyword in `text`, or None."""
+        found = self.match(text, stop_mask=1)  # Category 0 can't be beaten, stop as soon as it shows up
+        if not found:
+            return None
+        return self.categories[(found & -found).bit_length() - 1]
+
+    def matches_category(self, text: str, category: str) -> bool:
+        bit = 1 << self.categories.index(category)
+        return bool(self.match(text, stop_mask=bit) & bit)
+
+
+_lock = threading.Lock()
+_cached: Tuple[Optional[tuple], Optional[KeywordMatcher]] = (None, None)
+
+
+def _fingerprint(category_keywords: Dict[str, List[str]]) -> tuple:
+    return tuple((category, tuple(keywords)) for category, keywords in category_keywords.items())
+
+
+def get_keyword_matcher(category_keywords: Dict[str, List[str]]) -> KeywordMatcher:
+    """Compiled matcher for a keyword config; rebuilt only when the config's content changes."""
+    global _cached
+    fingerprint = _fingerprint(category_keywords)
+    cached_fingerprint, matcher = _cached
+    if fingerprint != cached_fingerprint:
+        with _lock:
+            cached_fingerprint, matcher = _cached
+            if fingerprint != cached_fingerprint:
+                matcher = KeywordMatcher(category_keywords)
+                _cached = (fingerprint, matcher)
+    return matcher
@@ -0,0 +1,119 @@
+# BharatVaani/core/lazy_models.py
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Every LazyModel registers itself here so warmup and readiness can cover all of them
+_registry: Dict[str, "LazyModel"] = {}
+
+
+class LazyModel:
+    """
+    A model that is loaded on first use instead of at import time.
+    Loading happens at most once at a time: concurrent callers wait for the thread that is loading.
+    A failed load is remembered (callers get None immediately) until load(retry=True) is called,
+    so a missing model does not stall every request with a new load attempt.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self._loader = loader
+        self._value = None
+        self._lock = threading.Lock()
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.loading = False
+        _registry[name] = self
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def get(self) -> Any:
+        """The loaded model, loading it now if needed; None if loading failed."""
+        value = self._value
+        if value is not None or self.error is not None:
+            return value
+        return self.load()
+
+    def load(self, retry: bool = False) -> Any:
+        with self._lock:
+            if self._value is not None or (self.error is not None and not retry):
+                return self._value
+            self.loading = True
+            start = time.perf_counter()
+            try:
+                logging.info(f"Loading model '{self.name}'...")
+                self._value = self._loader()
+                self.error = None
+                self.load_seconds = round(time.perf_counter() - start, 3)
+                logging.info(f"Model '{self.name}' loaded in {self.load_seconds}s.")
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logging.error(f"Error loading model '{self.name}': {e}", exc_info=True)
+            finally:
+                self.loading = False
+            return self._value
+
+    def status(self) -> Dict:
+        return {
+            'loaded': self.loaded,
+            'loading': self.loading,
+            'load_seconds': self.load_seconds,
+            'error': self.error,
+        }
+
+
+def warm_up(names: Optional[Iterable[str]] = None, retry: bool = True) -> Dict[str, Dict]:
+    """Loads the given registered models (default: all of them) in the calling thread."""
+    for name in (list(names) if names is not None else list(_registry)):
+        model = _registry.get(name)
+        if model is None:
+            logging.warning(f"Warmup requested for unknown model '{name}'.")
+            continue
+        model.load(retry=retry)
+    return models_status()
+
+
+_warmup_thread: Optional[threading.Thread] = None
+_warmup_lock = threading.Lock()
+_preloaded = False
+
+
+def start_warm_up(names: Optional[Iterable[str]] = None, retry: bool = True) -> bool:
+    """Runs warm_up on a background thread; returns False if one is already running."""
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is not None and _warmup_thread.is_alive():
+            return False
+        _warmup_thread = threading.Thread(target=warm_up, args=(list(names) if names is not None else None, retry),
+                                          name="model-warmup", daemon=True)
+        _warmup_thread.start()
+        return True
+
+
+def preload_once(names: Optional[Iterable[str]] = None):
+    """Starts one background warmup of `names` (default: all) per process; later calls do nothing (no retries)."""
+    global _preloaded
+    if _preloaded:
+        return
+    with _warmup_lock:
+        if _preloaded:
+            return
+        _preloaded = True
+    start_warm_up(names, retry=False)
+
+
+def models_status() -> Dict[str, Dict]:
+    return {name: model.status() for name, model in _registry.items()}
+
+
+def models_ready(names: Iterable[str]) -> bool:
+    """True once every named model is loaded (a name that was never registered counts as not ready)."""
+    return all(name in _registry and _registry[name].loaded for name in names)
+
+
+def registered_models() -> List[str]:
+    return list(_registry)
@@ -0,0 +1,60 @@
+# BharatVaani/core/presummarizer.py
+
+import logging
+from typing import List, Mapping
+
+from config.settings import (
+    PRESUMMARIZE_TOP_N, PRESUMMARIZE_CPU_BUDGET, PRESUMMARIZE_IDLE_SECONDS, PRESUMMARIZE_MAX_LOAD,
+    PRESUMMARIZE_QUEUE_SIZE, SUMMARIZER_BATCH_SIZE
+)
+from .idle_worker import IdleWorker, published_timestamp
+from .summarizer import is_generated_summary, summarize_texts, summary_cache_key
+
+
+class PreSummarizer(IdleWorker):
+    """
+    Summarizes newly ingested articles on a background thread while the server is idle, so the summary
+    cache already holds them when a user clicks "summarize".
+    Only the PRESUMMARIZE_TOP_N most recent new articles of each scope refresh are queued; pausing and the
+    CPU budget (PRESUMMARIZE_*) work as described in IdleWorker.
+    """
+
+    def __init__(self, top_n: int = PRESUMMARIZE_TOP_N, cpu_budget: float = PRESUMMARIZE_CPU_BUDGET,
+                 idle_seconds: float = PRESUMMARIZE_IDLE_SECONDS, max_load: float = PRESUMMARIZE_MAX_LOAD,
+                 batch_size: int = SUMMARIZER_BATCH_SIZE):
+        super().__init__("pre-summarizer", cpu_budget, idle_seconds, max_load, batch_size, PRESUMMARIZE_QUEUE_SIZE)
+        self.top_n = top_n
+        self.stats_counters['summarized'] = 0
+
+    def start(self) -> bool:
+        started = super().start()
+        if started:
+            logging.info(f"Pre-summarizer started (top {self.top_n} per scope, CPU budget {self.cpu_budget:.0%}).")
+        return started
+
+    def enqueue(self, articles: List[Mapping]):
+        """Queues the most recent of a refresh's new articles (by their card summary, which the UI sends)."""
+        newest = sorted(articles, key=published_timestamp, reverse=True)[:self.top_n]
+        with self._lock:
+            for article in newest:
+                text = article.get('summary') or ''
+                key = summary_cache_key(text)
+                if key is not None:
+                    self._push(key, text)
+        self._wake()
+
+    def record_summary_request(self, text: str):
+        """Counts an on-demand summary request and whether the background job had already computed it."""
+        self._record_request(summary_cache_key(text))
+
+    def _process(self, batch: List[tuple]):
+        summaries = summarize_texts([text for _, text in batch], batch_size=self.batch_size)
+        with self._lock:
+            for (key, _), summary in zip(batch, summaries):
+                if is_generated_summary(summary):
+                    self._mark_precomputed(key)
+                    self.stats_counters['summarized'] += 1
+
+
+# Process-wide pre-summarizer; started by the web app when PRESUMMARIZE_ENABLED is set
+pre_summarizer = PreSummarizer()
@@ -0,0 +1,154 @@
+# BharatVaani/core/pretranslator.py
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, List, Mapping, Optional
+
+from config.settings import (
+    PRETRANSLATE_TOP_N, PRETRANSLATE_TOP_LANGUAGES, PRETRANSLATE_CPU_BUDGET, PRETRANSLATE_IDLE_SECONDS,
+    PRETRANSLATE_MAX_LOAD, PRETRANSLATE_QUEUE_SIZE, PRETRANSLATE_BATCH_ARTICLES, PRETRANSLATE_DEMAND_HALF_LIFE,
+    PRETRANSLATE_PREFERENCE_WEIGHT
+)
+from .idle_worker import IdleWorker, published_timestamp
+from .translation_store import translation_store
+from .translator import LANG_TAGS, is_translation, translate_texts, translator_model_id
+
+
+class LanguageDemand:
+    """
+    Demand score per target language: translate requests add 1 each and halve every `half_life` seconds,
+    so the ranking follows what users ask for now rather than all-time totals. The saved `selected_language`
+    preference adds a constant `preference_weight` for as long as it is selected.
+    """
+
+    def __init__(self, half_life: float = PRETRANSLATE_DEMAND_HALF_LIFE,
+                 preference_weight: float = PRETRANSLATE_PREFERENCE_WEIGHT):
+        self.half_life = half_life
+        self.preference_weight = preference_weight
+        self._scores: Dict[str, float] = {}
+        self._preferred: Optional[str] = None
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _decay_locked(self):
+        now = time.monotonic()
+        factor = math.pow(0.5, (now - self._updated) / self.half_life)
+        self._updated = now
+        for language in list(self._scores):
+            self._scores[language] *= factor
+            if self._scores[language] < 1e-3:
+                del self._scores[language]
+
+    def record(self, language: str):
+        if language not in LANG_TAGS:  # Also skips 'en', which needs no translation
+            return
+        with self._lock:
+            self._decay_locked()
+            self._scores[language] = self._scores.get(language, 0.0) + 1.0
+
+    def set_preference(self, language: Optional[str]):
+        self._preferred = language if language in LANG_TAGS else None
+
+    def scores(self) -> Dict[str, float]:
+        """Current scores, highest first."""
+        with self._lock:
+            self._decay_locked()
+            scores = dict(self._scores)
+        if self._preferred is not None:
+            scores[self._preferred] = scores.get(self._preferred, 0.0) + self.preference_weight
+        return {language: round(score, 3) for language, score in
+                sorted(scores.items(), key=lambda item: item[1], reverse=True)}
+
+    def top(self, k: int) -> List[str]:
+        return list(self.scores())[:k]
+
+
+class PreTranslator(IdleWorker):
+    """
+    Translates the card summaries of newly ingested articles (the text the "translate" button sends) into the
+    most demanded languages on a background thread while the server is idle, so "translate" is a translation
+    store hit.
+    Only the PRETRANSLATE_TOP_N most recent new articles of each scope refresh are queued; the target
+    languages (top PRETRANSLATE_TOP_LANGUAGES by LanguageDemand) are chosen when a batch runs. Pausing and
+    the CPU budget (PRETRANSLATE_*) work as described in IdleWorker.
+    """
+
+    def __init__(self, top_n: int = PRETRANSLATE_TOP_N, top_languages: int = PRETRANSLATE_TOP_LANGUAGES,
+                 cpu_budget: float = PRETRANSLATE_CPU_BUDGET, idle_seconds: float = PRETRANSLATE_IDLE_SECONDS,
+                 max_load: float = PRETRANSLATE_MAX_LOAD, batch_articles: int = PRETRANSLATE_BATCH_ARTICLES):
+        super().__init__("pre-translator", cpu_budget, idle_seconds, max_load, batch_articles,
+                         PRETRANSLATE_QUEUE_SIZE)
+        self.top_n = top_n
+        self.top_languages = top_languages
+        self.demand = LanguageDemand()
+        self.stats_counters.update({'translated': 0, 'already_stored': 0})
+
+    def start(self) -> bool:
+        """Does nothing without a translation store (there would be nowhere to put the results)."""
+        if translation_store is None:
+            return False
+        started = super().start()
+        if started:
+            logging.info(f"Pre-translator started (top {self.top_n} per scope into {self.top_languages} languages, "
+                         f"CPU budget {self.cpu_budget:.0%}).")
+        return started
+
+    def enqueue(self, articles: List[Mapping]):
+        """Queues the most recent of a refresh's new articles (by id and card summary)."""
+        newest = sorted(articles, key=published_timestamp, reverse=True)[:self.top_n]
+        with self._lock:
+            for article in newest:
+                article_id = article.get('id')
+                summary = article.get('summary') or ''
+                if article_id and summary.strip():
+                    self._push(article_id, summary)
+        self._wake()
+
+    def record_translate_request(self, article_id: str, language: str):
+        """Counts an on-demand translation (towards language demand, and whether it was pre-translated)."""
+        self.demand.record(language)
+        self._record_request((article_id, language))
+
+    def _can_run(self) -> bool:
+        return bool(self.demand.top(self.top_languages))  # Nobody wants a translation yet: keep the queue
+
+    def _process(self, batch: List[tuple]):
+        for language in self.demand.top(self.top_languages):
+            try:
+                self._translate_batch(batch, language)
+            except Exception as e:
+                logging.error(f"Pre-translation batch to {language} failed: {e}", exc_info=True)
+
+    def _translate_batch(self, batch: List[tuple], language: str):
+        """Translates whatever of the batch's summaries the store does not hold yet (stored as /api/translate does)."""
+        model_id = translator_model_id()
+        pending = []  # (article id, summary)
+        for article_id, summary in batch:
+            if translation_store.get(article_id, language, model_id, source_text=summary) is not None:
+                self._count('already_stored')
+                continue
+            pending.append((article_id, summary))
+        if not pending:
+            return
+        translations = translate_texts([summary for _, summary in pending], language)
+        model_id = translator_model_id()  # May have changed if the model loaded just now and fell back to fp32
+        with self._lock:
+            for (article_id, summary), translated in zip(pending, translations):
+                if not is_translation(translated):
+                    continue
+                translation_store.put(article_id, language, model_id, summary, translated)
+                self._mark_precomputed((article_id, language))
+                self.stats_counters['translated'] += 1
+
+    def stats(self) -> Dict:
+        return {
+            **super().stats(),
+            'target_languages': self.demand.top(self.top_languages),
+            'language_demand': self.demand.scores(),
+        }
+
+
+# Process-wide pre-translator; started by the web app when PRETRANSLATE_ENABLED is set
+pre_translator = PreTranslator()
@@ -0,0 +1,181 @@
+# BharatVaani/core/search.py
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config.settings import SEARCH_INDEX_MAX_DOCS, SEARCH_MAX_PREFIX_EXPANSIONS, SEARCH_TITLE_WEIGHT
+
+# Word characters plus Indic and Arabic-script blocks (vowel signs and viramas are not \w) and the zero-width
+# (non-)joiners used inside Malayalam, Hindi and Bengali words, so those stay single tokens
+_TOKEN_PATTERN = re.compile(r"[\w\u0600-\u06ff\u0900-\u0dff\u200c\u200d]+")
+_JOINERS = str.maketrans("", "", "\u200c\u200d")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+_PREFIX_WEIGHT = 0.8  # A term reached only through prefix expansion counts a little less than an exact hit
+_MIN_PREFIX_LENGTH = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Search tokens of a text: NFC-normalized (so precomposed and decomposed Indic letters match), casefolded,
+    split on anything that is not part of a word. Zero-width joiners are dropped from the tokens, so a word
+    matches whether or not the publisher's keyboard inserted them.
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize("NFC", text).casefold()
+    return [token.translate(_JOINERS) for token in _TOKEN_PATTERN.findall(text)]
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over ingested articles, ranked with BM25.
+    Title terms count SEARCH_TITLE_WEIGHT times. Query terms must all match (an article matches a term
+    through the exact token or, for the query's terms, any indexed token that starts with it).
+    Holds at most `max_docs` articles; the oldest additions are evicted first, so it doubles as a
+    bounded archive of everything ingestion has seen.
+    """
+
+    def __init__(self, max_docs: int = SEARCH_INDEX_MAX_DOCS, title_weight: int = SEARCH_TITLE_WEIGHT):
+        self.max_docs = max_docs
+        self.title_weight = title_weight
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> {article id: weighted term frequency}
+        self._docs: "OrderedDict[str, Tuple[Mapping, int]]" = OrderedDict()  # id -> (article, weighted length)
+        self._total_length = 0
+        self._vocabulary: Optional[List[str]] = None  # Sorted terms for prefix lookups, built on first use
+        self._lock = threading.RLock()
+
+    def _term_frequencies(self, article: Mapping) -> Counter:
+        frequencies = Counter(tokenize(article.get('summary', '')))
+        for token in tokenize(article.get('title', '')):
+            frequencies[token] += self.title_weight
+        return frequencies
+
+    def add(self, article: Mapping):
+        self.add_many([article])
+
+    def add_many(self, articles: Iterable[Mapping]):
+        """Indexes articles (re-indexing ones whose id is already present)."""
+        prepared = [(article, self._term_frequencies(article)) for article in articles if article.get('id')]
+        with self._lock:
+            for article, frequencies in prepared:
+                doc_id = article['id']
+                if doc_id in self._docs:
+                    self._remove_locked(doc_id)
+                for term, frequency in frequencies.items():
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = {}
+                        if self._vocabulary is not None:
+                            bisect.insort(self._vocabulary, term)
+                    postings[doc_id] = frequency
+                length = sum(frequencies.values())
+                self._docs[doc_id] = (article, length)
+                self._total_length += length
+            while len(self._docs) > self.max_docs:
+                self._remove_locked(next(iter(self._docs)))
+
+    def get(self, doc_id: str) -> Optional[Mapping]:
+        entry = self._docs.get(doc_id)
+        return entry[0] if entry is not None else None
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            if doc_id in self._docs:
+                self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: str):
+        article, length = self._docs.pop(doc_id)
+        self._total_length -= length
+        for term in self._term_frequencies(article):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                if self._vocabulary is not None:
+                    del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+
+    def _expansions(self, term: str, prefix: bool) -> List[Tuple[str, float]]:
+        """Indexed terms a query term matches, with their weight."""
+        matches = [(term, 1.0)] if term in self._postings else []
+        if not prefix or len(term) < _MIN_PREFIX_LENGTH:
+            return matches
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, term)
+        for candidate in vocabulary[start:start + SEARCH_MAX_PREFIX_EXPANSIONS + 1]:
+            if not candidate.startswith(term):
+                break
+            if candidate != term:
+                matches.append((candidate, _PREFIX_WEIGHT))
+        return matches
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True,
+               category: Optional[str] = None) -> List[Tuple[Mapping, float]]:
+        """(article, score) pairs for a query, best first. Empty when the query has no searchable terms."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            doc_count = len(self._docs)
+            if doc_count == 0:
+                return []
+            average_length = self._total_length / doc_count
+            scores: Optional[Dict[str, float]] = None
+            for term in terms:
+                term_scores: Dict[str, float] = {}
+                for indexed_term, weight in self._expansions(term, prefix):
+                    postings = self._postings[indexed_term]
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, frequency in postings.items():
+                        length = self._docs[doc_id][1]
+                        score = weight * idf * frequency * (BM25_K1 + 1) / (
+                            frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+                        if score > term_scores.get(doc_id, 0.0):
+                            term_scores[doc_id] = score  # Best matching form of the term, not the sum of all
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items()
+                              if doc_id in term_scores}
+                if not scores:
+                    return []
+            if category is None:
+                ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            else:
+                ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            results = []
+            for doc_id, score in ranked:
+                article = self._docs[doc_id][0]
+                if category and article.get('category') != category:
+                    continue
+                results.append((article, score))
+                if len(results) >= limit:
+                    break
+            return results
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'documents': len(self._docs),
+                'max_documents': self.max_docs,
+                'terms': len(self._postings),
+                'average_length': round(self._total_length / len(self._docs), 1) if self._docs else 0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+# Process-wide index, fed by the ingestion service
+search_index = SearchIndex()
@@ -0,0 +1,224 @@
+# BharatVaani/core/sentiment.py
+
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+
+import numpy as np
+from textblob._text import ABBREVIATIONS, PUNCTUATION, RE_ABBR1, RE_ABBR2, RE_ABBR3, replacements
+
+from .lazy_models import LazyModel
+
+# Token codes for words that are not in the lexicon
+_UNKNOWN_SHORT = -1  # 1 character: keeps a pending negation and modifier alive ("not a good")
+_UNKNOWN_MEDIUM = -2  # 2 characters: ends a pending negation, keeps a pending modifier
+_UNKNOWN_LONG = -3  # 3+ characters: ends both
+_NEGATION = -4  # "not", "never", "n't": also end a pending modifier
+_NEGATION_SHORT = -5  # "no": 2 characters, so a pending modifier survives it
+_EXCLAMATION = -6
+
+_NEGATIONS = ("no", "not", "n't", "never")
+_EDGE_PUNCTUATION = tuple(PUNCTUATION.replace(".", ""))
+_QUOTES = re.compile("([“”‘’'\"])")
+_CONTRACTIONS = re.compile("|".join(re.escape(c) for c in replacements))  # "don't" -> "do n't"
+
+
+def _tokenize(text: str) -> List[str]:
+    """
+    Same tokens as TextBlob's find_tokens (which the pattern analyzer scores), lowercased: contractions
+    and quotes are split off, leading/trailing punctuation becomes separate tokens, and a final period stays attached
+    to abbreviations ("Mr.", "U.S.").
+    """
+    tokens = []
+    if "'" in text:
+        text = _CONTRACTIONS.sub(lambda m: replacements[m.group(0)], text)
+    for chunk in _QUOTES.sub(r" \1 ", text).split():
+        if chunk.isalnum():
+            tokens.append(chunk.lower())
+            continue
+        while chunk.startswith(_EDGE_PUNCTUATION):
+            tokens.append(chunk[0])
+            chunk = chunk[1:]
+        tail = []
+        while chunk.endswith(_EDGE_PUNCTUATION + (".",)):
+            if chunk.endswith(_EDGE_PUNCTUATION):
+                tail.append(chunk[-1])
+                chunk = chunk[:-1]
+            if chunk.endswith("..."):
+                tail.append("...")
+                chunk = chunk[:-3].rstrip(".")
+            if chunk.endswith("."):
+                if (chunk in ABBREVIATIONS or RE_ABBR1.match(chunk) or RE_ABBR2.match(chunk)
+                        or RE_ABBR3.match(chunk)):
+                    break
+                tail.append(".")
+                chunk = chunk[:-1]
+        if chunk:
+            tokens.append(chunk.lower())
+        tokens.extend(reversed(tail))
+    return tokens
+
+
+def _default_lexicon_path() -> str:
+    import textblob  # Only for the location of its bundled lexicon
+    return os.path.join(os.path.dirname(textblob.__file__), "en", "en-sentiment.xml")
+
+
+class LexiconSentimentScorer:
+    """
+    Batch re-implementation of TextBlob's pattern sentiment (the analyzer behind TextBlob(text).sentiment).
+    The lexicon is loaded once into NumPy arrays; a batch of texts is tokenized into one flat array of
+    word ids and scored with array operations. Applies the same rules for intensifiers ("very good",
+    "really not good"), negation ("not good" = -0.5 x good) and exclamation marks; ASCII emoticons and
+    the "(!)" irony marker are not modelled.
+    """
+
+    def __init__(self, lexicon_path: Optional[str] = None):
+        self.lexicon_path = lexicon_path or _default_lexicon_path()
+        self._vocab: Dict[str, int] = {}
+        self._polarity = self._intensity = self._is_modifier = self._is_ly_modifier = None
+        self._load()
+
+    def _load(self):
+        senses: Dict[str, Dict[Optional[str], List[Tuple[float, float]]]] = {}
+        for word in ElementTree.parse(self.lexicon_path).getroot().findall("word"):
+            form = word.attrib.get("form")
+            if not form:
+                continue
+            senses.setdefault(form, {}).setdefault(word.attrib.get("pos"), []).append(
+                (float(word.attrib.get("polarity", 0.0)), float(word.attrib.get("intensity", 1.0))))
+
+        # Same averaging as TextBlob: senses per POS tag, then across POS tags
+        entries: Dict[str, Tuple[float, float, bool]] = {}
+        adjectives = []
+        for form, by_pos in senses.items():
+            per_pos = {pos: np.mean(values, axis=0) for pos, values in by_pos.items()}
+            p, i = np.mean(list(per_pos.values()), axis=0)
+            entries[form] = (p, i, "RB" in by_pos)
+            if "JJ" in per_pos:
+                adjectives.append((form, per_pos["JJ"]))
+        # Like TextBlob's English lexicon, every adjective also yields its adverb ("terrible" -> "terribly")
+        for form, (p, i) in adjectives:
+            if form.endswith("y"):
+                form = form[:-1] + "i"
+            if form.endswith("le"):
+                form = form[:-2]
+            entries[form + "ly"] = (p, i, True)
+
+        polarity, intensity, is_modifier = [], [], []
+        for form, (p, i, modifier) in entries.items():
+            self._vocab[form] = len(polarity)
+            polarity.append(p)
+            intensity.append(i)
+            is_modifier.append(modifier)
+        self._polarity = np.array(polarity, dtype=np.float64)
+        self._intensity = np.array(intensity, dtype=np.float64)
+        self._is_modifier = np.array(is_modifier, dtype=bool)
+        # Adverbs ending in -ly also absorb a following negation ("really not good")
+        self._is_ly_modifier = self._is_modifier & np.array([form.endswith("ly") for form in self._vocab], dtype=bool)
+        logging.info(f"Sentiment lexicon loaded: {len(self._vocab)} words from {self.lexicon_path}")
+
+    def _encode(self, text: str) -> List[int]:
+        vocab = self._vocab
+        codes = []
+        for token in _tokenize(text):
+            code = vocab.get(token)
+            if code is None:
+                if token in _NEGATIONS:
+                    code = _NEGATION if len(token) > 2 else _NEGATION_SHORT
+                elif token == "!":
+                    code = _EXCLAMATION
+                else:
+                    code = _UNKNOWN_SHORT if len(token) == 1 else _UNKNOWN_MEDIUM if len(token) == 2 else _UNKNOWN_LONG
+            codes.append(code)
+        return codes
+
+    def polarities(self, texts: List[str]) -> np.ndarray:
+        """Polarity in [-1, 1] for every text (0.0 when no lexicon word occurs)."""
+        encoded = [self._encode(text) for text in texts]
+        lengths = np.fromiter((len(codes) for codes in encoded), dtype=np.int64, count=len(texts))
+        result = np.zeros(len(texts), dtype=np.float64)
+        n = int(lengths.sum())
+        if n == 0:
+            return result
+
+        codes = np.fromiter((c for codes in encoded for c in codes), dtype=np.int64, count=n)
+        doc = np.repeat(np.arange(len(texts)), lengths)
+        doc_start = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        pos = np.arange(n)
+        known = codes >= 0
+        word = np.where(known, codes, 0)
+
+        # Index of the previous lexicon word in the same text (-1 if none)
+        last_known = np.maximum.accumulate(np.where(known, pos, -1))
+        prev_known = np.concatenate(([-1], last_known[:-1]))
+        prev_known[prev_known < doc_start] = -1
+        has_prev = prev_known >= 0
+
+        prev_word = word[np.maximum(prev_known, 0)]
+        before = np.maximum(pos - 1, 0)
+
+        # A negation right after an -ly adverb ("really not") negates the adverb's assessment instead of
+        # the next word, and keeps the adverb active as a modifier
+        long_words = np.cumsum(codes == _UNKNOWN_LONG)
+        is_negation = (codes == _NEGATION) | (codes == _NEGATION_SHORT)
+        absorbed = (is_negation & has_prev & self._is_ly_modifier[prev_word]
+                    & (long_words[before] == long_words[np.maximum(prev_known, 0)]))
+        absorbed_by = np.bincount(prev_known[absorbed], minlength=n) > 0  # Per lexicon word
+
+        # Intensifier: previous lexicon word is an adverb, with only 1-2 character tokens in between
+        long_gap = long_words + np.cumsum((codes == _NEGATION) & ~absorbed)
+        gap_is_short = long_gap[before] == long_gap[np.maximum(prev_known, 0)]
+        modified = known & has_prev & gap_is_short & self._is_modifier[prev_word]
+
+        # Negation: the last negation/reset marker before a word (since the previous lexicon word) is a negation
+        is_negation &= ~absorbed
+        resets = known | is_negation | absorbed | (codes == _UNKNOWN_MEDIUM) | (codes == _UNKNOWN_LONG)
+        last_marker = np.maximum.accumulate(np.where(resets, pos, -1))
+        prev_marker = np.concatenate(([-1], last_marker[:-1]))
+        negated = known & (prev_marker >= doc_start) & is_negation[np.maximum(prev_marker, 0)]
+
+        # A modified word merges into the previous word's assessment; each chain yields one assessment
+        known_pos = pos[known]
+        starts_chain = ~modified[known_pos]
+        chain = np.cumsum(starts_chain) - 1
+        chain_count = int(chain[-1]) + 1 if len(chain) else 0
+        if chain_count == 0:
+            return result
+
+        base_intensity = self._intensity[word]
+        effective_intensity = np.where(negated, 1.0 / base_intensity, base_intensity)
+        prev_intensity = effective_intensity[np.maximum(prev_known, 0)]
+        word_polarity = np.where(modified, np.clip(self._polarity[word] * prev_intensity, -1.0, 1.0),
+                                 self._polarity[word])
+
+        chain_end = np.zeros(chain_count, dtype=np.int64)
+        chain_end[chain] = known_pos  # Later positions overwrite earlier ones: keeps the last word of each chain
+        polarity = word_polarity[chain_end]
+        chain_negated = np.bincount(chain, weights=negated[known_pos] | absorbed_by[known_pos],
+                                    minlength=chain_count) > 0
+
+        # "!" boosts the assessment of the last lexicon word before it, unless a later word merges into it
+        bangs = (codes == _EXCLAMATION) & (last_known >= doc_start)
+        bang_counts = np.bincount(last_known[bangs], minlength=n)[chain_end]
+        polarity = np.clip(polarity * 1.25 ** bang_counts, -1.0, 1.0)
+        polarity = np.where(chain_negated, polarity * -0.5, polarity)
+
+        chain_doc = doc[chain_end]
+        sums = np.bincount(chain_doc, weights=polarity, minlength=len(texts))
+        counts = np.bincount(chain_doc, minlength=len(texts))
+        np.divide(sums, counts, out=result, where=counts > 0)
+        return result
+
+
+lexicon_model = LazyModel("sentiment_lexicon", LexiconSentimentScorer)
+
+
+def get_lexicon_scorer() -> LexiconSentimentScorer:
+    """Process-wide scorer; the lexicon is parsed on first use."""
+    scorer = lexicon_model.get()
+    if scorer is None:
+        raise RuntimeError(f"Sentiment lexicon unavailable: {lexicon_model.error}")
+    return scorer
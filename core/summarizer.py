@@ -1,63 +1,316 @@
 # BharatVaani/core/summarizer.py
 
-from transformers import pipeline
+import hashlib
 import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
 
-from config.settings import SUMMARIZER_MODEL_NAME
-from .utils import clean_text
+from config.settings import (
+    SUMMARIZER_MODEL_NAME, SUMMARIZER_BATCH_SIZE, SUMMARY_MAX_LENGTH, SUMMARY_MIN_LENGTH,
+    SUMMARY_CACHE_ENABLED, SUMMARY_CACHE_SIZE, SUMMARY_CACHE_PERSIST, SUMMARY_CACHE_DISK_SIZE, CACHE_DB_FILE,
+    SUMMARIZER_MAX_INPUT_TOKENS, SUMMARIZER_MAP_REDUCE, SUMMARIZER_MAX_CHUNKS, SUMMARY_CHUNK_MAX_LENGTH,
+    SUMMARIZER_BACKEND, SUMMARIZER_ONNX_DIR
+)
+from .cache import TieredCache
+from .lazy_models import LazyModel
+from .utils import clean_text, clean_texts, split_sentences
+
+
+# Backend actually serving summaries (differs from SUMMARIZER_BACKEND after a fallback); set when the model loads
+active_backend: Optional[str] = None
+
+
+def _load_pytorch():
+    from transformers import pipeline  # Deferred: importing transformers alone takes seconds
+    return pipeline("summarization", model=SUMMARIZER_MODEL_NAME)
+
+
+def _load_int8():
+    """fp32 weights with every Linear layer dynamically quantized to int8 (weights int8, activations quantized per batch)."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+    model = AutoModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL_NAME)
+    model.eval()
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("summarization", model=model, tokenizer=AutoTokenizer.from_pretrained(SUMMARIZER_MODEL_NAME))
+
+
+def _load_onnx():
+    """ONNX Runtime graph (needs optimum[onnxruntime]); exported from the checkpoint once and reused from disk."""
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from transformers import AutoTokenizer, pipeline
+    if os.path.isdir(SUMMARIZER_ONNX_DIR) and os.listdir(SUMMARIZER_ONNX_DIR):
+        model = ORTModelForSeq2SeqLM.from_pretrained(SUMMARIZER_ONNX_DIR)
+        tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_ONNX_DIR)
+    else:
+        logging.info(f"Exporting {SUMMARIZER_MODEL_NAME} to ONNX in {SUMMARIZER_ONNX_DIR} (one-time)...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL_NAME, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_MODEL_NAME)
+        model.save_pretrained(SUMMARIZER_ONNX_DIR)
+        tokenizer.save_pretrained(SUMMARIZER_ONNX_DIR)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+_BACKENDS = {'pytorch': _load_pytorch, 'int8': _load_int8, 'onnx': _load_onnx}
+
+
+def _build_summarizer_pipeline(backend: Optional[str] = None):
+    """Summarization pipeline on the configured backend, falling back to the fp32 PyTorch pipeline."""
+    global active_backend
+    backend = backend or SUMMARIZER_BACKEND
+    if backend not in _BACKENDS:
+        logging.warning(f"Unknown SUMMARIZER_BACKEND '{backend}'; using 'pytorch'.")
+        backend = 'pytorch'
+    if backend != 'pytorch':
+        try:
+            summarizer_pipeline = _BACKENDS[backend]()
+            active_backend = backend
+            return summarizer_pipeline
+        except Exception as e:
+            logging.warning(f"Summarizer backend '{backend}' unavailable ({e}); falling back to 'pytorch'.")
+    summarizer_pipeline = _load_pytorch()
+    active_backend = 'pytorch'
+    return summarizer_pipeline
+
+
+# Loaded on first use (or by an explicit warmup), never at import time
+summarizer_model = LazyModel("summarizer", _build_summarizer_pipeline)
+
+
+# Summaries are the most expensive thing we compute; every user clicking "summarize" on an article shares one
+summary_cache = TieredCache("summaries", SUMMARY_CACHE_SIZE,
+                            db_path=CACHE_DB_FILE if SUMMARY_CACHE_PERSIST else None,
+                            max_disk_entries=SUMMARY_CACHE_DISK_SIZE) if SUMMARY_CACHE_ENABLED else None
 
-# Global summarization pipeline instance
-summarizer_pipeline = None
 
 def load_summarizer_pipeline():
-    """Loads and caches the Hugging Face summarization pipeline."""
-    global summarizer_pipeline
+    """Returns the Hugging Face summarization pipeline, loading it on first call (None if loading failed)."""
+    return summarizer_model.get()
+
+
+_MAX_CHARS_PER_TOKEN = 10
+
+_NOT_LOADED = "Summary not available (AI model failed to load)."
+_TOO_SHORT = "Summary not available for this article."
+_FAILED = "Summary generation failed. Please try again later."
+
+
+def _to_bullets(summary: str) -> str:
+    if not summary.strip():
+        raise ValueError("Empty summary returned from model.")
+    sentences = summary.split('.')
+    bullet_points = [f"• {s.strip()}" for s in sentences if s.strip()]
+    return "\n".join(bullet_points[:3]) if bullet_points else "Summary not available."
+
+
+def _generate(summarizer_pipeline, texts: List[str], max_length: int, min_length: int) -> List[str]:
+    """One padded forward pass over a batch; returns the raw summary texts."""
+    results = summarizer_pipeline(
+        texts,
+        max_length=max_length,
+        min_length=min_length,
+        do_sample=False,
+        truncation=True,  # Inputs are already within the token budget; this is only a safety net
+        batch_size=len(texts),
+    )
+    return [result.get('summary_text', '') for result in results]
+
+
+def _generate_batched(summarizer_pipeline, inputs: List[Tuple[str, int]], batch_size: int,
+                      max_length: int, min_length: int) -> List[Optional[str]]:
+    """
+    Raw summaries of (text, token count) inputs, in input order (None where generation failed).
+    Inputs are sorted by token count so each batch is padded only up to its own longest text. A batch that
+    fails is retried one text at a time so a single bad input only fails itself.
+    """
+    outputs: List[Optional[str]] = [None] * len(inputs)
+    order = sorted(range(len(inputs)), key=lambda i: inputs[i][1], reverse=True)
+    for start in range(0, len(order), max(1, batch_size)):
+        batch = order[start:start + batch_size]
+        try:
+            generated = _generate(summarizer_pipeline, [inputs[i][0] for i in batch], max_length, min_length)
+        except Exception as e:
+            if len(batch) == 1:
+                logging.error(f"Error during summarization: {e}")
+                continue
+            logging.warning(f"Batch summarization failed ({e}); retrying {len(batch)} texts one by one.")
+            generated = []
+            for i in batch:
+                try:
+                    generated.append(_generate(summarizer_pipeline, [inputs[i][0]], max_length, min_length)[0])
+                except Exception as item_error:
+                    logging.error(f"Error during summarization: {item_error}")
+                    generated.append(None)
+        for i, summary in zip(batch, generated):
+            outputs[i] = summary
+    return outputs
+
+
+def _input_budget(tokenizer) -> int:
+    """Tokens of article text one forward pass can take: the model limit minus its special tokens."""
+    model_max_length = getattr(tokenizer, 'model_max_length', 1024)
+    if not isinstance(model_max_length, int) or model_max_length > 100_000:  # Unset limits are huge sentinels
+        model_max_length = 1024
+    return max(16, min(model_max_length, SUMMARIZER_MAX_INPUT_TOKENS) - tokenizer.num_special_tokens_to_add())
+
+
+def _token_ids(tokenizer, texts: List[str]) -> List[List[int]]:
+    return tokenizer(texts, add_special_tokens=False)['input_ids'] if texts else []
+
+
+def _chunk(tokenizer, text: str, budget: int, max_chunks: int) -> List[Tuple[str, int]]:
+    """
+    Splits a long text into at most `max_chunks` (text, token count) pieces of at most `budget` tokens,
+    cutting at sentence ends (split_sentences) where possible. Text beyond the last chunk is dropped.
+    """
+    sentences = split_sentences(text)
+    chunks: List[Tuple[str, int]] = []
+    current, current_tokens = [], 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            chunks.append((" ".join(current), current_tokens))
+        current, current_tokens = [], 0
+
+    for sentence, ids in zip(sentences, _token_ids(tokenizer, sentences)):
+        if len(ids) > budget:  # A run-on "sentence": cut it by tokens
+            flush()
+            for start in range(0, min(len(ids), budget * max_chunks), budget):
+                piece = ids[start:start + budget]
+                chunks.append((tokenizer.decode(piece, skip_special_tokens=True), len(piece)))
+            continue
+        if current_tokens + len(ids) > budget:
+            flush()
+        current.append(sentence)
+        current_tokens += len(ids)
+        if len(chunks) >= max_chunks:
+            break
+    flush()
+    return chunks[:max_chunks]
+
+
+def _summary_cache_key(cleaned_text: str) -> str:
+    """
+    Normalized input plus everything that changes the output: model, backend, input budget and generation
+    parameters. The configured backend is used (not the active one), so cached summaries can be served
+    before the model is loaded.
+    """
+    params = (f"{SUMMARIZER_MODEL_NAME}\x00{SUMMARIZER_BACKEND}\x00{SUMMARY_MAX_LENGTH}\x00{SUMMARY_MIN_LENGTH}\x00greedy\x00"
+              f"{SUMMARIZER_MAX_INPUT_TOKENS}\x00{SUMMARIZER_MAP_REDUCE}\x00{SUMMARIZER_MAX_CHUNKS}\x00"
+              f"{SUMMARY_CHUNK_MAX_LENGTH}")
+    return hashlib.sha256(f"{params}\x00{' '.join(cleaned_text.split())}".encode("utf-8")).hexdigest()
+
+
+def summary_cache_key(text: str) -> Optional[str]:
+    """Cache key summarize_texts uses for a raw input text; None if the text is too short to summarize."""
+    cleaned_text = clean_text(text)
+    if not cleaned_text.strip() or len(cleaned_text.strip()) < 30:
+        return None
+    return _summary_cache_key(cleaned_text)
+
+
+def is_generated_summary(summary: str) -> bool:
+    """True for a model-written summary, False for the fallback/error messages summarize_texts returns."""
+    return summary.startswith("• ")
+
+
+def summarize_texts(texts: List[str], batch_size: int = SUMMARIZER_BATCH_SIZE) -> List[str]:
+    """
+    Summarizes several texts into 2-3 bullet points each, in input order.
+    Cached summaries are reused (see SUMMARY_CACHE_*) and identical texts are summarized once.
+
+    Inputs are measured in model tokens. A text within the input budget is summarized in one pass. A longer
+    one is, with SUMMARIZER_MAP_REDUCE, split into at most SUMMARIZER_MAX_CHUNKS chunks that are summarized
+    together with everything else in the map batches; the chunk summaries are then summarized again
+    (reduce). Without map-reduce it is cut to the budget at a token boundary. Either way the model work
+    per text is bounded: at most SUMMARIZER_MAX_CHUNKS + 1 passes over at most the budget in tokens.
+    """
+    summaries = [_TOO_SHORT] * len(texts)
+    pending = {}  # cache key -> (cleaned text, indices of the texts that need it)
+    for index, cleaned_text in enumerate(clean_texts(texts)):
+        if not cleaned_text.strip() or len(cleaned_text.strip()) < 30:
+            logging.warning(f"Text too short to summarize: {cleaned_text[:50]}...")
+            continue
+        key = _summary_cache_key(cleaned_text)
+        cached = summary_cache.get(key) if summary_cache is not None else None
+        if cached is not None:
+            summaries[index] = cached['summary']
+            summary_cache.credit(cached.get('seconds', 0.0))
+            continue
+        pending.setdefault(key, (cleaned_text, []))[1].append(index)
+    if not pending:
+        return summaries
+
+    summarizer_pipeline = load_summarizer_pipeline()  # Only loaded when something actually needs the model
     if summarizer_pipeline is None:
+        logging.error("Summarizer pipeline not loaded.")
+        for _, indices in pending.values():
+            for index in indices:
+                summaries[index] = _NOT_LOADED
+        return summaries
+
+    started = time.perf_counter()
+    tokenizer = summarizer_pipeline.tokenizer
+    budget = _input_budget(tokenizer)
+    keys = list(pending)
+    direct: Dict[str, int] = {}  # cache key -> position in map_inputs
+    chunked: Dict[str, List[int]] = {}  # cache key -> positions of its chunks in chunk_inputs
+    map_inputs: List[Tuple[str, int]] = []
+    chunk_inputs: List[Tuple[str, int]] = []
+    # Nothing past what the chunks can hold is even tokenized (a token is rarely more than a few characters)
+    max_chars = budget * (SUMMARIZER_MAX_CHUNKS if SUMMARIZER_MAP_REDUCE else 1) * _MAX_CHARS_PER_TOKEN
+    inputs = [pending[key][0][:max_chars] for key in keys]
+    for key, text, ids in zip(keys, inputs, _token_ids(tokenizer, inputs)):
+        if len(ids) <= budget:
+            direct[key] = len(map_inputs)
+            map_inputs.append((text, len(ids)))
+        elif SUMMARIZER_MAP_REDUCE:
+            chunks = _chunk(tokenizer, text, budget, SUMMARIZER_MAX_CHUNKS)
+            chunked[key] = list(range(len(chunk_inputs), len(chunk_inputs) + len(chunks)))
+            chunk_inputs.extend(chunks)
+        else:
+            direct[key] = len(map_inputs)
+            map_inputs.append((tokenizer.decode(ids[:budget], skip_special_tokens=True), budget))
+
+    # Map: short texts and the chunks of long ones (chunk summaries are shorter, so they get their own batches)
+    outputs = _generate_batched(summarizer_pipeline, map_inputs, batch_size, SUMMARY_MAX_LENGTH, SUMMARY_MIN_LENGTH)
+    chunk_outputs = _generate_batched(summarizer_pipeline, chunk_inputs, batch_size,
+                                      SUMMARY_CHUNK_MAX_LENGTH, min(SUMMARY_MIN_LENGTH, SUMMARY_CHUNK_MAX_LENGTH // 2))
+
+    # Reduce: one more pass over each long text's joined chunk summaries
+    reduce_keys, reduce_texts = [], []
+    for key, positions in chunked.items():
+        parts = [chunk_outputs[p] for p in positions if chunk_outputs[p]]
+        if parts:
+            reduce_keys.append(key)
+            reduce_texts.append(" ".join(part.strip() for part in parts))
+    reduce_ids = _token_ids(tokenizer, reduce_texts)
+    reduce_inputs = [(text, len(ids)) if len(ids) <= budget
+                     else (tokenizer.decode(ids[:budget], skip_special_tokens=True), budget)
+                     for text, ids in zip(reduce_texts, reduce_ids)]
+    reduced = dict(zip(reduce_keys, _generate_batched(summarizer_pipeline, reduce_inputs, batch_size,
+                                                      SUMMARY_MAX_LENGTH, SUMMARY_MIN_LENGTH)))
+
+    seconds_per_text = (time.perf_counter() - started) / len(keys)
+    for key in keys:
+        summary = outputs[direct[key]] if key in direct else reduced.get(key)
         try:
-            logging.info(f"Loading summarization model: {SUMMARIZER_MODEL_NAME}")
-            summarizer_pipeline = pipeline("summarization", model=SUMMARIZER_MODEL_NAME)
-            logging.info(f"Summarization model {SUMMARIZER_MODEL_NAME} loaded successfully.")
+            result = _FAILED if summary is None else _to_bullets(summary)
         except Exception as e:
-            logging.error(f"Error loading summarization model {SUMMARIZER_MODEL_NAME}: {e}")
-            summarizer_pipeline = None # Ensure it's None if loading fails
-    return summarizer_pipeline
+            logging.error(f"Error during summarization: {e}")
+            result = _FAILED
+        if summary_cache is not None and result != _FAILED:  # Don't pin transient failures
+            summary_cache.put(key, {'summary': result, 'seconds': round(seconds_per_text, 4)})
+        for index in pending[key][1]:
+            summaries[index] = result
+    return summaries
+
 
 def summarize_text(text: str) -> str:
     """
     Summarizes the given text into 2-3 bullet points using the loaded Hugging Face model.
     Handles empty or malformed inputs gracefully.
     """
-    if summarizer_pipeline is None:
-        logging.error("Summarizer pipeline not loaded.")
-        return "Summary not available (AI model failed to load)."
-
-    cleaned_text = clean_text(text)
-    if not cleaned_text.strip() or len(cleaned_text.strip()) < 30:
-        logging.warning(f"Text too short to summarize: {cleaned_text[:50]}...")
-        return "Summary not available for this article."
-
-    max_input_length = summarizer_pipeline.tokenizer.model_max_length if hasattr(summarizer_pipeline.tokenizer, 'model_max_length') else 1024
-    if len(cleaned_text.split()) > max_input_length:
-        cleaned_text = " ".join(cleaned_text.split()[:max_input_length])
-
-    try:
-        summary_result = summarizer_pipeline(
-            cleaned_text,
-            max_length=100,
-            min_length=30,
-            do_sample=False,
-            truncation=True
-        )
-        summary = summary_result[0].get('summary_text', '')
-        if not summary.strip():
-            raise ValueError("Empty summary returned from model.")
-
-        sentences = summary.split('.')
-        bullet_points = [f"• {s.strip()}" for s in sentences if s.strip()]
-        return "\n".join(bullet_points[:3]) if bullet_points else "Summary not available."
-    except Exception as e:
-        logging.error(f"Error during summarization: {e}")
-        return "Summary generation failed. Please try again later."
-
-# Call load_summarizer_pipeline once when the module is imported
-load_summarizer_pipeline()
+    return summarize_texts([text])[0]
@@ -0,0 +1,221 @@
+# BharatVaani/core/thumbnails.py
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from PIL import Image, features
+
+from config.settings import (
+    THUMB_DIR, THUMB_SIZE, THUMB_QUALITY, THUMB_WORKERS, THUMB_MAX_SOURCE_BYTES, THUMB_FETCH_TIMEOUT,
+    THUMB_MAX_REGISTERED, THUMB_FAILURE_RETRY_SECONDS, THUMB_DISK_MAX_BYTES
+)
+from .http_client import get_http_session
+
+# WebP is ~30% smaller than JPEG at the same quality; only some Pillow builds ship the encoder
+THUMB_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+THUMB_MIMETYPE = "image/webp" if THUMB_FORMAT == "WEBP" else "image/jpeg"
+_EXTENSION = ".webp" if THUMB_FORMAT == "WEBP" else ".jpg"
+
+Image.MAX_IMAGE_PIXELS = 40_000_000  # Refuse decompression bombs rather than decoding them
+
+
+def thumb_key(image_url: str) -> str:
+    """
+    Key of a thumbnail: a hash of the source URL plus every setting that changes the output. It does not
+    hash the image bytes, so a publisher replacing the image behind the same URL keeps the old thumbnail
+    until it is evicted.
+    """
+    recipe = f"{image_url}|{THUMB_SIZE[0]}x{THUMB_SIZE[1]}|{THUMB_QUALITY}|{THUMB_FORMAT}"
+    return hashlib.sha256(recipe.encode("utf-8")).hexdigest()[:32]
+
+
+class ThumbnailService:
+    """
+    Resizes publisher images into small cached thumbnails.
+    Downloads and resizes run on a worker pool, never on the request path; finished thumbnails
+    live on disk under their key, so they survive restarts.
+
+    Everything is bounded: the key -> URL map keeps the `max_registered` most recently registered images,
+    a failed image is retried after `failure_retry_seconds`, and once the directory holds more than
+    `disk_max_bytes` the least recently built thumbnails are deleted (checked every _PRUNE_EVERY builds).
+    """
+
+    _PRUNE_EVERY = 100
+
+    def __init__(self, directory: str, workers: int = THUMB_WORKERS, max_registered: int = THUMB_MAX_REGISTERED,
+                 failure_retry_seconds: float = THUMB_FAILURE_RETRY_SECONDS,
+                 disk_max_bytes: int = THUMB_DISK_MAX_BYTES):
+        self.directory = directory
+        self.max_registered = max_registered
+        self.failure_retry_seconds = failure_retry_seconds
+        self.disk_max_bytes = disk_max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnail")
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._sources: "OrderedDict[str, str]" = OrderedDict()  # key -> original image URL, least recent first
+        self._pending: Set[str] = set()
+        self._failed: "OrderedDict[str, float]" = OrderedDict()  # key -> monotonic time of the failure
+        self._built = 0
+        self._evicted_files = 0
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + _EXTENSION)
+
+    def register(self, image_url: str) -> str:
+        """Remembers which image a key stands for and returns the key."""
+        key = thumb_key(image_url)
+        with self._lock:
+            self._sources[key] = image_url
+            self._sources.move_to_end(key)
+            while len(self._sources) > self.max_registered:
+                self._sources.popitem(last=False)
+        return key
+
+    def source_url(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._sources.get(key)
+
+    def is_ready(self, key: str) -> bool:
+        return os.path.exists(self.path_for(key))
+
+    def has_failed(self, key: str) -> bool:
+        with self._lock:
+            return self._failed_locked(key)
+
+    def _failed_locked(self, key: str) -> bool:
+        """Whether a key failed recently; expired failures are forgotten so the image gets another try."""
+        failed_at = self._failed.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at > self.failure_retry_seconds:
+            del self._failed[key]
+            return False
+        return True
+
+    def schedule(self, key: str) -> bool:
+        """Queues a registered key for resizing unless it is already done, queued or known to fail."""
+        with self._lock:
+            image_url = self._sources.get(key)
+            if image_url is None or key in self._pending or self._failed_locked(key):
+                return False
+            self._pending.add(key)
+        if self.is_ready(key):
+            with self._lock:
+                self._pending.discard(key)
+            return False
+        self._executor.submit(self._generate, key, image_url)
+        return True
+
+    def prefetch(self, image_url: str) -> str:
+        """Registers an image and starts building its thumbnail in the background."""
+        key = self.register(image_url)
+        self.schedule(key)
+        return key
+
+    def _generate(self, key: str, image_url: str):
+        try:
+            data = self._download(image_url)
+            with Image.open(io.BytesIO(data)) as img:
+                img.draft("RGB", (THUMB_SIZE[0] * 2, THUMB_SIZE[1] * 2))  # Cheap JPEG downscale while decoding
+                img = img.convert("RGB")
+                img.thumbnail(THUMB_SIZE, Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                img.save(buffer, format=THUMB_FORMAT, quality=THUMB_QUALITY, optimize=True)
+
+            path = self.path_for(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(buffer.getvalue())
+            os.replace(tmp_path, path)  # Atomic, so a half-written file is never served
+            logging.debug(f"Thumbnail {key} built from {image_url} ({len(data)} -> {buffer.tell()} bytes)")
+            with self._lock:
+                self._built += 1
+                prune = self._built == 1 or self._built % self._PRUNE_EVERY == 0  # First build, then periodically
+            if prune:
+                self._prune_disk()
+        except Exception as e:
+            logging.warning(f"Could not build thumbnail for {image_url}: {e}")
+            with self._lock:
+                # Keep serving the original instead of retrying on every view, until the failure expires
+                self._failed[key] = time.monotonic()
+                self._failed.move_to_end(key)
+                while len(self._failed) > self.max_registered:
+                    self._failed.popitem(last=False)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _prune_disk(self):
+        """Deletes the oldest thumbnails (by modification time) until the directory is under disk_max_bytes."""
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another worker is already pruning
+        try:
+            files, total = [], 0
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    if not name.endswith(_EXTENSION):
+                        continue  # Leaves in-progress .tmp files alone
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+            if total <= self.disk_max_bytes:
+                return
+            target = self.disk_max_bytes * 0.9  # Some headroom, so the next builds don't prune again at once
+            for _, size, path in sorted(files):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                with self._lock:
+                    self._evicted_files += 1
+            logging.info(f"Pruned thumbnail directory {self.directory} to {total} bytes.")
+        finally:
+            self._prune_lock.release()
+
+    @staticmethod
+    def _download(image_url: str) -> bytes:
+        response = get_http_session().get(image_url, timeout=THUMB_FETCH_TIMEOUT, stream=True)
+        try:
+            response.raise_for_status()
+            chunks, size = [], 0
+            for chunk in response.iter_content(64 * 1024):
+                size += len(chunk)
+                if size > THUMB_MAX_SOURCE_BYTES:
+                    raise ValueError(f"image larger than {THUMB_MAX_SOURCE_BYTES} bytes")
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            response.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'format': THUMB_FORMAT,
+                'size': list(THUMB_SIZE),
+                'registered': len(self._sources),
+                'max_registered': self.max_registered,
+                'pending': len(self._pending),
+                'failed': len(self._failed),
+                'built': self._built,
+                'evicted_files': self._evicted_files,
+                'disk_max_bytes': self.disk_max_bytes,
+            }
+
+
+# Process-wide thumbnail service
+thumbnail_service = ThumbnailService(THUMB_DIR)
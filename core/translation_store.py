@@ -0,0 +1,145 @@
+# BharatVaani/core/translation_store.py
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from config.settings import (
+    TRANSLATION_STORE_ENABLED, TRANSLATION_STORE_FILE, TRANSLATION_STORE_MAX_ENTRIES, TRANSLATION_STORE_MAX_AGE_DAYS
+)
+
+_TOUCH_INTERVAL = 3600  # A read refreshes a row's access time at most this often (seconds), to keep reads cheap
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class TranslationStore:
+    """
+    Translations keyed by (article_id, language, model), in their own SQLite table.
+    Replaces the per-article entries that used to be written into user_preferences.json and the cookie session.
+
+    - Each row remembers a hash of the text it was translated from, so a lookup that passes the source text
+      misses when the article's text has changed since. Rows imported from the preferences file
+      (import_legacy) have no source hash and match any source text.
+    - Bounded: rows older than `max_age_days` are dropped, and beyond `max_entries` the least recently used
+      rows are evicted. Pruning runs on open and every _PRUNE_EVERY writes.
+    """
+
+    _PRUNE_EVERY = 200
+
+    def __init__(self, path: str, max_entries: int = TRANSLATION_STORE_MAX_ENTRIES,
+                 max_age_days: float = TRANSLATION_STORE_MAX_AGE_DAYS):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "article_id TEXT NOT NULL, language TEXT NOT NULL, model TEXT NOT NULL, "
+            "source_hash TEXT NOT NULL, text TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+            "PRIMARY KEY (article_id, language, model))")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS translations_created ON translations (created)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed)")
+        self._conn.commit()
+        with self._lock:
+            self._prune_locked()
+
+    def get(self, article_id: str, language: str, model: str, source_text: Optional[str] = None) -> Optional[str]:
+        """The stored translation, or None. With `source_text`, only a translation of exactly that text counts."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, source_hash, created, accessed FROM translations "
+                "WHERE article_id = ? AND language = ? AND model = ?", (article_id, language, model)).fetchone()
+            if (row is None or now - row[2] > self.max_age_seconds
+                    or (source_text is not None and row[1] and row[1] != source_hash(source_text))):
+                self.misses += 1
+                return None
+            self.hits += 1
+            if now - row[3] > _TOUCH_INTERVAL:
+                self._conn.execute(
+                    "UPDATE translations SET accessed = ? WHERE article_id = ? AND language = ? AND model = ?",
+                    (now, article_id, language, model))
+                self._conn.commit()
+        return row[0]
+
+    def put(self, article_id: str, language: str, model: str, source_text: str, text: str):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(article_id, language, model, source_hash, text, created, accessed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (article_id, language, model, source_hash(source_text), text, now, now))
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune_locked()
+            self._conn.commit()
+
+    def import_legacy(self, entries: Iterable[Tuple[str, str, str, str]]) -> int:
+        """
+        Adds (article_id, language, model, text) rows whose source text is unknown, without replacing rows
+        already stored. Returns how many were added.
+        """
+        now = time.time()
+        with self._lock:
+            added = 0
+            for article_id, language, model, text in entries:
+                added += self._conn.execute(
+                    "INSERT OR IGNORE INTO translations "
+                    "(article_id, language, model, source_hash, text, created, accessed) VALUES (?, ?, ?, '', ?, ?, ?)",
+                    (article_id, language, model, text, now, now)).rowcount
+            self._prune_locked()
+        return added
+
+    def _prune_locked(self):
+        expired = self._conn.execute("DELETE FROM translations WHERE created < ?",
+                                     (time.time() - self.max_age_seconds,)).rowcount
+        overflow = self._conn.execute(
+            "DELETE FROM translations WHERE rowid IN (SELECT rowid FROM translations "
+            "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self.max_entries,)).rowcount
+        self._conn.commit()
+        self.evictions += max(expired, 0) + max(overflow, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'max_age_days': round(self.max_age_seconds / 86400, 1),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def _open_store() -> Optional[TranslationStore]:
+    if not TRANSLATION_STORE_ENABLED:
+        return None
+    try:
+        return TranslationStore(TRANSLATION_STORE_FILE)
+    except sqlite3.Error as e:
+        logging.error(f"Could not open translation store at {TRANSLATION_STORE_FILE}: {e}. Translations are not stored.")
+        return None
+
+
+# Process-wide store; None when disabled or the database could not be opened
+translation_store = _open_store()
@@ -1,106 +1,229 @@
 # BharatVaani/core/translator.py
 
 import logging
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from config.settings import INDIAN_LANGUAGES
+from typing import List, Optional
 
-# Global model and tokenizer instances
-tokenizer = None
-model = None
+from config.settings import (
+    INDIAN_LANGUAGES, TRANSLATOR_MODEL_NAME, TRANSLATOR_BACKEND, TRANSLATOR_USE_FAST_TOKENIZER,
+    TRANSLATOR_INTRA_OP_THREADS, TRANSLATOR_INTER_OP_THREADS, TRANSLATION_BATCH_SIZE, TRANSLATION_MAX_BATCH_TOKENS,
+    TRANSLATION_MAX_SENTENCE_TOKENS
+)
+from .lazy_models import LazyModel
+from .utils import split_sentences
 
-def init_translator():
-    """
-    Loads IndicTrans2 model and tokenizer into memory.
-    """
-    global tokenizer, model
-    if tokenizer is None or model is None:
+
+# Backend actually serving translations (differs from TRANSLATOR_BACKEND after a fallback); set when the model loads
+active_backend: Optional[str] = None
+
+
+def _load_tokenizer():
+    from transformers import AutoTokenizer  # Deferred: importing transformers alone takes seconds
+    if TRANSLATOR_USE_FAST_TOKENIZER:
         try:
-            logging.info("Initializing IndicTrans2 model...")
-            model_name = "ai4bharat/indictrans2-en-indic-1B"
-            tokenizer_local = AutoTokenizer.from_pretrained(
-                model_name,
-                use_fast=False,
-                trust_remote_code=True
-            )
-            model_local = AutoModelForSeq2SeqLM.from_pretrained(
-                model_name,
-                trust_remote_code=True
-            )
-            tokenizer = tokenizer_local
-            model = model_local
-            logging.info("IndicTrans2 initialized successfully.")
+            return AutoTokenizer.from_pretrained(TRANSLATOR_MODEL_NAME, use_fast=True, trust_remote_code=True)
         except Exception as e:
-            logging.error(f"Error initializing IndicTrans2: {e}", exc_info=True)
-            tokenizer = None
-            model = None
-    return tokenizer, model
+            logging.warning(f"Fast tokenizer unavailable for {TRANSLATOR_MODEL_NAME} ({e}); using the slow one.")
+    return AutoTokenizer.from_pretrained(TRANSLATOR_MODEL_NAME, use_fast=False, trust_remote_code=True)
 
 
-def translate_text(text: str, target_lang_code: str) -> str:
-    tokenizer_local, model_local = init_translator()
-    if tokenizer_local is None or model_local is None:
-        logging.error("Translation service unavailable. Model is not loaded.")
-        return "[Translation service unavailable]"
+def _load_pytorch():
+    from transformers import AutoModelForSeq2SeqLM
+    model_local = AutoModelForSeq2SeqLM.from_pretrained(TRANSLATOR_MODEL_NAME, trust_remote_code=True)
+    model_local.eval()
+    return model_local
 
-    if not text or not text.strip():
-        return ""
 
-    if target_lang_code == 'en':
-        return text
-
-    lang_tag_map = {
-        "hi": "hin_Deva",
-        "bn": "ben_Beng",
-        "gu": "guj_Gujr",
-        "kn": "kan_Knda",
-        "ml": "mal_Mlym",
-        "mr": "mar_Deva",
-        "ne": "npi_Deva",
-        "or": "ory_Orya",
-        "pa": "pan_Guru",
-        "sa": "san_Deva",
-        "ta": "tam_Taml",
-        "te": "tel_Telu",
-        "ur": "urd_Arab"
-    }
-
-    if target_lang_code not in lang_tag_map:
-        logging.warning(f"Invalid target language code: '{target_lang_code}'.")
-        return text
+def _load_int8():
+    """fp32 weights with every Linear layer dynamically quantized to int8 (weights int8, activations quantized per batch)."""
+    import torch
+    return torch.quantization.quantize_dynamic(_load_pytorch(), {torch.nn.Linear}, dtype=torch.qint8)
 
-    src_lang_tag = "eng_Latn"
-    tgt_lang_tag = lang_tag_map[target_lang_code]
 
-    try:
-        logging.info(f"Translating text to {target_lang_code} using IndicTrans2.")
+_BACKENDS = {'pytorch': _load_pytorch, 'int8': _load_int8}
+
+
+def _configure_threads():
+    """Applies TRANSLATOR_*_THREADS. Both are process-wide torch settings, so they also apply to the summarizer."""
+    import torch
+    if TRANSLATOR_INTRA_OP_THREADS > 0:
+        torch.set_num_threads(TRANSLATOR_INTRA_OP_THREADS)
+    if TRANSLATOR_INTER_OP_THREADS > 0:
+        try:
+            torch.set_num_interop_threads(TRANSLATOR_INTER_OP_THREADS)
+        except RuntimeError as e:  # Only settable before the first inter-op parallel work in the process
+            logging.warning(f"Could not set inter-op threads to {TRANSLATOR_INTER_OP_THREADS}: {e}")
+    logging.info(f"Translator torch threads: intra-op {torch.get_num_threads()}, "
+                 f"inter-op {torch.get_num_interop_threads()}.")
+
+
+def _build_translator(backend: Optional[str] = None):
+    """IndicTrans2 (tokenizer, model) on the configured backend, falling back to the fp32 PyTorch model."""
+    global active_backend
+    backend = backend or TRANSLATOR_BACKEND
+    if backend not in _BACKENDS:
+        logging.warning(f"Unknown TRANSLATOR_BACKEND '{backend}'; using 'pytorch'.")
+        backend = 'pytorch'
+    _configure_threads()
+    tokenizer_local = _load_tokenizer()
+    if backend != 'pytorch':
+        try:
+            model_local = _BACKENDS[backend]()
+            active_backend = backend
+            return tokenizer_local, model_local
+        except Exception as e:
+            logging.warning(f"Translator backend '{backend}' unavailable ({e}); falling back to 'pytorch'.")
+    model_local = _load_pytorch()
+    active_backend = 'pytorch'
+    return tokenizer_local, model_local
+
+
+# Loaded on first use (or by an explicit warmup), never at import time
+translator_model = LazyModel("translator", _build_translator)
+
 
-        # ✅ Proper format: "<src_tag> <tgt_tag> text"
-        tagged_text = f"{src_lang_tag} {tgt_lang_tag} {text}"
+def init_translator():
+    """
+    Returns the IndicTrans2 (tokenizer, model) pair, loading it into memory on first call.
+    Both are None if loading failed.
+    """
+    loaded = translator_model.get()
+    return loaded if loaded is not None else (None, None)
 
-        inputs = tokenizer_local(
-            tagged_text,
+
+def translator_model_id() -> str:
+    """
+    Identifies the model producing translations (part of the translation store key): int8 output can differ
+    from fp32, so the two never share stored translations. Before the model loads, the configured backend.
+    """
+    backend = active_backend or TRANSLATOR_BACKEND
+    return TRANSLATOR_MODEL_NAME if backend == 'pytorch' else f"{TRANSLATOR_MODEL_NAME}+{backend}"
+
+
+def is_translation(text: str) -> bool:
+    """False for the error/unavailable messages translate_text returns instead of a translation."""
+    return not text.startswith(("[Translation service unavailable]", "[Translation error to "))
+
+
+LANG_TAGS = {
+    "hi": "hin_Deva",
+    "bn": "ben_Beng",
+    "gu": "guj_Gujr",
+    "kn": "kan_Knda",
+    "ml": "mal_Mlym",
+    "mr": "mar_Deva",
+    "ne": "npi_Deva",
+    "or": "ory_Orya",
+    "pa": "pan_Guru",
+    "sa": "san_Deva",
+    "ta": "tam_Taml",
+    "te": "tel_Telu",
+    "ur": "urd_Arab"
+}
+SRC_LANG_TAG = "eng_Latn"
+
+
+def _batches(lengths: List[int], batch_size: int, max_batch_tokens: int) -> List[List[int]]:
+    """
+    Length bucketing: indices sorted by length, cut into batches of at most `batch_size` items whose padded
+    size (items x longest item) stays within `max_batch_tokens`. Similar lengths share a batch, so dynamic
+    padding to each batch's longest sentence wastes little.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches, current = [], []
+    for i in order:
+        longest = lengths[current[0]] if current else lengths[i]
+        if current and (len(current) >= batch_size or longest * (len(current) + 1) > max_batch_tokens):
+            batches.append(current)
+            current = []
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _translate_sentences(tokenizer_local, model_local, sentences: List[str], tgt_lang_tag: str,
+                         batch_size: int = TRANSLATION_BATCH_SIZE) -> List[str]:
+    """Translates sentences with one generate call per length-bucketed batch; results in input order."""
+    import torch  # Already loaded along with the model
+
+    tagged = [f"{SRC_LANG_TAG} {tgt_lang_tag} {sentence}" for sentence in sentences]  # "<src_tag> <tgt_tag> text"
+    # Tokenized once for all batches: the lengths drive the bucketing, and each batch only pads the ids
+    encoded = tokenizer_local(tagged, truncation=True, max_length=TRANSLATION_MAX_SENTENCE_TOKENS)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+
+    def generate(batch: List[int]) -> List[str]:
+        inputs = tokenizer_local.pad(
+            {key: [values[i] for i in batch] for key, values in encoded.items()},
+            padding="longest",  # Dynamic padding: only up to this batch's longest sentence
             return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=512,
         )
+        with torch.inference_mode():  # No autograd bookkeeping during generation
+            generated_tokens = model_local.generate(
+                **inputs,
+                max_length=TRANSLATION_MAX_SENTENCE_TOKENS,
+            )
+        return tokenizer_local.batch_decode(generated_tokens, skip_special_tokens=True)
 
-        generated_tokens = model_local.generate(
-            **inputs,
-            max_length=512,
-        )
+    translations = [""] * len(sentences)
+    for batch in _batches(lengths, batch_size, TRANSLATION_MAX_BATCH_TOKENS):
+        try:
+            results = generate(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                raise
+            # One bad sentence (or an out-of-memory batch) should not fail its neighbours: retry one by one
+            logging.warning(f"Translation batch of {len(batch)} failed ({e}); retrying sentences individually.")
+            results = [generate([i])[0] for i in batch]
+        for i, translation in zip(batch, results):
+            translations[i] = translation
+    return translations
 
-        translation = tokenizer_local.batch_decode(
-            generated_tokens,
-            skip_special_tokens=True
-        )[0]
 
-        logging.info(f"Translation successful to {target_lang_code}.")
-        return translation
+def translate_texts(texts: List[str], target_lang_code: str, batch_size: int = TRANSLATION_BATCH_SIZE) -> List[str]:
+    """
+    Document translation of several texts at once, results in input order. Every text is split into
+    paragraphs and sentences (Indic-aware, see split_sentences); the sentences of all texts are translated
+    together in length-bucketed batches and reassembled, so long articles are no longer cut off at 512 tokens
+    and short ones share forward passes.
+    """
+    if target_lang_code == 'en':
+        return [text or "" for text in texts]
+    if target_lang_code not in LANG_TAGS:
+        logging.warning(f"Invalid target language code: '{target_lang_code}'.")
+        return [text or "" for text in texts]
+    if not any(text and text.strip() for text in texts):
+        return ["" for _ in texts]
 
+    tokenizer_local, model_local = init_translator()
+    if tokenizer_local is None or model_local is None:
+        logging.error("Translation service unavailable. Model is not loaded.")
+        return ["[Translation service unavailable]" if text and text.strip() else "" for text in texts]
+
+    # layout[text][paragraph] = positions of its sentences in `sentences`
+    sentences: List[str] = []
+    layout: List[List[List[int]]] = []
+    for text in texts:
+        paragraphs = []
+        for paragraph in (text or "").split("\n"):
+            parts = split_sentences(paragraph)
+            paragraphs.append(list(range(len(sentences), len(sentences) + len(parts))))
+            sentences.extend(parts)
+        layout.append(paragraphs)
+
+    unique = list(dict.fromkeys(sentences))  # Datelines, bylines and boilerplate repeat across articles
+    try:
+        logging.info(f"Translating {len(unique)} sentences of {len(texts)} texts to {target_lang_code} using IndicTrans2.")
+        results = dict(zip(unique, _translate_sentences(tokenizer_local, model_local, unique,
+                                                        LANG_TAGS[target_lang_code], batch_size)))
+        translated = [results[sentence] for sentence in sentences]
     except Exception as e:
         logging.error(f"Error during IndicTrans2 translation: {e}", exc_info=True)
-        return f"[Translation error to {target_lang_code}: {e}]"
+        return [f"[Translation error to {target_lang_code}: {e}]" if text and text.strip() else "" for text in texts]
+
+    logging.info(f"Translation successful to {target_lang_code}.")
+    return ["\n".join(" ".join(translated[p] for p in paragraph) for paragraph in paragraphs).strip()
+            for paragraphs in layout]
 
-# Call init_translator once on import
-init_translator()
+
+def translate_text(text: str, target_lang_code: str) -> str:
+    return translate_texts([text], target_lang_code)[0]  # Empty text returns "" without loading the model
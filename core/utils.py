@@ -1,21 +1,40 @@
 # BharatVaani/core/utils.py
 
 import hashlib
+import html
 import re
+from typing import List
 from textblob import TextBlob
-import nltk
 import os
 import json
 
-# Download NLTK data required by TextBlob (only if not already present)
-try:
-    nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-    print("NLTK 'vader_lexicon' not found. Downloading...")
-    nltk.download('vader_lexicon', quiet=True)
-    print("NLTK 'vader_lexicon' downloaded successfully.")
-except Exception as e:
-    print(f"NLTK download check failed: {e}")
+from config.settings import (
+    SENTIMENT_CACHE_ENABLED, SENTIMENT_CACHE_SIZE, SENTIMENT_CACHE_PERSIST, SENTIMENT_CACHE_DISK_SIZE, CACHE_DB_FILE,
+    SENTIMENT_BACKEND
+)
+from .cache import TieredCache
+from .lazy_models import LazyModel
+from .sentiment import get_lexicon_scorer
+
+
+def ensure_nltk_data():
+    """
+    Downloads the NLTK data used by the NLP helpers if it is not already present.
+    Part of the explicit warmup rather than an import-time side effect.
+    """
+    import nltk
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        print("NLTK 'vader_lexicon' not found. Downloading...")
+        nltk.download('vader_lexicon', quiet=True)
+        print("NLTK 'vader_lexicon' downloaded successfully.")
+    except Exception as e:
+        print(f"NLTK download check failed: {e}")
+    return True
+
+
+nltk_data = LazyModel("nltk_data", ensure_nltk_data)
 
 PREFS_FILE = os.path.join(os.getcwd(), "BharatVaani", "data", "user_preferences.json")
 
@@ -32,25 +51,81 @@ def save_user_preferences(prefs):
         json.dump(prefs, f, ensure_ascii=False, indent=2)
 
 
+_TAG_PATTERN = re.compile(r'<[^>\x00]*>')  # \x00 separates texts in a batch; tags never span it
+# Emoji and pictographs only. Anything Indic (Devanagari Extended, Vedic marks, Urdu presentation forms,
+# the Brahmic scripts in the supplementary planes) and ZWJ/ZWNJ between letters must survive.
+_EMOJI_CHARS = (
+    "\U0001F000-\U0001FAFF"  # Mahjong/cards, enclosed alphanumerics, flags, pictographs, emoticons, transport
+    "\u2600-\u27BF"  # Misc symbols and dingbats
+    "\u2B00-\u2BFF"  # Arrows and stars
+    "\u231A\u231B\u23E9-\u23FA\u24C2"
+)
+_MAY_CONTAIN_EMOJI = re.compile("[\u231A-\U0010FFFF]")  # From the lowest code point in _EMOJI_CHARS up
+_EMOJI_PATTERN = re.compile(
+    f"(?:[{_EMOJI_CHARS}][\uFE0F\u200D\u20E3\U000E0020-\U000E007F]*)+"  # Incl. joiners/selectors of emoji sequences
+)
+_BATCH_SEPARATOR = "\x00"
+
+
+def clean_texts(texts: List[str]) -> List[str]:
+    """
+    Batch version of clean_text: strips HTML tags and entities, emojis and extra whitespace.
+    The whole batch is joined and cleaned with one pass per pattern, then split again; passes that
+    can't match (no '<', no '&', ASCII-only or no code point in the emoji blocks) are skipped.
+    Non-string items come back as "".
+    """
+    if not texts:
+        return []
+    joined = _BATCH_SEPARATOR.join(t.replace(_BATCH_SEPARATOR, "") if isinstance(t, str) else "" for t in texts)
+    if '<' in joined:
+        joined = _TAG_PATTERN.sub('', joined)
+    if '&' in joined:
+        joined = html.unescape(joined)
+    if not joined.isascii() and _MAY_CONTAIN_EMOJI.search(joined):
+        joined = _EMOJI_PATTERN.sub('', joined)
+    joined = ' '.join(joined.split())  # Collapses whitespace runs; \x00 isn't whitespace, so texts stay apart
+    return [t.strip() for t in joined.split(_BATCH_SEPARATOR)]
+
+
 def clean_text(text: str) -> str:
-    """Removes common HTML tags, extra whitespace, and emojis from text."""
+    """Removes HTML tags and entities, extra whitespace, and emojis from text."""
     if not isinstance(text, str):
         return ""
-    text = re.sub(r'<.*?>', '', text)  # Remove HTML tags
-    text = re.sub(r'\s+', ' ', text).strip()  # Replace multiple spaces with single space
-    # Remove emojis (basic regex, might not catch all)
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE
-    )
-    text = emoji_pattern.sub(r'', text)
-    return text
+    return clean_texts([text])[0]
+
+
+# Sentence ends: Latin punctuation, the Devanagari danda/double danda and the Urdu full stop, plus any closing
+# quotes/brackets, followed by whitespace
+_SENTENCE_BOUNDARY = re.compile("[.!?\u0964\u0965\u06D4]+[\"'\u201D\u2019)\\]]*\\s+")
+_ABBREVIATIONS = frozenset(
+    "mr mrs ms dr prof sr jr st mt no nos vs etc inc ltd co corp gov govt gen lt col capt sgt rep sen hon "
+    "rs approx dept est fig jan feb mar apr jun jul aug sep sept oct nov dec e.g i.e".split()
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Splits text into sentences at '.', '!', '?', '।', '॥' and '۔'. A period does not end a sentence after an
+    abbreviation ("Dr.", "Rs."), an initial or dotted acronym ("A.", "U.S."), or when a lowercase letter follows.
+    Sentences are returned stripped; joining them with spaces restores the text up to whitespace.
+    """
+    sentences, start = [], 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        punctuation = match.group(0).rstrip()
+        if punctuation.startswith(".") and punctuation.rstrip("\"'\u201D\u2019)]") == ".":
+            word = text[start:match.start()].rsplit(None, 1)[-1] if text[start:match.start()].strip() else ""
+            following = text[match.end():match.end() + 1]
+            if (word.lower().lstrip("(\"'") in _ABBREVIATIONS or re.fullmatch(r"(?:[A-Za-z]\.)*[A-Za-z]", word)
+                    or following.islower()):
+                continue
+        sentence = text[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
 
 
 def get_hash_key(text: str) -> str:
@@ -58,35 +133,90 @@ def get_hash_key(text: str) -> str:
     return hashlib.md5(text.encode('utf-8')).hexdigest()[:10]
 
 
-def analyze_sentiment(text: str) -> dict:
+sentiment_cache = TieredCache("sentiment", SENTIMENT_CACHE_SIZE,
+                              db_path=CACHE_DB_FILE if SENTIMENT_CACHE_PERSIST else None,
+                              max_disk_entries=SENTIMENT_CACHE_DISK_SIZE) if SENTIMENT_CACHE_ENABLED else None
+
+
+_UNKNOWN_SENTIMENT = {"label": "Unknown", "score": 0, "emoji": "❓", "color": "#6c757d"}
+_ERROR_SENTIMENT = {"label": "Error", "score": 0, "emoji": "⚠️", "color": "#ffc107"} # Yellow for error
+
+
+def _sentiment_from_polarity(polarity: float) -> dict:
+    if polarity > 0.1:
+        return {"label": "Positive", "score": polarity, "emoji": "😊", "color": "#28a745"} # Green
+    elif polarity < -0.1:
+        return {"label": "Negative", "score": polarity, "emoji": "😟", "color": "#dc3545"} # Red
+    else:
+        return {"label": "Neutral", "score": polarity, "emoji": "😐", "color": "#6c757d"} # Gray
+
+
+def _score_sentiments(texts: List[str]) -> List[dict]:
+    """Scores texts with the configured SENTIMENT_BACKEND, without caching."""
+    if SENTIMENT_BACKEND == "lexicon":
+        try:
+            return [_sentiment_from_polarity(float(p)) for p in get_lexicon_scorer().polarities(texts)]
+        except Exception as e:
+            print(f"Batch sentiment analysis failed, falling back to TextBlob: {e}")
+    results = []
+    for text in texts:
+        try:
+            results.append(_sentiment_from_polarity(TextBlob(text).sentiment.polarity)) # -1.0 to +1.0
+        except Exception as e:
+            print(f"Sentiment analysis failed: {e}") # Log to console for debugging
+            results.append(dict(_ERROR_SENTIMENT))
+    return results
+
+
+def _sentiment_cache_key(text: str) -> str:
+    return hashlib.sha1(f"{SENTIMENT_BACKEND}\x00{' '.join(text.split())}".encode("utf-8")).hexdigest()
+
+
+def analyze_sentiment_batch(texts: List[str]) -> List[dict]:
     """
-    Performs sentiment analysis on the given text using TextBlob.
-    Returns a dictionary with label, score, emoji, and color.
+    Sentiment of many texts at once; same result dicts as analyze_sentiment.
+    Cached results are reused and everything else is scored in a single batch.
     """
-    if not isinstance(text, str) or not text.strip():
-        return {"label": "Unknown", "score": 0, "emoji": "❓", "color": "#6c757d"}
+    results = [None] * len(texts)
+    pending = {}  # cache key -> indices of texts still to score
+    for index, text in enumerate(texts):
+        if not isinstance(text, str) or not text.strip():
+            results[index] = dict(_UNKNOWN_SENTIMENT)
+            continue
+        key = _sentiment_cache_key(text)
+        cached = sentiment_cache.get(key) if sentiment_cache is not None else None
+        if cached is not None:
+            results[index] = dict(cached)
+        else:
+            pending.setdefault(key, []).append(index)
 
-    try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity # -1.0 to +1.0
+    if pending:
+        keys = list(pending)
+        for key, result in zip(keys, _score_sentiments([texts[pending[key][0]] for key in keys])):
+            if sentiment_cache is not None and result["label"] != "Error":  # Don't pin transient failures
+                sentiment_cache.put(key, result)
+            for index in pending[key]:
+                results[index] = dict(result)  # Callers attach these to articles; keep the cached copy private
+    return results
 
-        if polarity > 0.1:
-            return {"label": "Positive", "score": polarity, "emoji": "😊", "color": "#28a745"} # Green
-        elif polarity < -0.1:
-            return {"label": "Negative", "score": polarity, "emoji": "😟", "color": "#dc3545"} # Red
-        else:
-            return {"label": "Neutral", "score": polarity, "emoji": "😐", "color": "#6c757d"} # Gray
-    except Exception as e:
-        print(f"Sentiment analysis failed: {e}") # Log to console for debugging
-        return {"label": "Error", "score": 0, "emoji": "⚠️", "color": "#ffc107"} # Yellow for error
+
+def analyze_sentiment(text: str) -> dict:
+    """
+    Performs sentiment analysis on the given text (lexicon scorer or TextBlob, see SENTIMENT_BACKEND).
+    Returns a dictionary with label, score, emoji, and color.
+    Results are memoized by a hash of the whitespace-normalized text (see SENTIMENT_CACHE_*).
+    """
+    return analyze_sentiment_batch([text])[0]
 
 
 CACHE_FILE = os.path.join(os.getcwd(), "BharatVaani", "data", "latest_articles.json")
 
 def save_cached_articles(articles):
     os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+    tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp"  # Per process, in case several workers refresh at once
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(articles, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CACHE_FILE)  # Atomic swap so the reading list never loads a half-written file
 
 def load_cached_articles():
     if not os.path.exists(CACHE_FILE):
@@ -1,7 +1,7 @@
 # main.py
 
-from flask import Flask, redirect, request, session, url_for, jsonify, render_template, send_file, flash
-import os, json, logging, re, hashlib, io
+from flask import Flask, redirect, request, session, url_for, jsonify, render_template, send_file, flash, g
+import os, json, logging, re, hashlib, io, time
 from datetime import datetime, timedelta  # Import timedelta
 from typing import Dict
 import uuid
@@ -10,8 +10,7 @@ from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 import requests  # Import requests for Gemini API calls
 
-from core.utils import load_cached_articles, save_cached_articles
-from core.utils import generate_unique_id
+from core.utils import load_cached_articles
 from core.translator import translate_text
 
 
@@ -78,31 +77,93 @@ try:
         APP_NAME, APP_VERSION, APP_DESCRIPTION, FUTURE_PLANS,
         NEWS_CATEGORIES, INDIAN_LANGUAGES, DEFAULT_NEWS_CATEGORY,
         DEFAULT_TARGET_LANGUAGE, DEFAULT_ARTICLE_LIMIT, RSS_FEEDS,
-        WHAT_IF_MODELS, WHAT_IF_MODEL_TRAITS, CATEGORY_KEYWORDS,
-        get_google_client_config, SUMMARIZER_MODEL_NAME
+        WHAT_IF_MODELS, WHAT_IF_MODEL_TRAITS,
+        get_google_client_config, SUMMARIZER_MODEL_NAME, INGEST_ENABLED, INGEST_FIRST_LOAD_WAIT, INGEST_INTERVAL_SECONDS,
+        THUMB_ENABLED, THUMB_CACHE_MAX_AGE, MODEL_PRELOAD, READINESS_REQUIRED_MODELS, SUMMARIZE_BATCH_MAX_TEXTS,
+        PRESUMMARIZE_ENABLED, PRETRANSLATE_ENABLED
     )
 except ImportError as e:
     logging.critical(f"Failed to import from config.settings: {e}. Ensure config/settings.py is correct.")
     raise
 
 try:
-    from core.fetcher import fetch_top_headlines, assign_categories_to_articles
+    from core.analytics import AnalyticsAggregator
 except ImportError as e:
-    logging.critical(f"Failed to import from core.fetcher: {e}. Ensure core/fetcher.py is correct.")
+    logging.critical(f"Failed to import from core.analytics: {e}. Ensure core/analytics.py is correct.")
     raise
 
 try:
-    from core.summarizer import summarize_text
+    from core.cache import cache_stats
+except ImportError as e:
+    logging.critical(f"Failed to import from core.cache: {e}. Ensure core/cache.py is correct.")
+    raise
+
+try:
+    from core.feed_health import feed_health
+except ImportError as e:
+    logging.critical(f"Failed to import from core.feed_health: {e}. Ensure core/feed_health.py is correct.")
+    raise
+
+try:
+    from core.http_client import get_pool_stats
+except ImportError as e:
+    logging.critical(f"Failed to import from core.http_client: {e}. Ensure core/http_client.py is correct.")
+    raise
+
+try:
+    from core.ingest import ingestion_service
+except ImportError as e:
+    logging.critical(f"Failed to import from core.ingest: {e}. Ensure core/ingest.py is correct.")
+    raise
+
+try:
+    from core.lazy_models import warm_up, start_warm_up, preload_once, models_status, models_ready
+except ImportError as e:
+    logging.critical(f"Failed to import from core.lazy_models: {e}. Ensure core/lazy_models.py is correct.")
+    raise
+
+try:
+    from core.presummarizer import pre_summarizer
+except ImportError as e:
+    logging.critical(f"Failed to import from core.presummarizer: {e}. Ensure core/presummarizer.py is correct.")
+    raise
+
+try:
+    from core.pretranslator import pre_translator
+except ImportError as e:
+    logging.critical(f"Failed to import from core.pretranslator: {e}. Ensure core/pretranslator.py is correct.")
+    raise
+
+try:
+    from core.search import search_index
+except ImportError as e:
+    logging.critical(f"Failed to import from core.search: {e}. Ensure core/search.py is correct.")
+    raise
+
+try:
+    from core.thumbnails import thumbnail_service, THUMB_MIMETYPE
+except ImportError as e:
+    logging.critical(f"Failed to import from core.thumbnails: {e}. Ensure core/thumbnails.py is correct.")
+    raise
+
+try:
+    from core.summarizer import summarize_text, summarize_texts
 except ImportError as e:
     logging.critical(f"Failed to import from core.summarizer: {e}. Ensure core/summarizer.py is correct.")
     raise
 
 try:
-    from core.translator import translate_text
+    from core.translator import LANG_TAGS, is_translation, translate_text, translate_texts, translator_model_id
 except ImportError as e:
     logging.critical(f"Failed to import from core.translator: {e}. Ensure core/translator.py is correct.")
     raise
 
+try:
+    from core.translation_store import translation_store
+except ImportError as e:
+    logging.critical(f"Failed to import from core.translation_store: {e}. Ensure core/translation_store.py is correct.")
+    raise
+
 try:
     from core.audio import generate_audio_data
 except ImportError as e:
@@ -110,7 +171,7 @@ except ImportError as e:
     raise
 
 try:
-    from core.utils import analyze_sentiment, clean_text, get_hash_key
+    from core.utils import clean_text, get_hash_key
 except ImportError as e:
     logging.critical(f"Failed to import from core.utils: {e}. Ensure core/utils.py is correct.")
     raise
@@ -149,6 +210,24 @@ def load_preferences() -> dict:
 
 # Initialize global cache for user preferences
 user_prefs_cache = load_preferences()
+if 'translations' in user_prefs_cache and translation_store is not None:
+    # Translations used to be kept here ({article_id: {"text", "language"}}); move them into the translation store
+    # once and shrink the file. Their model wasn't recorded, so they are filed under the current one.
+    legacy_model_id = translator_model_id()
+    imported = translation_store.import_legacy(
+        (article_id, entry['language'], legacy_model_id, entry['text'])
+        for article_id, entry in (user_prefs_cache.pop('translations') or {}).items()
+        if isinstance(entry, dict) and entry.get('language') in LANG_TAGS
+        and entry.get('text') and is_translation(entry['text'])
+    )
+    try:
+        with open(PREF_FILE_PATH, 'w') as f:
+            json.dump(user_prefs_cache, f, indent=4)
+        logging.info(f"Moved {imported} legacy translations from the preferences file into the translation store.")
+    except Exception as e:
+        logging.error(f"Error saving preferences to {PREF_FILE_PATH}: {e}")
+pre_translator.demand.set_preference(user_prefs_cache.get('selected_language', DEFAULT_TARGET_LANGUAGE))
+bookmark_analytics = AnalyticsAggregator()  # Counts over the reading list, synced on each render
 
 
 def save_preferences(preferences: dict):
@@ -214,6 +293,35 @@ def get_reading_progress():
     return set(user_prefs_cache.get('read_articles', []))
 
 
+def ensure_scope_snapshot(scope: str):
+    """
+    Makes sure a scope has a snapshot to read. With background ingestion, only a cold start (no snapshot yet)
+    waits, and at most INGEST_FIRST_LOAD_WAIT seconds. With ingestion disabled nothing publishes in the
+    background, so the request refreshes the scope itself when it has no snapshot or one older than
+    INGEST_INTERVAL_SECONDS.
+    """
+    snapshot = ingestion_service.get_snapshot(scope)
+    if INGEST_ENABLED:
+        if snapshot is None:
+            ingestion_service.wait_for_snapshot(scope, timeout=INGEST_FIRST_LOAD_WAIT)
+    elif snapshot is None or (datetime.now() - snapshot.refreshed_at).total_seconds() > INGEST_INTERVAL_SECONDS:
+        ingestion_service.refresh_now(scope)
+
+
+def get_scope_articles(scope: str, limit=None) -> list:
+    """Reads the ingestion snapshot of a scope (see ensure_scope_snapshot)."""
+    ensure_scope_snapshot(scope)
+    return ingestion_service.get_articles(scope, limit=limit)
+
+
+@app.template_global()
+def thumb_url(image_url):
+    """URL of the cached thumbnail for an article image (or the image itself if thumbnails are off)."""
+    if not image_url or not THUMB_ENABLED:
+        return image_url
+    return url_for('thumbnail', key=thumbnail_service.register(image_url))
+
+
 # --- Flask Routes ---
 
 @app.before_request
@@ -227,6 +335,63 @@ def before_request_log_session():
     logging.debug(f"BEFORE_REQUEST: Session contents: {dict(session)}")
 
 
+@app.before_request
+def ensure_ingestion_started():
+    # Started lazily so only the process that actually serves requests runs the scheduler
+    # (the debug reloader's parent process never gets here)
+    if INGEST_ENABLED:
+        ingestion_service.start()
+    if PRESUMMARIZE_ENABLED:
+        pre_summarizer.start()
+    if PRETRANSLATE_ENABLED:
+        pre_translator.start()
+
+
+# Probes, thumbnails and static files don't count as traffic: they are frequent and cheap, and would keep the
+# background workers paused for good. Unmatched URLs (endpoint None) don't count either.
+UNTRACKED_ENDPOINTS = {'healthz', 'readyz', 'thumbnail', 'static'}
+
+
+@app.before_request
+def track_request_start():
+    # The pre-summarizer and pre-translator only work while no requests are being served
+    if request.endpoint is None or request.endpoint in UNTRACKED_ENDPOINTS:
+        return
+    g.tracked_request = True
+    pre_summarizer.request_started()
+    pre_translator.request_started()
+
+
+@app.teardown_request
+def track_request_end(exception=None):
+    # Only requests counted on the way in are counted out
+    if not g.pop('tracked_request', False):
+        return
+    pre_summarizer.request_finished()
+    pre_translator.request_finished()
+
+
+@app.before_request
+def ensure_models_warming():
+    # Same reasoning as ingestion: only the serving process pays for loading the models.
+    # When /readyz gates on models (opt-in), those are warmed even without preloading; otherwise a load balancer
+    # waiting for /readyz would never send the traffic that loads them lazily.
+    if MODEL_PRELOAD:
+        preload_once()
+    elif READINESS_REQUIRED_MODELS:
+        preload_once(READINESS_REQUIRED_MODELS)
+
+
+@app.cli.command('warmup')
+def warmup_command():
+    """Loads every model now and prints how long each took (also fills the Hugging Face download cache)."""
+    for name, status in warm_up().items():
+        if status['loaded']:
+            print(f"{name}: loaded in {status['load_seconds']}s")
+        else:
+            print(f"{name}: FAILED ({status['error']})")
+
+
 @app.route('/')
 def root():
     app_state = get_app_state()
@@ -366,29 +531,22 @@ def dashboard():
     })
     user_prefs_cache['selected_category'] = selected_category
     user_prefs_cache['selected_language'] = selected_language
+    pre_translator.demand.set_preference(selected_language)
     user_prefs_cache['article_limit'] = article_limit
     user_prefs_cache['selected_scope'] = selected_scope
     user_prefs_cache['sort_by'] = sort_by  # New: Save sort_by to preferences
     save_preferences(user_prefs_cache)  # Save updated preferences
     session.modified = True
 
-    news_data = fetch_top_headlines(category=selected_category, country="in", page_size=article_limit,
-                                    selected_scope=selected_scope)
-
-    # Pass CATEGORY_KEYWORDS to assign_categories_to_articles
-    news_data = assign_categories_to_articles(news_data, CATEGORY_KEYWORDS)
-
-    for article in news_data:
-        if not article.get("id"):
-            article["id"] = generate_unique_id(article)
+    # Articles are fetched, categorized and sentiment-scored by the background ingestion service
+    if search_query:
+        # Ranked search over everything ingestion has indexed (all scopes, earlier refreshes), best match first
+        news_data = [dict(article) for article, _ in search_index.search(search_query, limit=article_limit)]
+    else:
+        news_data = get_scope_articles(selected_scope, limit=article_limit)
 
-    save_cached_articles(news_data)
-
-    # Initialize analytics data structures
-    categories_count = {}
-    sentiments_count = {'Positive': 0, 'Neutral': 0, 'Negative': 0, 'Unknown': 0,
-                        'Error': 0}  # Added 'Unknown' and 'Error'
-    top_entities_map = {}  # Initialize top_entities_map here
+    # Analytics of the whole scope, maintained incrementally by the ingestion service
+    scope_analytics = ingestion_service.get_analytics(selected_scope)
 
     if news_data:
         for article in news_data:
@@ -409,41 +567,19 @@ def dashboard():
                     logging.warning(f"Could not parse date string: {article['published']}")
                     article['published'] = None
 
-            # Assign categories and sentiment for analytics
-            cat = article.get('category', 'Uncategorized')
-            categories_count[cat] = categories_count.get(cat, 0) + 1
-
-            sentiment_result = analyze_sentiment(article.get('summary', ''))
-            article['sentiment_data'] = sentiment_result
-            # Ensure the label exists in sentiments_count, add if not
-            label = sentiment_result.get('label', 'Unknown')
-            sentiments_count[label] = sentiments_count.get(label, 0) + 1
-
-            # Extract entities for analytics
-            entities = re.findall(r'\b[A-Z][a-z]+\s(?:[A-Z][a-z]+)?\b', article.get('summary', ''))
-            for ent in entities:
-                top_entities_map[ent] = top_entities_map.get(ent, 0) + 1
-
-        # Apply search filter after all processing
-        if search_query:
-            news_data = [
-                article for article in news_data
-                if search_query.lower() in article.get('title', '').lower()
-                   or search_query.lower() in article.get('summary', '').lower()
-            ]
-
-        # Apply sorting based on 'sort_by' parameter
-        if sort_by == 'date_desc':
+        # Apply sorting based on 'sort_by' parameter (search results keep their relevance order unless asked)
+        order = 'relevance' if search_query and 'sort_by' not in request.args else sort_by
+        if order == 'date_desc':
             news_data.sort(key=lambda x: x['published'] if isinstance(x['published'], datetime) else datetime.min,
                            reverse=True)
-        elif sort_by == 'date_asc':
+        elif order == 'date_asc':
             news_data.sort(key=lambda x: x['published'] if isinstance(x['published'], datetime) else datetime.max,
                            reverse=False)
-        elif sort_by == 'sentiment_pos':
+        elif order == 'sentiment_pos':
             # Sort by sentiment score, positive first (highest score first)
             news_data.sort(key=lambda x: x.get('sentiment_data', {}).get('score', -2.0),
                            reverse=True)  # Default to -2.0 for unknown/error
-        elif sort_by == 'sentiment_neg':
+        elif order == 'sentiment_neg':
             # Sort by sentiment score, negative first (lowest score first)
             news_data.sort(key=lambda x: x.get('sentiment_data', {}).get('score', 2.0),
                            reverse=False)  # Default to 2.0 for unknown/error
@@ -472,12 +608,13 @@ def dashboard():
         active_tab="news_feed",
         future_plans=FUTURE_PLANS,
         RSS_FEEDS=RSS_FEEDS,
-        categories_count=categories_count,
-        sentiments_count=sentiments_count,
-        total_articles=len(news_data),
+        categories_count=scope_analytics['categories_count'],
+        sentiments_count=scope_analytics['sentiments_count'],
+        total_articles=scope_analytics['total_articles'],  # Same scope-wide set as the counts next to it
+        total_articles_label=f"Articles in {selected_scope}",
         read_articles_count=len(read_articles_for_template),
         bookmark_count=len(bookmarked_articles_for_template),
-        top_entities=sorted(top_entities_map.items(), key=lambda x: x[1], reverse=True)[:10],
+        top_entities=scope_analytics['top_entities'],
         now=datetime.now(),  # Pass datetime.now() to the template
         what_if_model_traits=WHAT_IF_MODEL_TRAITS  # Pass what_if_model_traits
     )
@@ -492,6 +629,7 @@ def api_summarize():
     if not full_text:
         return jsonify({'success': False, 'error': 'No text provided.'}), 400
 
+    pre_summarizer.record_summary_request(full_text)
     summary = summarize_text(full_text)
     if target_language != 'en':
         summary = translate_text(summary, target_language)
@@ -499,6 +637,25 @@ def api_summarize():
     return jsonify({'success': True, 'summary': summary})
 
 
+@app.route('/api/summarize_batch', methods=['POST'])
+def api_summarize_batch():
+    data = request.get_json(silent=True) or {}
+    texts = data.get('texts')
+    target_language = data.get('target_language', 'en')
+
+    if not isinstance(texts, list) or not texts or not all(isinstance(t, str) for t in texts):
+        return jsonify({'success': False, 'error': 'texts must be a non-empty list of strings.'}), 400
+    if len(texts) > SUMMARIZE_BATCH_MAX_TEXTS:
+        return jsonify({'success': False,
+                        'error': f'At most {SUMMARIZE_BATCH_MAX_TEXTS} texts per request.'}), 400
+
+    summaries = summarize_texts(texts)  # Same order as texts
+    if target_language != 'en':
+        summaries = translate_texts(summaries, target_language)  # One batched pass over all their sentences
+
+    return jsonify({'success': True, 'summaries': summaries})
+
+
 @app.route('/api/translate', methods=['POST'])
 def api_translate():
     data = request.get_json()
@@ -508,23 +665,20 @@ def api_translate():
 
     if not text or not target_language or not article_id:
         return jsonify({'success': False, 'error': 'Missing text, language, or article_id.'}), 400
-
-    translated = translate_text(text, target_language)
-
-    # Store translated text in session for later audio playback
-    session.setdefault("translated_texts", {})
-    session["translated_texts"][article_id] = {
-        "text": translated,
-        "language": target_language
-    }
-    session.modified = True  # Mark session as modified
-
-    user_prefs_cache.setdefault("translations", {})
-    user_prefs_cache["translations"][article_id] = {
-        "text": translated,
-        "language": target_language
-    }
-    save_preferences(user_prefs_cache)
+    if target_language != 'en' and target_language not in LANG_TAGS:
+        return jsonify({'success': False, 'error': f"Unsupported target language: {target_language}."}), 400
+
+    pre_translator.record_translate_request(article_id, target_language)
+    model_id = translator_model_id()
+    translated = None
+    if translation_store is not None:
+        translated = translation_store.get(article_id, target_language, model_id, source_text=text)
+    if translated is None:
+        translated = translate_text(text, target_language)
+        # Stored (not kept in the session or preferences file) for later audio playback and repeat requests
+        if (translation_store is not None and target_language != 'en' and is_translation(translated)
+                and translated != text):
+            translation_store.put(article_id, target_language, translator_model_id(), text, translated)
 
     return jsonify({'success': True, 'translated_text': translated})
 
@@ -533,15 +687,19 @@ def api_translate():
 def api_audio():
     data = request.get_json()
     article_id = data.get('article_id')  # Get article_id to retrieve translated text
-    original_text = data.get('text')  # Original text from the button's data-audio-text
+    original_text = data.get('text')  # Text to speak: the button's data-audio-text, or its translation if shown
+    source_text = data.get('original_text') or original_text  # The untranslated text (data-audio-text)
     lang_code = data.get('lang_code', 'en')  # use 'lang_code' to match frontend
 
     text_to_speak = original_text
 
-    # Check if a translated version of this article exists in the session for the current language
-    if article_id and lang_code != 'en' and session.get("translated_texts", {}).get(article_id, {}).get(
-            "language") == lang_code:
-        text_to_speak = session["translated_texts"][article_id]["text"]
+    # Check if a translation of this article's current text exists in the translation store for the language
+    stored_translation = None
+    if article_id and lang_code != 'en' and translation_store is not None and source_text:
+        stored_translation = translation_store.get(article_id, lang_code, translator_model_id(),
+                                                   source_text=source_text)
+    if stored_translation:
+        text_to_speak = stored_translation
         logging.info(f"Using translated text for audio for article {article_id} in {lang_code}.")
     else:
         logging.info(f"Using original text for audio for article {article_id} in {lang_code}.")
@@ -670,10 +828,9 @@ def reading_list():
     except Exception as e:
         logging.warning(f"Failed to sort bookmarked news by date: {e}")
 
-    # Compute stats
-    categories_count = {}
-    sentiments_count = {'Positive': 0, 'Neutral': 0, 'Negative': 0, 'Unknown': 0, 'Error': 0}
-    top_entities_map = {}
+    # Only bookmarks added or removed since the last render are (un)counted
+    bookmark_analytics.sync(bookmarked_news)
+    reading_list_analytics = bookmark_analytics.summary()
 
     for article in bookmarked_news:
         # Ensure 'published' is a datetime object for sorting and display
@@ -692,17 +849,6 @@ def reading_list():
                 logging.warning(f"Could not parse date string in reading list: {article['published']}")
                 article['published'] = None
 
-        category = article.get('category', 'Uncategorized')
-        categories_count[category] = categories_count.get(category, 0) + 1
-
-        sentiment = article.get('sentiment_data', analyze_sentiment(article.get('summary', '')))
-        label = sentiment.get('label', 'Unknown')
-        sentiments_count[label] = sentiments_count.get(label, 0) + 1
-
-        entities = re.findall(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)*\b', article.get('summary', ''))
-        for ent in entities:
-            top_entities_map[ent] = top_entities_map.get(ent, 0) + 1
-
     return render_template(
         'index.html',
         user_name=session['user']['name'] if 'user' in session else 'Guest',
@@ -721,12 +867,12 @@ def reading_list():
         sort_by=app_state['sort_by'],  # Pass sort_by to template
         future_plans=FUTURE_PLANS,
         RSS_FEEDS=RSS_FEEDS,
-        categories_count=categories_count,
-        sentiments_count=sentiments_count,
+        categories_count=reading_list_analytics['categories_count'],
+        sentiments_count=reading_list_analytics['sentiments_count'],
         total_articles=len(bookmarked_news),
         read_articles_count=len(read_ids),
         bookmark_count=len(bookmarked_ids),
-        top_entities=sorted(top_entities_map.items(), key=lambda x: x[1], reverse=True)[:10],
+        top_entities=reading_list_analytics['top_entities'],
         now=datetime.now(),  # Pass datetime.now() to the template
         what_if_model_traits=WHAT_IF_MODEL_TRAITS  # Pass what_if_model_traits
     )
@@ -739,32 +885,11 @@ def analytics():
         flash('Login required.', 'error')
         return redirect(url_for('root'))
 
-    # Fetch news for analytics (can be a larger set than dashboard)
-    news_data = fetch_top_headlines(category="General", country="in", page_size=50)
-    # Pass CATEGORY_KEYWORDS to assign_categories_to_articles
-    news_data = assign_categories_to_articles(news_data, CATEGORY_KEYWORDS)
-
-    categories_count = {}
-    sentiments_count = {'Positive': 0, 'Neutral': 0, 'Negative': 0, 'Unknown': 0,
-                        'Error': 0}  # Added 'Unknown' and 'Error'
-    top_entities_map = {}
-
-    for article in news_data:
-        # Category counting
-        cat = article.get('category', 'Uncategorized')
-        categories_count[cat] = categories_count.get(cat, 0) + 1
-
-        # Sentiment counting
-        sentiment_result = article.get('sentiment_data', analyze_sentiment(article.get('summary', '')))
-        label = sentiment_result.get('label', 'Unknown')
-        sentiments_count[label] = sentiments_count.get(label, 0) + 1
+    # Analytics covers the full ingested snapshot (can be a larger set than dashboard)
+    ensure_scope_snapshot('India News')
+    scope_analytics = ingestion_service.get_analytics('India News')
 
-        # Entity extraction (simple regex for capitalized words/phrases)
-        entities = re.findall(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)*\b', article.get('summary', ''))
-        for ent in entities:
-            top_entities_map[ent] = top_entities_map.get(ent, 0) + 1
-
-    total_articles_count = len(news_data)
+    total_articles_count = scope_analytics['total_articles']
     read_articles_count = len(get_reading_progress())
     bookmark_count = len(user_prefs_cache.get('bookmarked_articles', []))
 
@@ -775,12 +900,12 @@ def analytics():
         backend_url=FLASK_APP_BASE_URL,
         page_title="News Analytics",
         active_tab="analytics",
-        categories_count=categories_count,
-        sentiments_count=sentiments_count,
+        categories_count=scope_analytics['categories_count'],
+        sentiments_count=scope_analytics['sentiments_count'],
         total_articles=total_articles_count,
         read_articles_count=read_articles_count,
         bookmark_count=bookmark_count,
-        top_entities=sorted(top_entities_map.items(), key=lambda x: x[1], reverse=True)[:10],
+        top_entities=scope_analytics['top_entities'],
         news_categories=NEWS_CATEGORIES,
         indian_languages=INDIAN_LANGUAGES,
         selected_category=app_state['selected_category'],
@@ -1067,6 +1192,159 @@ def api_simplify_text():
         return jsonify({"success": False, "error": f"An unexpected error occurred: {e}"}), 500
 
 
+@app.route('/thumb/<key>')
+def thumbnail(key):
+    if not re.fullmatch(r'[0-9a-f]{32}', key):
+        return jsonify({'success': False, 'error': 'Invalid thumbnail key.'}), 404
+
+    if thumbnail_service.is_ready(key):
+        response = send_file(thumbnail_service.path_for(key), mimetype=THUMB_MIMETYPE, max_age=THUMB_CACHE_MAX_AGE)
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+    # Not built yet: queue the resize and let this one view use the original image
+    source_url = thumbnail_service.source_url(key)
+    if source_url is None:
+        return jsonify({'success': False, 'error': 'Unknown thumbnail.'}), 404
+    thumbnail_service.schedule(key)
+    response = redirect(source_url)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@app.route('/admin/ingest', methods=['GET', 'POST'])
+def admin_ingest():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+
+    # POST asks the background scheduler to refresh every scope now
+    if request.method == 'POST':
+        ingestion_service.trigger_refresh()
+
+    return jsonify({'success': True, 'ingestion': ingestion_service.status()})
+
+
+@app.route('/admin/http_pool')
+def admin_http_pool():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'http_pool': get_pool_stats()})
+
+
+@app.route('/admin/feed_health')
+def admin_feed_health():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'feeds': feed_health.snapshot()})
+
+
+@app.route('/admin/cache_stats')
+def admin_cache_stats():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'caches': cache_stats()})
+
+
+@app.route('/admin/thumbnails')
+def admin_thumbnails():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'thumbnails': thumbnail_service.stats()})
+
+
+@app.route('/admin/translation_store')
+def admin_translation_store():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    if translation_store is None:
+        return jsonify({'success': True, 'translation_store': None})
+    return jsonify({'success': True, 'translation_store': translation_store.stats()})
+
+
+@app.route('/api/search')
+def api_search():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'success': False, 'error': 'Missing query parameter q.'}), 400
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 100))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit must be an integer.'}), 400
+    category = request.args.get('category') or None
+    prefix = request.args.get('prefix', '1') != '0'
+
+    start = time.perf_counter()
+    hits = search_index.search(query, limit=limit, prefix=prefix, category=category)
+    took_ms = round((time.perf_counter() - start) * 1000, 2)
+    results = [{
+        'id': article.get('id'),
+        'title': article.get('title'),
+        'summary': article.get('summary'),
+        'url': article.get('url'),
+        'source': article.get('source'),
+        'published': article.get('published'),
+        'category': article.get('category'),
+        'image_url': article.get('image_url'),
+        'score': round(score, 4),
+    } for article, score in hits]
+    return jsonify({'success': True, 'query': query, 'results': results, 'took_ms': took_ms,
+                    'indexed_articles': len(search_index)})
+
+
+@app.route('/admin/search_index')
+def admin_search_index():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'search_index': search_index.stats()})
+
+
+@app.route('/admin/presummarizer')
+def admin_presummarizer():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'enabled': PRESUMMARIZE_ENABLED, 'presummarizer': pre_summarizer.stats()})
+
+
+@app.route('/admin/pretranslator')
+def admin_pretranslator():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    return jsonify({'success': True, 'enabled': PRETRANSLATE_ENABLED, 'pretranslator': pre_translator.stats()})
+
+
+@app.route('/healthz')
+def healthz():
+    # Liveness: the process is up and serving, whether or not the models are loaded yet
+    return jsonify({'status': 'ok'})
+
+
+@app.route('/readyz')
+def readyz():
+    # Readiness: a load balancer should only route traffic here once the required models are in memory
+    ready = models_ready(READINESS_REQUIRED_MODELS)
+    return jsonify({'ready': ready, 'required': list(READINESS_REQUIRED_MODELS),
+                    'models': models_status()}), (200 if ready else 503)
+
+
+@app.route('/admin/warmup', methods=['POST'])
+def admin_warmup():
+    app_state = get_app_state()
+    if not app_state['logged_in']:
+        return jsonify({'success': False, 'error': 'Login required.'}), 401
+    started = start_warm_up()
+    return jsonify({'success': True, 'started': started, 'models': models_status()})
+
+
 if __name__ == '__main__':
     os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 
@@ -1077,31 +1355,13 @@ if __name__ == '__main__':
     # TEMPORARY: Run analytics test once at startup (Optional, for dev only)
     try:
         print("Running startup analytics test...")
-        news_data_test = fetch_top_headlines(category="General", country="in", page_size=10)
-        news_data_test = assign_categories_to_articles(news_data_test, CATEGORY_KEYWORDS)  # Pass CATEGORY_KEYWORDS
-
-        categories_count_test = {}
-        # Initialize sentiments_count_test with 'Unknown' and 'Error' keys
-        sentiments_count_test = {'Positive': 0, 'Neutral': 0, 'Negative': 0, 'Unknown': 0, 'Error': 0}
-        top_entities_map_test = {}
-
-        for article in news_data_test:
-            category = article.get('category', 'Uncategorized')
-            categories_count_test[category] = categories_count_test.get(category, 0) + 1
-
-            sentiment_result = analyze_sentiment(article.get('summary', ''))
-            # Access label safely, defaulting to 'Unknown' if not present
-            label = sentiment_result.get('label', 'Unknown')
-            sentiments_count_test[label] = sentiments_count_test.get(label, 0) + 1
-
-            entities = re.findall(r'\b[A-Z][a-z]+\s(?:[A-Z][a-z]+)?\b', article.get('summary', ''))
-            for ent in entities:
-                top_entities_map_test[ent] = top_entities_map_test.get(ent, 0) + 1
+        ingestion_service.refresh_now('India News')
+        analytics_test = ingestion_service.get_analytics('India News', top_k=5)
 
         print("[✓] Analytics Test Complete")
-        print(f"Categories: {categories_count_test}")
-        print(f"Sentiments: {sentiments_count_test}")
-        print(f"Top Entities: {sorted(top_entities_map_test.items(), key=lambda x: x[1], reverse=True)[:5]}")
+        print(f"Categories: {analytics_test['categories_count']}")
+        print(f"Sentiments: {analytics_test['sentiments_count']}")
+        print(f"Top Entities: {analytics_test['top_entities']}")
     except Exception as e:
         print(f"[x] Analytics test failed: {e}")
         logging.error(f"Startup analytics test failed: {e}", exc_info=True)